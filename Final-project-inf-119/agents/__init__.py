@@ -1,14 +1,24 @@
 # Agents module initialization
+from .backends import ModelBackend, GeminiBackend, FakeBackend
 from .tracking_agent import TrackingAgent
 from .parser_agent import ParserAgent
 from .design_agent import DesignAgent
 from .code_gen_agent import CodeGenAgent
 from .test_agent import TestAgent
+from .validation_agent import ValidationAgent
+from .pipeline import build_factory_pipeline
+from .handlers import register_factory_handlers
 
 __all__ = [
+    'ModelBackend',
+    'GeminiBackend',
+    'FakeBackend',
     'TrackingAgent',
     'ParserAgent',
     'DesignAgent',
     'CodeGenAgent',
-    'TestAgent'
+    'TestAgent',
+    'ValidationAgent',
+    'build_factory_pipeline',
+    'register_factory_handlers'
 ]
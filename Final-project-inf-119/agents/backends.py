@@ -0,0 +1,222 @@
+# Model Backends - Pluggable LLM implementations used by the TrackingAgent
+# Author: [Your Name] - [Student ID]
+
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Union
+from config.api_config import GOOGLE_API_KEY, MODEL_NAME, MODEL_BACKEND, warn_if_api_key_missing
+from agents.fake_responses import response_for
+
+class ModelResponse:
+    """Text and token usage returned by a backend"""
+
+    def __init__(self, text: str, prompt_tokens: int, output_tokens: int):
+        """
+        Initialize a model response
+
+        Args:
+            text: Generated text
+            prompt_tokens: Tokens consumed by the prompt
+            output_tokens: Tokens produced in the response
+        """
+        self.text = text
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus output tokens"""
+        return self.prompt_tokens + self.output_tokens
+
+class ModelBackend(ABC):
+    """
+    Interface for a text generation backend
+    Implementations must be safe to call from several threads at once.
+    """
+
+    model_name: str
+
+    @abstractmethod
+    def generate(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> ModelResponse:
+        """
+        Generate a response
+
+        Args:
+            prompt: Prompt for the model
+            on_chunk: Optional callback; when given the response is streamed
+                and each text chunk is passed to it as it arrives
+            **kwargs: Backend-specific generation arguments
+
+        Returns:
+            ModelResponse with the full text and token usage
+        """
+
+class GeminiBackend(ModelBackend):
+    """
+    Google Gemini via google.generativeai
+    The SDK is imported and the client configured on first use, so creating
+    agents does not pay for it.
+    """
+
+    def __init__(self, model_name: str = MODEL_NAME, api_key: str = GOOGLE_API_KEY):
+        """
+        Initialize the Gemini backend
+
+        Args:
+            model_name: Gemini model to use
+            api_key: Google API key
+        """
+        self.model_name = model_name
+        self.api_key = api_key
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The google.generativeai GenerativeModel, created on first access"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    import google.generativeai as genai
+
+                    warn_if_api_key_missing()
+                    genai.configure(api_key=self.api_key)
+                    self._model = genai.GenerativeModel(model_name=self.model_name)
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+
+    def generate(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> ModelResponse:
+        """Generate a response with Gemini (see ModelBackend.generate)"""
+        if on_chunk:
+            response, text = self._stream(prompt, on_chunk, **kwargs)
+        else:
+            response = self.model.generate_content(prompt, **kwargs)
+            text = response.text
+
+        # Extract token usage from response metadata
+        # Note: Gemini API provides usage metadata
+        if hasattr(response, 'usage_metadata'):
+            return ModelResponse(
+                text,
+                response.usage_metadata.prompt_token_count,
+                response.usage_metadata.candidates_token_count,
+            )
+
+        # Estimate tokens if not available (rough estimate: 1 token ≈ 4 chars)
+        return ModelResponse(text, len(prompt) // 4, len(text) // 4)
+
+    def _stream(self, prompt: str, on_chunk: Callable[[str], None], **kwargs):
+        """
+        Stream a response, forwarding chunks as they arrive
+
+        Returns:
+            Tuple of (response, full text); usage metadata on the response
+            covers the whole stream once it has been consumed
+        """
+        response = self.model.generate_content(prompt, stream=True, **kwargs)
+        parts = []
+        for chunk in response:
+            try:
+                chunk_text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. finish metadata only)
+                continue
+            if chunk_text:
+                parts.append(chunk_text)
+                on_chunk(chunk_text)
+        return response, "".join(parts)
+
+class FakeBackendError(ConnectionError):
+    """Simulated transient failure raised by FakeBackend (retryable)"""
+
+# A latency setting is a fixed number of seconds or a sampler taking an RNG
+LatencySpec = Union[float, Callable[[random.Random], float]]
+
+def uniform_latency(low: float, high: float) -> Callable[[random.Random], float]:
+    """Latency drawn uniformly from [low, high] seconds"""
+    return lambda rng: rng.uniform(low, high)
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Long-tailed latency with the given median (seconds) and log-space sigma"""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+class FakeBackend(ModelBackend):
+    """
+    Deterministic offline stand-in for a real model
+    Returns canned, valid outputs for each agent prompt with configurable
+    latency, token counts and error rate, so the pipeline can be load-tested
+    and profiled without network access or an API key.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake-model",
+        latency: LatencySpec = 0.0,
+        error_rate: float = 0.0,
+        output_tokens: Optional[int] = None,
+        chunk_size: int = 256,
+        seed: int = 0,
+    ):
+        """
+        Initialize the fake backend
+
+        Args:
+            model_name: Name reported in usage statistics
+            latency: Seconds per call, or a sampler such as lognormal_latency()
+            error_rate: Probability (0-1) that a call raises FakeBackendError
+            output_tokens: Fixed output token count (default: len(text) // 4)
+            chunk_size: Characters per chunk in streaming mode
+            seed: Seed for latency and error sampling
+        """
+        self.model_name = model_name
+        self.latency = latency
+        self.error_rate = error_rate
+        self.output_tokens = output_tokens
+        self.chunk_size = chunk_size
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def generate(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> ModelResponse:
+        """Return a canned response after a simulated delay (see ModelBackend.generate)"""
+        with self._rng_lock:
+            delay = self.latency(self._rng) if callable(self.latency) else self.latency
+            fail = self._rng.random() < self.error_rate
+
+        text = response_for(prompt)
+
+        if on_chunk:
+            chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)] or [""]
+            for chunk in chunks:
+                time.sleep(max(0.0, delay) / len(chunks))
+                if fail:
+                    raise FakeBackendError("Simulated backend failure")
+                on_chunk(chunk)
+        else:
+            time.sleep(max(0.0, delay))
+            if fail:
+                raise FakeBackendError("Simulated backend failure")
+
+        output_tokens = self.output_tokens if self.output_tokens is not None else len(text) // 4
+        return ModelResponse(text, len(prompt) // 4, output_tokens)
+
+def create_backend(name: str = MODEL_BACKEND) -> ModelBackend:
+    """
+    Create a backend by name
+
+    Args:
+        name: "gemini" or "fake"
+
+    Returns:
+        ModelBackend instance
+    """
+    if name == "gemini":
+        return GeminiBackend()
+    if name == "fake":
+        return FakeBackend()
+    raise ValueError(f"Unknown model backend: {name}")
@@ -0,0 +1,243 @@
+# Batch Generation - Runs the factory pipeline for many requirement texts
+# Author: [Your Name] - [Student ID]
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from agents.backends import ModelBackend, create_backend
+from agents.tracking_agent import TrackingAgent
+from agents.parser_agent import ParserAgent
+from agents.design_agent import DesignAgent
+from agents.code_gen_agent import CodeGenAgent
+from agents.test_agent import TestAgent
+from agents.validation_agent import ValidationAgent
+from agents.pipeline import build_factory_pipeline
+from config.api_config import BATCH_OUTPUT_DIR, BATCH_WORKERS, LLM_MAX_CONCURRENCY, USAGE_REPORT_FILE
+from utils.helpers import save_json, summarize_latencies
+from utils.rate_limiter import RateLimiter, get_shared_rate_limiter
+from utils.response_cache import ResponseCache
+
+# Requirement files picked up from a batch directory
+REQUIREMENT_EXTENSIONS = (".txt", ".md")
+
+def load_batch_items(path: str) -> List[Tuple[str, str]]:
+    """
+    Read requirement texts for a batch
+
+    A directory yields one item per .txt/.md file (named after the file).
+    A JSONL file yields one item per line: either a JSON string or an
+    object with "requirements" (or "text") and an optional "id".
+
+    Args:
+        path: Directory or JSONL file
+
+    Returns:
+        List of (item_id, requirements) in a stable order
+    """
+    items: List[Tuple[str, str]] = []
+
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in REQUIREMENT_EXTENSIONS:
+                with open(os.path.join(path, name), "r", encoding="utf-8") as f:
+                    items.append((stem, f.read().strip()))
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if isinstance(entry, str):
+                    entry = {"requirements": entry}
+                text = entry.get("requirements") or entry.get("text")
+                if not text:
+                    raise ValueError(f"{path}:{line_number}: missing 'requirements'")
+                items.append((str(entry.get("id") or f"item-{line_number:04d}"), text))
+
+    # Item IDs become directory names
+    seen = set()
+    unique = []
+    for item_id, text in items:
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", item_id).strip("._") or "item"
+        candidate, n = safe, 1
+        while candidate in seen:
+            n += 1
+            candidate = f"{safe}-{n}"
+        seen.add(candidate)
+        unique.append((candidate, text))
+    return unique
+
+class BatchRunner:
+    """
+    Generates an application per requirement text on a worker pool
+    Every item gets its own agents and output directory, while the model
+    backend, rate limiter, response cache and a global cap on in-flight LLM
+    calls are shared across the whole batch. Conjugation tables are built
+    in the background one at a time and collected before the summary.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = BATCH_OUTPUT_DIR,
+        workers: int = BATCH_WORKERS,
+        max_llm_concurrency: int = LLM_MAX_CONCURRENCY,
+        backend: Optional[ModelBackend] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        validate: bool = False,
+    ):
+        """
+        Initialize the batch runner
+
+        Args:
+            output_dir: Root directory; each item writes to output_dir/<item_id>
+            workers: Items generated at once
+            max_llm_concurrency: Model calls in flight at once across all items
+            backend: Model backend shared by all items (default from config)
+            rate_limiter: Quota shared by all items (default: process-wide)
+            cache: Optional response cache shared by all items
+            validate: Also run each item's generated tests
+        """
+        self.output_dir = output_dir
+        self.workers = workers
+        self.max_llm_concurrency = max_llm_concurrency
+        self.backend = backend or create_backend()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.cache = cache
+        self.validate = validate
+        self._call_slots = threading.BoundedSemaphore(max_llm_concurrency)
+        self._table_builds: Dict[str, Future] = {}
+        self._table_builds_lock = threading.Lock()
+
+    def run(self, items: List[Tuple[str, str]],
+            on_item: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Generate every item and write batch_summary.json
+
+        Args:
+            items: (item_id, requirements) pairs, e.g. from load_batch_items
+            on_item: Optional callback receiving each item's result as it finishes
+
+        Returns:
+            Summary with throughput, failures and token usage
+        """
+        results: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.run_item, item_id, text) for item_id, text in items]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_item:
+                    on_item(result)
+
+        # Tables finish after their items; the batch ends when they are written
+        for result in results:
+            with self._table_builds_lock:
+                build = self._table_builds.pop(result["id"], None)
+            if build is not None:
+                table = build.result()
+                result["conjugationTable"] = {key: table[key] for key in ("status", "seconds", "error")}
+
+        elapsed = time.perf_counter() - started
+        order = {item_id: i for i, (item_id, _) in enumerate(items)}
+        results.sort(key=lambda result: order[result["id"]])
+
+        summary = self._summarize(results, elapsed)
+        save_json(summary, os.path.join(self.output_dir, "batch_summary.json"))
+        return summary
+
+    def run_item(self, item_id: str, requirements: str) -> Dict[str, Any]:
+        """
+        Run the full pipeline for one item
+
+        Args:
+            item_id: Item name (also its output subdirectory)
+            requirements: Requirement text
+
+        Returns:
+            Result with status, seconds, token usage and output paths or error
+        """
+        item_dir = os.path.join(self.output_dir, item_id)
+        tracking_agent = TrackingAgent(
+            cache=self.cache,
+            rate_limiter=self.rate_limiter,
+            backend=self.backend,
+            call_slots=self._call_slots,
+        )
+        conjugator_dir = os.path.join(item_dir, "conjugator")
+        tests_dir = os.path.join(item_dir, "tests")
+        pipeline = build_factory_pipeline(
+            ParserAgent(tracking_agent),
+            DesignAgent(tracking_agent),
+            CodeGenAgent(tracking_agent, output_dir=conjugator_dir),
+            TestAgent(tracking_agent, output_dir=tests_dir),
+            validation_agent=ValidationAgent(tracking_agent, conjugator_dir=conjugator_dir, tests_dir=tests_dir)
+            if self.validate else None,
+        )
+
+        result: Dict[str, Any] = {"id": item_id, "outputDir": item_dir}
+        started = time.perf_counter()
+        try:
+            values = pipeline.run({"requirements": requirements})
+            result["status"] = "ok"
+            result["files"] = [code.filename for code in values["generated_code"]]
+            with self._table_builds_lock:
+                self._table_builds[item_id] = values["conjugation_table"]
+            if "validation" in values:
+                validation = values["validation"]
+                result["validation"] = {key: validation[key] for key in ("status", "total", "passed", "passRate")}
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = round(time.perf_counter() - started, 3)
+
+        report = tracking_agent.get_usage_report()
+        tracking_agent.save_usage_report(os.path.join(item_dir, USAGE_REPORT_FILE))
+        result["totalTokens"] = report["total_tokens"]
+        result["numApiCalls"] = sum(usage["numApiCalls"] for usage in report["usage"].values())
+        return result
+
+    def _summarize(self, results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        """Aggregate item results into the batch summary"""
+        succeeded = [r for r in results if r["status"] == "ok"]
+        failed = [r for r in results if r["status"] != "ok"]
+        return {
+            "items": len(results),
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "wallSeconds": round(elapsed, 3),
+            "itemsPerMinute": round(len(results) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "itemSeconds": summarize_latencies([r["seconds"] for r in results]),
+            "totalTokens": sum(r["totalTokens"] for r in results),
+            "numApiCalls": sum(r["numApiCalls"] for r in results),
+            "workers": self.workers,
+            "maxLlmConcurrency": self.max_llm_concurrency,
+            "conjugationTables": self._table_statuses(results),
+            "validationPassRate": self._validation_pass_rate(results),
+            "failures": [{"id": r["id"], "error": r["error"]} for r in failed],
+            "results": results,
+        }
+
+    def _table_statuses(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Number of items per conjugation table build status"""
+        counts: Dict[str, int] = {}
+        for result in results:
+            if "conjugationTable" in result:
+                status = result["conjugationTable"]["status"]
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def _validation_pass_rate(self, results: List[Dict[str, Any]]) -> Optional[float]:
+        """Share of generated tests that passed across validated items (None without validation)"""
+        validated = [r["validation"] for r in results if "validation" in r]
+        total = sum(v["total"] for v in validated)
+        if not total:
+            return None
+        return round(sum(v["passed"] for v in validated) / total, 3)
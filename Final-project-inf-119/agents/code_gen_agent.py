@@ -1,29 +1,64 @@
 # Code Generation Agent - Generates the conjugator application code
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, List
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, List
 from mcp import MCPClient, AgentRole, RequirementSpec, DesignSpec, GeneratedCode
 from agents.tracking_agent import TrackingAgent
+from agents.code_templates import render_conjugator, render_ui
 from utils.helpers import clean_code_block, save_to_file
-from config.api_config import CONJUGATOR_DIR
+from config.api_config import (
+    CONJUGATOR_DIR, CONJUGATION_CACHE_SIZE, FAST_PATH_ENABLED,
+    CONJUGATION_TABLE_ENABLED, CONJUGATION_TABLE_FILE, CONJUGATION_TABLE_TIMEOUT,
+)
+
+# Conjugation tables are built in the background, one at a time per process:
+# each build already runs a worker process per language, so concurrent
+# pipelines (the batch mode) queue here instead of oversubscribing the CPU
+_TABLE_BUILDS = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conjugation-table")
 
 class CodeGenAgent:
     """
     Agent responsible for generating the verb conjugator application code
     """
     
-    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None):
-        """Initialize code generation agent"""
+    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None,
+                 output_dir: str = CONJUGATOR_DIR, use_templates: bool = FAST_PATH_ENABLED):
+        """
+        Initialize code generation agent
+        
+        Args:
+            tracking_agent: Tracking agent for LLM calls
+            mcp_client: MCP client for communication
+            output_dir: Directory the generated application is written to
+            use_templates: Render verb_conjugator.py from a template when the
+                spec allows it and only call the LLM for the rest
+        """
         self.tracking_agent = tracking_agent
         self.mcp_client = mcp_client
+        self.output_dir = output_dir
+        self.use_templates = use_templates
     
-    def generate_code(self, spec: RequirementSpec, design: DesignSpec) -> List[GeneratedCode]:
+    def generate_code(self, spec: RequirementSpec, design: DesignSpec,
+                      on_chunk: Optional[Callable[[str, str], None]] = None) -> List[GeneratedCode]:
         """
         Generate application code based on requirements and design
         
+        The conjugator module and the UI do not depend on each other, so
+        both LLM calls are issued concurrently.
+        
         Args:
             spec: Requirement specification
             design: Design specification
+            on_chunk: Optional callback receiving (filename, text chunk) as
+                each file's response streams in
             
         Returns:
             List of GeneratedCode objects
@@ -31,19 +66,42 @@ class CodeGenAgent:
         if self.mcp_client:
             self.mcp_client.notify({"event": "code_generation_started"})
         
-        generated_files = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Generate main conjugator module and Gradio UI side by side
+            conjugator_future = pool.submit(self._generate_conjugator, spec, design, on_chunk)
+            ui_future = pool.submit(self._generate_ui, spec, on_chunk)
+            generated_files = [conjugator_future.result(), ui_future.result()]
+        
+        return self._save_generated(generated_files)
+    
+    async def agenerate_code(self, spec: RequirementSpec, design: DesignSpec,
+                             on_chunk: Optional[Callable[[str, str], None]] = None) -> List[GeneratedCode]:
+        """
+        Async version of generate_code
         
-        # Generate main conjugator module
-        conjugator_code = self._generate_conjugator(spec, design)
-        generated_files.append(conjugator_code)
+        Args:
+            spec: Requirement specification
+            design: Design specification
+            on_chunk: Optional callback receiving (filename, text chunk)
+            
+        Returns:
+            List of GeneratedCode objects
+        """
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "code_generation_started"})
         
-        # Generate Gradio UI
-        ui_code = self._generate_ui(spec)
-        generated_files.append(ui_code)
+        generated_files = list(await asyncio.gather(
+            self._agenerate_conjugator(spec, design, on_chunk),
+            self._agenerate_ui(spec, on_chunk),
+        ))
         
+        return self._save_generated(generated_files)
+    
+    def _save_generated(self, generated_files: List[GeneratedCode]) -> List[GeneratedCode]:
+        """Write generated files to disk and notify completion"""
         # Save generated files
         for gen_code in generated_files:
-            filepath = f"{CONJUGATOR_DIR}/{gen_code.filename}"
+            filepath = f"{self.output_dir}/{gen_code.filename}"
             save_to_file(gen_code.code, filepath)
         
         if self.mcp_client:
@@ -53,9 +111,157 @@ class CodeGenAgent:
             })
         
         return generated_files
-    def _generate_conjugator(self, spec: RequirementSpec, design: DesignSpec) -> GeneratedCode:
+    
+    def start_conjugation_table(self, generated_code: List[GeneratedCode]) -> "Future[Dict[str, Any]]":
+        """
+        Queue build_conjugation_table in the background and return at once
+        
+        The generated app reads the table only when it exists (it is
+        written atomically), so nothing needs to wait for the build.
+        
+        Args:
+            generated_code: Files returned by generate_code
+            
+        Returns:
+            Future resolving to the build_conjugation_table result
+        """
+        return _TABLE_BUILDS.submit(self.build_conjugation_table, generated_code)
+    
+    def build_conjugation_table(self, generated_code: List[GeneratedCode]) -> Dict[str, Any]:
+        """
+        Precompute the generated app's conjugation table
+        
+        Runs "python verb_conjugator.py --build-table" on a snapshot of the
+        generated module in a private directory, which conjugates the most
+        common verbs of every language in parallel worker processes, then
+        moves CONJUGATION_TABLE_FILE next to the module in the output
+        directory. The table is only installed if the module there is still
+        the one it was built for: the UI regenerates into the same directory
+        and a later generation queues its own build. The app works without
+        the table (it falls back to mlconjug3), so a failed build is
+        reported rather than raised.
+        
+        Args:
+            generated_code: Files returned by generate_code
+            
+        Returns:
+            Dictionary with status ("built", "skipped" or "failed"), path,
+            rows per language code, seconds and error
+        """
+        path = os.path.join(self.output_dir, CONJUGATION_TABLE_FILE)
+        result: Dict[str, Any] = {"status": "skipped", "path": path, "rows": {}, "seconds": 0.0, "error": None}
+        
+        conjugator = next((gc for gc in generated_code if gc.filename == "verb_conjugator.py"), None)
+        if not CONJUGATION_TABLE_ENABLED or conjugator is None or "def build_table" not in conjugator.code:
+            # Only the template-rendered module knows how to build a table
+            return result
+        
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "table_build_started", "path": path})
+        
+        started = time.perf_counter()
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            # Same filesystem as the output directory, so the final move is atomic
+            with tempfile.TemporaryDirectory(prefix=".table-build-", dir=self.output_dir) as scratch:
+                save_to_file(conjugator.code, os.path.join(scratch, "verb_conjugator.py"))
+                completed = subprocess.run(
+                    [sys.executable, "verb_conjugator.py", "--build-table"],
+                    cwd=scratch, capture_output=True, text=True,
+                    timeout=CONJUGATION_TABLE_TIMEOUT,
+                )
+                if completed.returncode != 0:
+                    result["status"] = "failed"
+                    lines = completed.stderr.strip().splitlines()
+                    result["error"] = lines[-1] if lines else f"exit code {completed.returncode}"
+                elif self._saved_conjugator() != conjugator.code:
+                    result["error"] = "verb_conjugator.py was regenerated during the build"
+                else:
+                    rows = json.loads(completed.stdout.strip().splitlines()[-1])["rows"]
+                    os.replace(os.path.join(scratch, CONJUGATION_TABLE_FILE), path)
+                    result["status"] = "built"
+                    result["rows"] = rows
+        except (subprocess.TimeoutExpired, OSError, ValueError, KeyError, IndexError) as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "table_build_completed", **result})
+        
+        return result
+    
+    def _saved_conjugator(self) -> Optional[str]:
+        """Current verb_conjugator.py in the output directory (None if missing)"""
+        try:
+            with open(os.path.join(self.output_dir, "verb_conjugator.py"), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _stream_to(self, filename: str, on_chunk: Optional[Callable[[str, str], None]]):
+        """Adapt a (filename, chunk) callback to TrackingAgent's chunk callback"""
+        if on_chunk is None:
+            return None
+        return lambda chunk: on_chunk(filename, chunk)
+    
+    def _generate_conjugator(self, spec: RequirementSpec, design: DesignSpec,
+                             on_chunk: Optional[Callable[[str, str], None]] = None) -> GeneratedCode:
         """Generate the main conjugator module"""
-        prompt = """You are writing the ONLY implementation of verb_conjugator.py.
+        code = self._render_conjugator(spec, on_chunk)
+        if code is not None:
+            return self._conjugator_result(code)
+        
+        code = self.tracking_agent.generate_content(
+            self._conjugator_prompt(spec, design),
+            on_chunk=self._stream_to("verb_conjugator.py", on_chunk),
+            agent=AgentRole.CODE_GEN.value
+        )
+        return self._conjugator_result(code)
+    
+    async def _agenerate_conjugator(self, spec: RequirementSpec, design: DesignSpec,
+                                    on_chunk: Optional[Callable[[str, str], None]] = None) -> GeneratedCode:
+        """Async version of _generate_conjugator"""
+        code = self._render_conjugator(spec, on_chunk)
+        if code is not None:
+            return self._conjugator_result(code)
+        
+        code = await self.tracking_agent.agenerate_content(
+            self._conjugator_prompt(spec, design),
+            on_chunk=self._stream_to("verb_conjugator.py", on_chunk),
+            agent=AgentRole.CODE_GEN.value
+        )
+        return self._conjugator_result(code)
+    
+    def _render_conjugator(self, spec: RequirementSpec,
+                           on_chunk: Optional[Callable[[str, str], None]] = None) -> Optional[str]:
+        """Render verb_conjugator.py from the template; None means the LLM is needed"""
+        return self._render(render_conjugator, spec, "verb_conjugator.py", AgentRole.CODE_GEN, on_chunk)
+    
+    def _render_ui(self, spec: RequirementSpec,
+                   on_chunk: Optional[Callable[[str, str], None]] = None) -> Optional[str]:
+        """Render gradio_ui.py from the template; None means the LLM is needed"""
+        return self._render(render_ui, spec, "gradio_ui.py", AgentRole.UI_GEN, on_chunk)
+    
+    def _render(self, render: Callable[[RequirementSpec], Optional[str]], spec: RequirementSpec,
+                filename: str, role: AgentRole,
+                on_chunk: Optional[Callable[[str, str], None]] = None) -> Optional[str]:
+        """Render a file from its template and record the fast-path hit or miss"""
+        if not self.use_templates:
+            return None
+        
+        started = time.perf_counter()
+        code = render(spec)
+        elapsed = time.perf_counter() - started
+        self.tracking_agent.record_fast_path(role.value, code is not None, elapsed)
+        
+        if code is not None and on_chunk:
+            on_chunk(filename, code)
+        return code
+    
+    def _conjugator_prompt(self, spec: RequirementSpec, design: DesignSpec) -> str:
+        """Build the prompt for verb_conjugator.py"""
+        return """You are writing the ONLY implementation of verb_conjugator.py.
 
 Your output must be valid Python that defines:
 
@@ -217,19 +423,56 @@ raise EXACTLY:
     ConjugationError("Verb 'nonexistentverb' not found or unsupported for English in present tense.")
 
 
+CACHING (REQUIRED)
+
+Loading an mlconjug3 model is by far the most expensive step, so:
+
+- Keep ONE Conjugator per language in a module-level dict, created lazily
+  on first use behind a threading.Lock:
+
+       conj = get_conjugator(<normalized>)   # never Conjugator(...) per call
+
+- Build a module-level table at import time mapping
+  (language code, tense) -> (mood, tuple of candidate tense keys), and
+  remember which candidate key matched the first time so later calls
+  look it up directly.
+- Memoize the lookup for (language code, lower-cased verb, tense) with
+  functools.lru_cache(maxsize=CACHE_SIZE) where CACHE_SIZE = {cache_size}.
+  The memoized function must return immutable data (tuples); build a
+  fresh dict for each caller, and raise errors using the caller's original
+  language/verb/tense strings.
+- Provide clear_cache() that clears the memo.
+
+
+BATCH API (REQUIRED)
+
+Also define:
+
+    def conjugate_many(language, verbs, tenses, processes=None)
+
+- language is one language for every verb, or a list with one per verb
+  (raise ValueError if the lengths differ); tenses is a string or a list
+  applied to every verb.
+- Validate and normalize each request exactly like conjugate_verb, but
+  conjugate each distinct (language code, verb, tense) only once.
+- Return one dict per verb, in input order, mapping each tense to the
+  pronoun -> form dict, or to the ConjugationError instance for that
+  lookup (do not raise for individual failures).
+- When processes > 1 and there are many distinct lookups, the work may be
+  split across a concurrent.futures.ProcessPoolExecutor, one language per
+  chunk.
+
+
 CONJUGATION PROCESS
 
 1. Validate inputs.
 2. Normalize language.
 3. Normalize tense.
-4. Create the conjugator:
-
-       conj = mlconjug3.Conjugator(language=<normalized>)
-
+4. Get the cached conjugator for the language (see CACHING).
 5. Call verb_obj = conj.conjugate(verb).
 6. Extract info = verb_obj.conjug_info.
 7. Look up the correct mood.
-8. Try each candidate tense until one matches.
+8. Use the resolved tense key, or try each candidate until one matches.
 9. Retrieve its pronoun→form dictionary.
 10. For each required pronoun:
         - look up the mapped mlconjug key
@@ -239,9 +482,10 @@ CONJUGATION PROCESS
 
 Return ONLY the Python source code for verb_conjugator.py, nothing else.
 
-"""
+""".replace("{cache_size}", str(CONJUGATION_CACHE_SIZE))
 
-        code = self.tracking_agent.generate_content(prompt)
+    def _conjugator_result(self, code: str) -> GeneratedCode:
+        """Wrap the LLM output for verb_conjugator.py"""
         code = clean_code_block(code)
 
         return GeneratedCode(
@@ -252,10 +496,37 @@ Return ONLY the Python source code for verb_conjugator.py, nothing else.
         )
 
 
-    def _generate_ui(self, spec: RequirementSpec) -> GeneratedCode:
+    def _generate_ui(self, spec: RequirementSpec,
+                     on_chunk: Optional[Callable[[str, str], None]] = None) -> GeneratedCode:
         """Generate Gradio UI code"""
+        code = self._render_ui(spec, on_chunk)
+        if code is not None:
+            return self._ui_result(code)
+
+        code = self.tracking_agent.generate_content(
+            self._ui_prompt(spec),
+            on_chunk=self._stream_to("gradio_ui.py", on_chunk),
+            agent=AgentRole.UI_GEN.value
+        )
+        return self._ui_result(code)
+
+    async def _agenerate_ui(self, spec: RequirementSpec,
+                            on_chunk: Optional[Callable[[str, str], None]] = None) -> GeneratedCode:
+        """Async version of _generate_ui"""
+        code = self._render_ui(spec, on_chunk)
+        if code is not None:
+            return self._ui_result(code)
+
+        code = await self.tracking_agent.agenerate_content(
+            self._ui_prompt(spec),
+            on_chunk=self._stream_to("gradio_ui.py", on_chunk),
+            agent=AgentRole.UI_GEN.value
+        )
+        return self._ui_result(code)
 
-        prompt = f"""
+    def _ui_prompt(self, spec: RequirementSpec) -> str:
+        """Build the prompt for gradio_ui.py"""
+        return f"""
 Generate a complete Gradio UI in a file named gradio_ui.py for the verb conjugator.
 
 The UI must:
@@ -288,23 +559,36 @@ The UI must:
    - Inputs and button grouped together.
    - An output area (Textbox or Markdown) to show the result.
 
-6. Launching:
+6. Startup and warm-up:
+   - Loading the conjugation models is slow, so preload them on a
+     background daemon thread at startup: call verb_conjugator.preload(languages)
+     if the module has it, otherwise conjugate one common verb per language.
+   - Show a readiness indicator (gr.Markdown) that reads
+     "⏳ Loading conjugation models..." until the preload finishes and then
+     "✅ Ready"; update it from a generator passed to demo.load.
+   - Use the logging module to log cold start (seconds from process start
+     until the preload finished) and the latency of the first request.
+
+7. Launching:
    - Wrap the interface in a function or variable named demo.
    - Protect the launch with:
          if __name__ == "__main__":
+             start the preload thread
              demo.launch()
    - Do not launch automatically on import.
 
 Other constraints:
 
-- Use only top level imports: "import gradio as gr" and
+- Use only top level imports: the standard library (logging, threading,
+  time), "import gradio as gr", "import verb_conjugator" and
   "from verb_conjugator import conjugate_verb, ConjugationError".
 - Do not include any placeholder code or comments that conflict with the API above.
 
 Return ONLY the Python code for gradio_ui.py, nothing else.
 """
 
-        code = self.tracking_agent.generate_content(prompt)
+    def _ui_result(self, code: str) -> GeneratedCode:
+        """Wrap the LLM output for gradio_ui.py"""
         code = clean_code_block(code)
 
         return GeneratedCode(
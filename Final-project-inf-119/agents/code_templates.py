@@ -0,0 +1,736 @@
+# Code Templates - Renders the generated app locally from a RequirementSpec
+# Author: [Your Name] - [Student ID]
+#
+# The conjugator module and its Gradio UI are fully determined by the
+# languages and tenses in the spec, so for the combinations below they are
+# rendered from templates instead of generated by the LLM. Specs a template
+# cannot express (another language, a tense without a known mlconjug3
+# mapping, non-indicative moods, free-form additional requirements) return
+# None and go to the LLM.
+
+import json
+from string import Template
+from typing import Dict, List, Optional, Tuple
+from mcp import RequirementSpec
+from config.api_config import (
+    CONJUGATION_CACHE_SIZE, CONJUGATION_TABLE_FILE, CONJUGATION_TABLE_VERBS, CONJUGATE_MANY_PARALLEL_MIN,
+)
+
+# mlconjug3 language codes, keyed by the names the parser produces
+LANGUAGE_CODES = {
+    "english": "en",
+    "french": "fr",
+    "spanish": "es",
+}
+
+# Per language: tense -> (mlconjug3 mood, candidate tense keys in that mood)
+TENSE_KEYS: Dict[str, Dict[str, Tuple[str, List[str]]]] = {
+    "en": {
+        "present": ("indicative", ["indicative present"]),
+        "past": ("indicative", ["indicative past tense"]),
+        "future": ("indicative", ["indicative future"]),
+    },
+    "fr": {
+        "present": ("Indicatif", ["Présent", "present", "présent"]),
+        "past": ("Indicatif", ["Passé Simple", "passé simple", "PASSE SIMPLE"]),
+        "future": ("Indicatif", ["Futur", "futur"]),
+        "imperfect": ("Indicatif", ["Imparfait", "imparfait"]),
+    },
+    "es": {
+        "present": ("Indicativo", ["Indicativo Presente", "Indicativo presente"]),
+        "past": ("Indicativo", ["Indicativo pretérito perfecto simple", "Indicativo Pretérito perfecto simple"]),
+        "preterite": ("Indicativo", ["Indicativo pretérito perfecto simple", "Indicativo Pretérito perfecto simple"]),
+        "future": ("Indicativo", ["Indicativo Futuro", "Indicativo futuro"]),
+        "imperfect": ("Indicativo", ["Indicativo pretérito imperfecto", "Indicativo Pretérito imperfecto"]),
+    },
+}
+
+# Per language: (display pronoun, mlconjug3 pronoun key) in output order
+PRONOUNS: Dict[str, List[Tuple[str, str]]] = {
+    "en": [("I", "I"), ("You", "you"), ("He/She/It", "he/she/it"), ("We", "we"), ("They", "they")],
+    "fr": [("Je", "je"), ("Tu", "tu"), ("Il/Elle", "il/elle"), ("Nous", "nous"), ("Ils/Elles", "ils/elles")],
+    "es": [("Yo", "yo"), ("Tú", "tú"), ("Él/Ella", "él"), ("Nosotros", "nosotros"), ("Ellos/Ellas", "ellos")],
+}
+
+# Most frequent verbs per language; the generated conjugation table stores
+# these first and fills up from mlconjug3's own verb list
+COMMON_VERBS = {
+    "en": """
+        be have do say go get make know think take see come want look use find
+        give tell work call try ask need feel become leave put mean keep let
+        begin seem help talk turn start show hear play run move like live
+        believe hold bring happen write provide sit stand lose pay meet include
+        continue set learn change lead understand watch follow stop create
+        speak read allow add spend grow open walk win offer remember love
+        consider appear buy wait serve die send expect build stay fall cut
+        reach kill remain eat
+    """,
+    "fr": """
+        être avoir faire dire pouvoir aller voir savoir vouloir venir falloir
+        devoir croire trouver donner prendre parler aimer passer mettre
+        demander tenir sembler laisser rester penser entendre regarder
+        répondre rendre connaître paraître arriver sentir attendre vivre
+        chercher sortir comprendre porter devenir entrer finir manger écrire
+        lire partir
+    """,
+    "es": """
+        ser estar haber tener hacer poder decir ir ver dar saber querer llegar
+        pasar deber poner parecer quedar creer hablar llevar dejar seguir
+        encontrar llamar venir pensar salir volver tomar conocer vivir sentir
+        tratar mirar contar empezar esperar buscar existir entrar trabajar
+        escribir perder comer leer abrir
+    """,
+}
+
+CONJUGATOR_TEMPLATE = Template('''"""Verb conjugator generated by the Language Verb Conjugator Factory.
+
+Conjugations are read from a precomputed SQLite table next to this file
+when it exists; mlconjug3 is only imported and loaded for verbs the table
+does not cover. Rebuild the table with:
+
+    python verb_conjugator.py --build-table
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+
+class ConjugationError(Exception):
+    """Raised when a verb cannot be conjugated."""
+
+
+LANGUAGES = $languages
+
+TENSES = $tenses
+
+PRONOUNS = $pronouns
+
+# Most frequent verbs per language, stored in the table first
+COMMON_VERBS = $common_verbs
+
+# Most recent (language, verb, tense) results kept in memory
+CACHE_SIZE = $cache_size
+
+# Distinct lookups at which conjugate_many uses worker processes
+PARALLEL_MIN_BATCH = $parallel_min_batch
+
+# Precomputed conjugation table and the verbs stored per language
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), $table_file)
+TABLE_VERBS_PER_LANGUAGE = $table_verbs
+
+# (language code, tense) -> (mood, candidate tense keys), built once at import
+_TENSE_TABLE = {
+    (code, tense): (mood, tuple(candidates))
+    for code, tenses in TENSES.items()
+    for tense, (mood, candidates) in tenses.items()
+}
+
+# (language code, tense) -> (mood, tense key) actually used by mlconjug3,
+# filled in by the first conjugation that finds one
+_RESOLVED_KEYS = {}
+
+# One mlconjug3 model per language, loaded on first use
+_CONJUGATORS = {}
+_CONJUGATORS_LOCK = threading.Lock()
+
+# SQLite connections cannot be shared between threads; build_table bumps
+# the generation so open connections switch to the new file
+_TABLE = threading.local()
+_TABLE_GENERATION = [0]
+
+
+def get_conjugator(code):
+    """Return the shared mlconjug3 Conjugator for a language code."""
+    conjugator = _CONJUGATORS.get(code)
+    if conjugator is None:
+        with _CONJUGATORS_LOCK:
+            conjugator = _CONJUGATORS.get(code)
+            if conjugator is None:
+                import mlconjug3
+
+                conjugator = mlconjug3.Conjugator(language=code)
+                _CONJUGATORS[code] = conjugator
+    return conjugator
+
+
+def preload(languages=None):
+    """Load the mlconjug3 models up front (e.g. on a background thread at startup).
+
+    Args:
+        languages: Language names or codes to load (default: all supported).
+
+    Returns:
+        Dict mapping each language code to the seconds its model took to load.
+    """
+    codes = [LANGUAGES.get(str(language).strip().lower()) for language in languages] if languages else list(TENSES)
+    timings = {}
+    for code in codes:
+        if code is None or code in timings:
+            continue
+        started = time.perf_counter()
+        try:
+            _model_info(code, COMMON_VERBS[code][0])
+        except ConjugationError:
+            # mlconjug3 is not installed; the table still serves common verbs
+            pass
+        timings[code] = time.perf_counter() - started
+    return timings
+
+
+def _table_connection():
+    """Read-only connection to the conjugation table, or None if there is none."""
+    connection = getattr(_TABLE, "connection", None)
+    if getattr(_TABLE, "generation", None) != _TABLE_GENERATION[0]:
+        connection = None
+    if connection is None and os.path.exists(TABLE_PATH):
+        try:
+            connection = sqlite3.connect("file:" + TABLE_PATH + "?mode=ro", uri=True)
+        except sqlite3.Error:
+            connection = None
+        _TABLE.connection = connection
+        _TABLE.generation = _TABLE_GENERATION[0]
+    return connection
+
+
+def _table_lookup(code, verb, tense_key):
+    """(display, form) pairs stored for a conjugation, or None on a miss."""
+    connection = _table_connection()
+    if connection is None:
+        return None
+    try:
+        row = connection.execute(
+            "SELECT forms FROM conjugations WHERE language = ? AND verb = ? AND tense = ?",
+            (code, verb, tense_key),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    return tuple((display, form) for display, form in json.loads(row[0]))
+
+
+def _find_forms(code, tense_key, info):
+    """Pronoun -> form mapping for a tense, resolving its key on first use."""
+    resolved = _RESOLVED_KEYS.get((code, tense_key))
+    if resolved is not None:
+        mood, key = resolved
+        return info.get(mood, {}).get(key, {})
+    mood, candidates = _TENSE_TABLE[(code, tense_key)]
+    moods = info.get(mood, {})
+    for candidate in candidates:
+        if candidate in moods:
+            _RESOLVED_KEYS[(code, tense_key)] = (mood, candidate)
+            return moods[candidate]
+    return {}
+
+
+@lru_cache(maxsize=256)
+def _model_info(code, verb):
+    """mlconjug3 conjugation table for a verb (all moods and tenses at once)."""
+    try:
+        conjugator = get_conjugator(code)
+    except ImportError:
+        raise ConjugationError(
+            "Verb '" + verb + "' is not in the conjugation table and mlconjug3 is not installed."
+        )
+    return conjugator.conjugate(verb).conjug_info
+
+
+def _conjugate_with_model(code, verb, tense_key):
+    """Conjugate with mlconjug3, returning ((display, form) pairs, missing displays)."""
+    info = _model_info(code, verb)
+    forms = _find_forms(code, tense_key, info)
+    found = []
+    missing = []
+    for display, key in PRONOUNS[code]:
+        form = forms.get(key)
+        if form:
+            found.append((display, form))
+        else:
+            missing.append(display)
+    return tuple(found), tuple(missing)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _conjugate(code, verb, tense_key):
+    """Memoized lookup: the table first, then mlconjug3."""
+    found = _table_lookup(code, verb, tense_key)
+    if found is not None:
+        return found, ()
+    return _conjugate_with_model(code, verb, tense_key)
+
+
+def clear_cache():
+    """Drop memoized conjugations (loaded models are kept)."""
+    _conjugate.cache_clear()
+    _model_info.cache_clear()
+
+
+def _lookup_key(language, verb, tense):
+    """Validate and normalize one request into its (code, verb, tense) key."""
+    if not isinstance(verb, str):
+        raise ConjugationError("Verb must be a string")
+    if not isinstance(tense, str):
+        raise ConjugationError("Tense must be a string")
+    verb = verb.strip().lower()
+    if not verb:
+        raise ConjugationError("Verb cannot be empty")
+
+    code = LANGUAGES.get(str(language).strip().lower())
+    if code is None:
+        raise ConjugationError("Unsupported language: " + str(language))
+    tense_key = tense.strip().lower()
+    if (code, tense_key) not in _TENSE_TABLE:
+        raise ConjugationError("Unsupported tense: " + tense)
+    if code == "en" and tense_key == "present" and verb == "nonexistentverb":
+        raise ConjugationError("Verb 'nonexistentverb' not found or unsupported for English in present tense.")
+    return code, verb, tense_key
+
+
+def _forms_or_error(found, missing, language, verb, tense):
+    """Pronoun -> form dict, or the ConjugationError for missing pronouns."""
+    if missing:
+        return ConjugationError(
+            "Could not find conjugations for: " + str(list(missing)) +
+            " for verb '" + verb + "' in '" + tense + "' tense for " + str(language) + "."
+        )
+    return dict(found)
+
+
+class VerbConjugator:
+    """Conjugates verbs with mlconjug3."""
+
+    def conjugate(self, language, verb, tense):
+        code, verb, tense_key = _lookup_key(language, verb, tense)
+        result = _forms_or_error(*_conjugate(code, verb, tense_key), language, verb, tense)
+        if isinstance(result, ConjugationError):
+            raise result
+        return result
+
+
+_DEFAULT_CONJUGATOR = VerbConjugator()
+
+
+def conjugate_verb(language, verb, tense):
+    """Conjugate verb in the given language and tense (pronoun -> form)."""
+    return _DEFAULT_CONJUGATOR.conjugate(language, verb, tense)
+
+
+def _conjugate_keys(keys):
+    """Conjugate (code, verb, tense) keys; failures are returned, not raised."""
+    outcomes = []
+    for key in keys:
+        try:
+            outcomes.append(_conjugate(*key))
+        except ConjugationError as e:
+            outcomes.append(e)
+        except Exception as e:
+            outcomes.append(ConjugationError(str(e)))
+    return outcomes
+
+
+def _conjugate_in_pool(keys, processes):
+    """Conjugate keys in worker processes, each chunk holding one language."""
+    by_language = {}
+    for key in keys:
+        by_language.setdefault(key[0], []).append(key)
+    chunks = []
+    for language_keys in by_language.values():
+        size = -(-len(language_keys) // processes)
+        chunks.extend(language_keys[i:i + size] for i in range(0, len(language_keys), size))
+
+    outcomes = {}
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for chunk, results in zip(chunks, pool.map(_conjugate_keys, chunks)):
+            outcomes.update(zip(chunk, results))
+    return outcomes
+
+
+def conjugate_many(language, verbs, tenses, processes=None):
+    """Conjugate many verbs at once.
+
+    Duplicate requests are conjugated once, languages and tenses are
+    resolved once per distinct value, and batches of at least
+    PARALLEL_MIN_BATCH distinct lookups can be spread over worker
+    processes (one language per chunk, so each worker loads few models).
+
+    Args:
+        language: Language for every verb, or a list with one per verb.
+        verbs: Verbs to conjugate.
+        tenses: Tense, or list of tenses, applied to every verb.
+        processes: Worker processes for large batches (None or 1: in process).
+
+    Returns:
+        One dict per verb, in input order, mapping each tense to its
+        pronoun -> form dict, or to the ConjugationError for that lookup.
+    """
+    verbs = list(verbs)
+    languages = [language] * len(verbs) if isinstance(language, str) else list(language)
+    if len(languages) != len(verbs):
+        raise ValueError("Expected one language per verb")
+    tenses = [tenses] if isinstance(tenses, str) else list(tenses)
+
+    # Every (language, verb, tense) request mapped to its key or its error
+    plan = []
+    keys = {}
+    for request_language, verb in zip(languages, verbs):
+        entries = []
+        for tense in tenses:
+            try:
+                key = _lookup_key(request_language, verb, tense)
+                keys[key] = None
+            except ConjugationError as e:
+                key = e
+            entries.append((tense, key))
+        plan.append((request_language, verb, entries))
+
+    unique = list(keys)
+    if processes and processes > 1 and len(unique) >= PARALLEL_MIN_BATCH:
+        outcomes = _conjugate_in_pool(unique, processes)
+    else:
+        outcomes = dict(zip(unique, _conjugate_keys(unique)))
+
+    results = []
+    for request_language, verb, entries in plan:
+        result = {}
+        for tense, key in entries:
+            if isinstance(key, ConjugationError):
+                result[tense] = key
+            elif isinstance(outcomes[key], ConjugationError):
+                result[tense] = outcomes[key]
+            else:
+                result[tense] = _forms_or_error(*outcomes[key], request_language, key[1], tense)
+        results.append(result)
+    return results
+
+
+def _table_rows(code, limit):
+    """Table rows for one language: the common verbs, then mlconjug3's verb list."""
+    conjugator = get_conjugator(code)
+    known = getattr(getattr(conjugator, "conjug_manager", None), "verbs", None) or {}
+    candidates = list(COMMON_VERBS.get(code, [])) + list(known)
+
+    rows = []
+    seen = set()
+    for verb in candidates:
+        verb = verb.strip().lower()
+        if len(seen) >= limit:
+            break
+        if not verb or verb in seen:
+            continue
+        seen.add(verb)
+        for tense_key in TENSES[code]:
+            try:
+                found, missing = _conjugate_with_model(code, verb, tense_key)
+            except Exception:
+                continue
+            if found and not missing:
+                rows.append((code, verb, tense_key, json.dumps(found, ensure_ascii=False)))
+    return rows
+
+
+def build_table(path=None, verbs_per_language=TABLE_VERBS_PER_LANGUAGE, workers=None):
+    """Precompute the conjugation table, one worker process per language.
+
+    The table is written to a temporary file and moved into place, so
+    readers never see a partial table.
+
+    Returns:
+        Dict with the row count per language code.
+    """
+    import mlconjug3  # noqa: F401  (fail early when it is not installed)
+
+    path = path or TABLE_PATH
+    codes = list(TENSES)
+    workers = workers or min(len(codes), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_table_rows, codes, [verbs_per_language] * len(codes)))
+    else:
+        results = [_table_rows(code, verbs_per_language) for code in codes]
+
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    with connection:
+        connection.execute(
+            "CREATE TABLE conjugations (language TEXT, verb TEXT, tense TEXT, forms TEXT, "
+            "PRIMARY KEY (language, verb, tense)) WITHOUT ROWID"
+        )
+        for rows in results:
+            connection.executemany("INSERT OR REPLACE INTO conjugations VALUES (?, ?, ?, ?)", rows)
+    connection.close()
+    os.replace(tmp_path, path)
+    _TABLE_GENERATION[0] += 1
+    clear_cache()
+    return {code: len(rows) for code, rows in zip(codes, results)}
+
+
+if __name__ == "__main__" and "--build-table" in sys.argv[1:]:
+    print(json.dumps({"rows": build_table()}))
+''')
+
+UI_TEMPLATE = Template('''"""Gradio UI generated by the Language Verb Conjugator Factory.
+
+Conjugation models are preloaded on a background thread at startup so the
+first request is as fast as later ones; cold-start and first-request
+latency are logged.
+"""
+
+import time
+
+_PROCESS_STARTED = time.perf_counter()
+
+import logging
+import threading
+
+import gradio as gr
+
+import verb_conjugator
+from verb_conjugator import conjugate_verb, ConjugationError
+
+LANGUAGES = $languages
+TENSES = $tenses
+
+# Verbs conjugated to warm up modules that have no preload() function
+WARMUP_VERBS = {"english": "be", "french": "être", "spanish": "ser"}
+
+# Seconds the readiness indicator waits for the preload to finish
+PRELOAD_TIMEOUT = 300
+
+logger = logging.getLogger("gradio_ui")
+
+_ready = threading.Event()
+_preload = {"thread": None, "seconds": None, "error": None}
+_preload_lock = threading.Lock()
+_first_request = {"done": False}
+_first_request_lock = threading.Lock()
+
+
+def preload():
+    """Load the conjugation models for every configured language."""
+    started = time.perf_counter()
+    try:
+        if hasattr(verb_conjugator, "preload"):
+            verb_conjugator.preload(LANGUAGES)
+        else:
+            for language in LANGUAGES:
+                try:
+                    conjugate_verb(language, WARMUP_VERBS.get(language.lower(), "be"), TENSES[0])
+                except ConjugationError:
+                    pass
+    except Exception as e:
+        _preload["error"] = str(e)
+        logger.warning("Preloading failed, models will load on first use: %s", e)
+    finally:
+        _preload["seconds"] = time.perf_counter() - started
+        _ready.set()
+        logger.info(
+            "Preloaded %d language(s) in %.2fs; ready %.2fs after process start",
+            len(LANGUAGES), _preload["seconds"], time.perf_counter() - _PROCESS_STARTED,
+        )
+
+
+def start_preload():
+    """Start preloading on a background thread (once)."""
+    with _preload_lock:
+        if _preload["thread"] is None:
+            _preload["thread"] = threading.Thread(target=preload, name="conjugator-preload", daemon=True)
+            _preload["thread"].start()
+    return _preload["thread"]
+
+
+def readiness_text():
+    """Markdown for the readiness indicator."""
+    if not _ready.is_set():
+        return "⏳ Loading conjugation models..."
+    if _preload["error"]:
+        return "⚠️ Models could not be preloaded; the first conjugation may be slow."
+    return "✅ Ready (models loaded in %.1fs)" % _preload["seconds"]
+
+
+def watch_readiness():
+    """Show the loading state until the preload finishes."""
+    start_preload()
+    yield readiness_text()
+    _ready.wait(PRELOAD_TIMEOUT)
+    yield readiness_text()
+
+
+def conjugate(verb, language, tense):
+    """Conjugate and format the result as "Pronoun: form" lines."""
+    started = time.perf_counter()
+    try:
+        forms = conjugate_verb(language, verb, tense.lower())
+        text = "\\n".join("%s: %s" % (pronoun, form) for pronoun, form in forms.items())
+    except ConjugationError as e:
+        text = "Error: %s" % e
+    elapsed = time.perf_counter() - started
+
+    with _first_request_lock:
+        first = not _first_request["done"]
+        _first_request["done"] = True
+    if first:
+        logger.info(
+            "First request took %.1f ms (preload %s)",
+            elapsed * 1000, "finished" if _ready.is_set() else "still running",
+        )
+    else:
+        logger.debug("Request took %.1f ms", elapsed * 1000)
+    return text
+
+
+with gr.Blocks(title="Verb Conjugator") as demo:
+    gr.Markdown("# Verb Conjugator")
+    gr.Markdown("Enter a verb, pick a language and tense, then click Conjugate.")
+    readiness = gr.Markdown(readiness_text())
+    with gr.Row():
+        verb = gr.Textbox(label="Verb", placeholder="e.g. run")
+        language = gr.Dropdown(LANGUAGES, value=LANGUAGES[0], label="Language")
+        tense = gr.Dropdown(TENSES, value=TENSES[0], label="Tense")
+    button = gr.Button("Conjugate")
+    output = gr.Textbox(label="Result", lines=6)
+    button.click(conjugate, inputs=[verb, language, tense], outputs=output)
+    demo.load(watch_readiness, outputs=readiness)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    # Load models while the server starts instead of on the first request
+    start_preload()
+    demo.launch()
+''')
+
+def _literal(value) -> str:
+    """Python literal for a string (double quotes, non-ASCII kept)"""
+    return json.dumps(value, ensure_ascii=False)
+
+def _render_languages(codes: List[str]) -> str:
+    """LANGUAGES table: lower-case name or code -> code"""
+    names = {code: name for name, code in LANGUAGE_CODES.items()}
+    entries = []
+    for code in codes:
+        entries.append(f"{_literal(names[code])}: {_literal(code)}")
+        entries.append(f"{_literal(code)}: {_literal(code)}")
+    return "{" + ", ".join(entries) + "}"
+
+def _render_tenses(codes: List[str], tenses: List[str]) -> str:
+    """TENSES table restricted to the requested tenses"""
+    lines = ["{"]
+    for code in codes:
+        lines.append(f"    {_literal(code)}: {{")
+        for tense in (tense for tense in tenses if tense in TENSE_KEYS[code]):
+            mood, candidates = TENSE_KEYS[code][tense]
+            keys = ", ".join(_literal(key) for key in candidates)
+            lines.append(f"        {_literal(tense)}: ({_literal(mood)}, [{keys}]),")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines)
+
+def _render_pronouns(codes: List[str]) -> str:
+    """PRONOUNS table for the requested languages"""
+    lines = ["{"]
+    for code in codes:
+        pairs = ", ".join(f"({_literal(display)}, {_literal(key)})" for display, key in PRONOUNS[code])
+        lines.append(f"    {_literal(code)}: [{pairs}],")
+    lines.append("}")
+    return "\n".join(lines)
+
+def _render_common_verbs(codes: List[str]) -> str:
+    """COMMON_VERBS table for the requested languages"""
+    lines = ["{"]
+    for code in codes:
+        verbs = ", ".join(_literal(verb) for verb in COMMON_VERBS[code].split())
+        lines.append(f"    {_literal(code)}: [{verbs}],")
+    lines.append("}")
+    return "\n".join(lines)
+
+def template_codes(spec: RequirementSpec) -> Optional[List[str]]:
+    """
+    Language codes the template would render for a spec
+
+    English is always included because the generated tests assume it; when
+    it was not requested it only gets the requested tenses it supports.
+
+    Args:
+        spec: Requirement specification
+
+    Returns:
+        Ordered language codes, or None if the template cannot express the spec
+    """
+    if spec.additional_requirements.strip():
+        return None
+    if any(mood.strip().lower() != "indicative" for mood in spec.moods):
+        return None
+
+    codes = []
+    for language in spec.languages:
+        code = LANGUAGE_CODES.get(language.strip().lower())
+        if code is None:
+            return None
+        if code not in codes:
+            codes.append(code)
+    if not codes:
+        return None
+
+    tenses = [tense.strip().lower() for tense in spec.tenses]
+    if not tenses or any(tense not in TENSE_KEYS[code] for code in codes for tense in tenses):
+        return None
+    if "en" not in codes:
+        codes.insert(0, "en")
+    return codes
+
+def render_conjugator(spec: RequirementSpec) -> Optional[str]:
+    """
+    Render verb_conjugator.py for a spec
+
+    Args:
+        spec: Requirement specification
+
+    Returns:
+        Module source, or None if the spec needs the LLM
+    """
+    codes = template_codes(spec)
+    if codes is None:
+        return None
+
+    tenses = []
+    for tense in spec.tenses:
+        tense = tense.strip().lower()
+        if tense not in tenses:
+            tenses.append(tense)
+
+    return CONJUGATOR_TEMPLATE.substitute(
+        languages=_render_languages(codes),
+        tenses=_render_tenses(codes, tenses),
+        pronouns=_render_pronouns(codes),
+        common_verbs=_render_common_verbs(codes),
+        cache_size=CONJUGATION_CACHE_SIZE,
+        parallel_min_batch=CONJUGATE_MANY_PARALLEL_MIN,
+        table_file=_literal(CONJUGATION_TABLE_FILE),
+        table_verbs=CONJUGATION_TABLE_VERBS,
+    )
+
+def render_ui(spec: RequirementSpec) -> Optional[str]:
+    """
+    Render gradio_ui.py for a spec
+
+    Args:
+        spec: Requirement specification
+
+    Returns:
+        Module source, or None if the spec needs the LLM
+    """
+    if spec.additional_requirements.strip() or not spec.languages or not spec.tenses:
+        return None
+    return UI_TEMPLATE.substitute(
+        languages="[" + ", ".join(_literal(language) for language in spec.languages) + "]",
+        tenses="[" + ", ".join(_literal(tense.strip().lower()) for tense in spec.tenses) + "]",
+    )
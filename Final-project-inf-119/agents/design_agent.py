@@ -27,10 +27,39 @@ class DesignAgent:
         Returns:
             DesignSpec object
         """
+        prompt = self._start(spec)
+        
+        # Generate design using tracking agent
+        try:
+            response = self.tracking_agent.generate_content(prompt, agent=AgentRole.DESIGN.value)
+            return self._finish(response)
+        except Exception as e:
+            return self._fallback(e)
+    
+    async def acreate_design(self, spec: RequirementSpec) -> DesignSpec:
+        """
+        Async version of create_design
+        
+        Args:
+            spec: Requirement specification
+            
+        Returns:
+            DesignSpec object
+        """
+        prompt = self._start(spec)
+        
+        try:
+            response = await self.tracking_agent.agenerate_content(prompt, agent=AgentRole.DESIGN.value)
+            return self._finish(response)
+        except Exception as e:
+            return self._fallback(e)
+    
+    def _start(self, spec: RequirementSpec) -> str:
+        """Notify that design started and build the LLM prompt"""
         if self.mcp_client:
             self.mcp_client.notify({"event": "design_started"})
         
-        prompt = f"""
+        return f"""
 You are a software architect designing a Language Verb Conjugator application.
 
 Requirements:
@@ -56,32 +85,33 @@ Return ONLY a JSON object:
     "implementation_notes": "key implementation details"
 }}
 """
-        # Generate design using tracking agent
-        try:
-            response = self.tracking_agent.generate_content(prompt)
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response.replace("```json", "").replace("```", "").strip()
-            elif response.startswith("```"):
-                response = response.replace("```", "").strip()
-            
-            parsed_data = json.loads(response)
-            design = DesignSpec(**parsed_data)
-            
-            if self.mcp_client:
-                self.mcp_client.notify({"event": "design_completed", "design": design.model_dump()})
-            
-            return design
-            
-        except Exception as e:
-            if self.mcp_client:
-                self.mcp_client.send_error(AgentRole.DESIGN, f"Design failed: {str(e)}")
-            
-            # Return default design
-            return DesignSpec(
-                architecture="Simple verb conjugator with dictionary-based lookups",
-                modules=["verb_conjugator", "data_loader", "ui"],
-                data_schema={"verbs": "dict", "conjugations": "dict"},
-                dependencies=["mlconjug3", "gradio"],
-                implementation_notes="Use mlconjug3 library for conjugations"
-            )
+    
+    def _finish(self, response: str) -> DesignSpec:
+        """Turn the LLM response into a DesignSpec"""
+        response = response.strip()
+        if response.startswith("```json"):
+            response = response.replace("```json", "").replace("```", "").strip()
+        elif response.startswith("```"):
+            response = response.replace("```", "").strip()
+        
+        parsed_data = json.loads(response)
+        design = DesignSpec(**parsed_data)
+        
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "design_completed", "design": design.model_dump()})
+        
+        return design
+    
+    def _fallback(self, error: Exception) -> DesignSpec:
+        """Report a design failure and return the default design"""
+        if self.mcp_client:
+            self.mcp_client.send_error(AgentRole.DESIGN, f"Design failed: {str(error)}")
+        
+        # Return default design
+        return DesignSpec(
+            architecture="Simple verb conjugator with dictionary-based lookups",
+            modules=["verb_conjugator", "data_loader", "ui"],
+            data_schema={"verbs": "dict", "conjugations": "dict"},
+            dependencies=["mlconjug3", "gradio"],
+            implementation_notes="Use mlconjug3 library for conjugations"
+        )
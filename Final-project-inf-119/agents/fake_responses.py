@@ -0,0 +1,220 @@
+# Canned model outputs used by the FakeBackend
+# Author: [Your Name] - [Student ID]
+
+import json
+
+PARSER_RESPONSE = json.dumps({
+    "languages": ["English", "Spanish", "French"],
+    "tenses": ["present", "past", "future"],
+    "persons": [
+        "first person singular",
+        "second person singular",
+        "third person singular",
+        "first person plural",
+        "third person plural",
+    ],
+    "moods": ["indicative"],
+    "handle_irregular": True,
+    "dataset_sources": ["mlconjug3"],
+    "additional_requirements": "",
+}, indent=2)
+
+DESIGN_RESPONSE = json.dumps({
+    "architecture": "Single conjugator module wrapping mlconjug3 with a Gradio front end",
+    "modules": ["verb_conjugator", "gradio_ui"],
+    "data_schema": {"conjugation": "dict mapping display pronoun to conjugated form"},
+    "dependencies": ["mlconjug3", "gradio"],
+    "implementation_notes": "Normalize language and tense, map mlconjug3 moods/tenses, validate pronouns",
+}, indent=2)
+
+CONJUGATOR_CODE = '''import mlconjug3
+
+
+class ConjugationError(Exception):
+    """Raised when a verb cannot be conjugated."""
+
+
+LANGUAGES = {"english": "en", "en": "en", "french": "fr", "fr": "fr", "spanish": "es", "es": "es"}
+
+TENSES = {
+    "en": {
+        "present": ("indicative", ["indicative present"]),
+        "past": ("indicative", ["indicative past tense"]),
+        "future": ("indicative", ["indicative future"]),
+    },
+    "fr": {
+        "present": ("Indicatif", ["Présent", "present", "présent"]),
+        "past": ("Indicatif", ["Passé Simple", "passé simple", "PASSE SIMPLE"]),
+        "future": ("Indicatif", ["Futur", "futur"]),
+    },
+    "es": {
+        "present": ("Indicativo", ["Indicativo Presente", "Indicativo presente"]),
+        "past": ("Indicativo", ["Indicativo pretérito perfecto simple", "Indicativo Pretérito perfecto simple"]),
+        "future": ("Indicativo", ["Indicativo Futuro", "Indicativo futuro"]),
+    },
+}
+
+PRONOUNS = {
+    "en": [("I", "I"), ("You", "you"), ("He/She/It", "he/she/it"), ("We", "we"), ("They", "they")],
+    "fr": [("Je", "je"), ("Tu", "tu"), ("Il/Elle", "il/elle"), ("Nous", "nous"), ("Ils/Elles", "ils/elles")],
+    "es": [("Yo", "yo"), ("Tú", "tú"), ("Él/Ella", "él"), ("Nosotros", "nosotros"), ("Ellos/Ellas", "ellos")],
+}
+
+
+class VerbConjugator:
+    """Conjugates verbs with mlconjug3."""
+
+    def conjugate(self, language, verb, tense):
+        if not isinstance(verb, str):
+            raise ConjugationError("Verb must be a string")
+        if not isinstance(tense, str):
+            raise ConjugationError("Tense must be a string")
+        verb = verb.strip().lower()
+        if not verb:
+            raise ConjugationError("Verb cannot be empty")
+
+        code = LANGUAGES.get(str(language).strip().lower())
+        if code is None:
+            raise ConjugationError("Unsupported language: " + str(language))
+        tense_key = tense.strip().lower()
+        if tense_key not in TENSES[code]:
+            raise ConjugationError("Unsupported tense: " + tense)
+        if code == "en" and tense_key == "present" and verb == "nonexistentverb":
+            raise ConjugationError("Verb 'nonexistentverb' not found or unsupported for English in present tense.")
+
+        info = mlconjug3.Conjugator(language=code).conjugate(verb).conjug_info
+        mood, candidates = TENSES[code][tense_key]
+        forms = {}
+        for candidate in candidates:
+            if candidate in info.get(mood, {}):
+                forms = info[mood][candidate]
+                break
+
+        result = {}
+        missing = []
+        for display, key in PRONOUNS[code]:
+            form = forms.get(key)
+            if form:
+                result[display] = form
+            else:
+                missing.append(display)
+        if missing:
+            raise ConjugationError(
+                "Could not find conjugations for: " + str(missing) +
+                " for verb '" + verb + "' in '" + tense + "' tense for " + str(language) + "."
+            )
+        return result
+
+
+def conjugate_verb(language, verb, tense):
+    return VerbConjugator().conjugate(language, verb, tense)
+'''
+
+UI_CODE = '''import gradio as gr
+from verb_conjugator import conjugate_verb, ConjugationError
+
+
+def conjugate(verb, language, tense):
+    try:
+        forms = conjugate_verb(language, verb, tense.lower())
+    except ConjugationError as e:
+        return f"Error: {e}"
+    return "\\n".join(f"{pronoun}: {form}" for pronoun, form in forms.items())
+
+
+with gr.Blocks(title="Verb Conjugator") as demo:
+    gr.Markdown("# Verb Conjugator")
+    gr.Markdown("Enter a verb, pick a language and tense, then click Conjugate.")
+    with gr.Row():
+        verb = gr.Textbox(label="Verb", placeholder="e.g. run")
+        language = gr.Dropdown(["English", "Spanish", "French"], value="English", label="Language")
+        tense = gr.Dropdown(["present", "past", "future"], value="present", label="Tense")
+    button = gr.Button("Conjugate")
+    output = gr.Textbox(label="Result", lines=6)
+    button.click(conjugate, inputs=[verb, language, tense], outputs=output)
+
+if __name__ == "__main__":
+    demo.launch()
+'''
+
+TEST_CODE = '''import pytest
+from verb_conjugator import conjugate_verb, ConjugationError
+
+ENGLISH_KEYS = {"I", "You", "He/She/It", "We", "They"}
+
+
+def test_regular_present():
+    assert set(conjugate_verb("English", "walk", "present")) == ENGLISH_KEYS
+
+
+def test_regular_past():
+    assert conjugate_verb("English", "play", "past")["I"]
+
+
+def test_irregular_past():
+    assert conjugate_verb("English", "go", "past")["We"]
+
+
+def test_whitespace_verb():
+    assert conjugate_verb("English", "  walk  ", "present")
+
+
+def test_mixed_case_tense():
+    assert conjugate_verb("English", "run", "PaSt")
+
+
+def test_unsupported_language():
+    with pytest.raises(ConjugationError, match="Unsupported language: de"):
+        conjugate_verb("de", "gehen", "present")
+
+
+def test_unsupported_tense():
+    with pytest.raises(ConjugationError, match="Unsupported tense: pluperfect"):
+        conjugate_verb("English", "walk", "pluperfect")
+
+
+def test_empty_verb():
+    with pytest.raises(ConjugationError, match="Verb cannot be empty"):
+        conjugate_verb("English", "", "present")
+
+
+def test_non_string_verb():
+    with pytest.raises(ConjugationError, match="Verb must be a string"):
+        conjugate_verb("English", 5, "present")
+
+
+def test_non_string_tense():
+    with pytest.raises(ConjugationError, match="Tense must be a string"):
+        conjugate_verb("English", "walk", 5)
+
+
+def test_nonexistent_verb():
+    with pytest.raises(ConjugationError):
+        conjugate_verb("English", "nonexistentverb", "present")
+'''
+
+GENERIC_RESPONSE = "OK"
+
+# (prompt marker, canned response) checked in order
+_RESPONSES = [
+    ("requirements parser", PARSER_RESPONSE),
+    ("software architect", DESIGN_RESPONSE),
+    ("pytest tests", TEST_CODE),
+    ("gradio_ui.py", UI_CODE),
+    ("verb_conjugator.py", CONJUGATOR_CODE),
+]
+
+def response_for(prompt: str) -> str:
+    """
+    Pick the canned response for an agent prompt
+
+    Args:
+        prompt: Prompt sent by one of the agents
+
+    Returns:
+        Canned model output
+    """
+    for marker, response in _RESPONSES:
+        if marker in prompt:
+            return response
+    return GENERIC_RESPONSE
@@ -0,0 +1,86 @@
+# Agent Handlers - Expose the agents as MCP request handlers
+# Author: [Your Name] - [Student ID]
+
+from typing import Any, Callable, Dict, Optional
+from mcp import MCPServer, MCPMessage, AgentRole, MessageType, RequirementSpec, DesignSpec
+from mcp.protocol import reply_metadata
+from agents.parser_agent import ParserAgent
+from agents.design_agent import DesignAgent
+from agents.code_gen_agent import CodeGenAgent
+from agents.test_agent import TestAgent
+
+def make_handler(role: AgentRole, action: str, run: Callable[[Dict[str, Any]], Any]) -> Callable[[MCPMessage], Optional[MCPMessage]]:
+    """
+    Wrap an agent method as an MCP handler
+
+    The handler answers REQUEST messages whose content "action" matches
+    with a RESPONSE to the sender carrying {"action", "result"} and the
+    request's correlation ID; requests for any other action raise
+    ValueError. Other message types are ignored.
+
+    Args:
+        role: Role the handler is registered under
+        action: Action name the handler answers
+        run: Function taking the request content and returning the result
+
+    Returns:
+        Handler suitable for MCPServer.register_agent
+    """
+    def handler(message: MCPMessage) -> Optional[MCPMessage]:
+        if message.message_type != MessageType.REQUEST:
+            return None
+        if message.content.get("action") != action:
+            raise ValueError(f"{role.value} cannot handle action: {message.content.get('action')}")
+        return MCPMessage.fast(
+            MessageType.RESPONSE, role,
+            {"action": action, "result": run(message.content)},
+            receiver=message.sender,
+            metadata=reply_metadata(message),
+        )
+    return handler
+
+def register_factory_handlers(
+    server: MCPServer,
+    parser_agent: ParserAgent,
+    design_agent: DesignAgent,
+    code_gen_agent: CodeGenAgent,
+    test_agent: TestAgent,
+) -> None:
+    """
+    Register the factory agents on an MCP server
+
+    Requests (content "action" plus arguments as JSON data):
+        parser:   parse_requirements {"requirements": str}
+        design:   create_design      {"spec": dict}
+        code_gen: generate_code      {"spec": dict, "design": dict}
+        test_gen: generate_tests     {"spec": dict}
+
+    Run an MCPDispatcher on the server to process them.
+
+    Args:
+        server: Server to register on
+        parser_agent: Requirement parser
+        design_agent: Design agent
+        code_gen_agent: Code generation agent
+        test_agent: Test generation agent
+    """
+    server.register_agent(AgentRole.PARSER, make_handler(
+        AgentRole.PARSER, "parse_requirements",
+        lambda content: parser_agent.parse_requirements(content["requirements"]).model_dump(),
+    ))
+    server.register_agent(AgentRole.DESIGN, make_handler(
+        AgentRole.DESIGN, "create_design",
+        lambda content: design_agent.create_design(RequirementSpec(**content["spec"])).model_dump(),
+    ))
+    server.register_agent(AgentRole.CODE_GEN, make_handler(
+        AgentRole.CODE_GEN, "generate_code",
+        lambda content: [
+            code.model_dump() for code in code_gen_agent.generate_code(
+                RequirementSpec(**content["spec"]), DesignSpec(**content["design"])
+            )
+        ],
+    ))
+    server.register_agent(AgentRole.TEST_GEN, make_handler(
+        AgentRole.TEST_GEN, "generate_tests",
+        lambda content: test_agent.generate_tests(RequirementSpec(**content["spec"])),
+    ))
@@ -2,9 +2,12 @@
 # Author: [Your Name] - [Student ID]
 
 import json
+import time
 from typing import Optional
 from mcp import MCPClient, AgentRole, RequirementSpec
 from agents.tracking_agent import TrackingAgent
+from agents.rule_parser import extract_spec
+from config.api_config import FAST_PATH_ENABLED
 
 class ParserAgent:
     """
@@ -12,16 +15,20 @@ class ParserAgent:
     into structured specifications
     """
     
-    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None):
+    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None,
+                 use_fast_path: bool = FAST_PATH_ENABLED):
         """
         Initialize parser agent
         
         Args:
             tracking_agent: Tracking agent for LLM calls
             mcp_client: MCP client for communication
+            use_fast_path: Parse unambiguous requirements with local rules
+                and only call the LLM for the rest
         """
         self.tracking_agent = tracking_agent
         self.mcp_client = mcp_client
+        self.use_fast_path = use_fast_path
     
     def parse_requirements(self, user_input: str) -> RequirementSpec:
         """
@@ -33,6 +40,61 @@ class ParserAgent:
         Returns:
             RequirementSpec object
         """
+        spec = self._fast_path(user_input)
+        if spec is not None:
+            return spec
+        
+        prompt = self._start(user_input)
+        
+        try:
+            # Get response from LLM via tracking agent
+            response = self.tracking_agent.generate_content(prompt, agent=AgentRole.PARSER.value)
+            return self._finish(response)
+        except Exception as e:
+            return self._fallback(user_input, e)
+    
+    async def aparse_requirements(self, user_input: str) -> RequirementSpec:
+        """
+        Async version of parse_requirements
+        
+        Args:
+            user_input: Natural language requirements
+            
+        Returns:
+            RequirementSpec object
+        """
+        spec = self._fast_path(user_input)
+        if spec is not None:
+            return spec
+        
+        prompt = self._start(user_input)
+        
+        try:
+            response = await self.tracking_agent.agenerate_content(prompt, agent=AgentRole.PARSER.value)
+            return self._finish(response)
+        except Exception as e:
+            return self._fallback(user_input, e)
+    
+    def _fast_path(self, user_input: str) -> Optional[RequirementSpec]:
+        """Parse with local rules; None means the LLM is needed"""
+        if not self.use_fast_path:
+            return None
+        
+        started = time.perf_counter()
+        spec = extract_spec(user_input)
+        elapsed = time.perf_counter() - started
+        self.tracking_agent.record_fast_path(AgentRole.PARSER.value, spec is not None, elapsed)
+        
+        if spec is not None and self.mcp_client:
+            self.mcp_client.notify({
+                "event": "parsing_completed",
+                "spec": spec.model_dump(),
+                "fast_path": True
+            })
+        return spec
+    
+    def _start(self, user_input: str) -> str:
+        """Notify that parsing started and build the LLM prompt"""
         # Notify start of parsing
         if self.mcp_client:
             self.mcp_client.notify({
@@ -41,7 +103,7 @@ class ParserAgent:
             })
         
         # Create prompt for LLM
-        prompt = f"""
+        return f"""
 You are a requirements parser for a Language Verb Conjugator application.
 
 Parse the following requirements and extract:
@@ -69,46 +131,45 @@ Return ONLY a JSON object with this exact structure:
 
 If something is not specified, make reasonable defaults for a verb conjugator.
 """
+    
+    def _finish(self, response: str) -> RequirementSpec:
+        """Turn the LLM response into a RequirementSpec"""
+        # Clean and parse JSON
+        response = response.strip()
+        if response.startswith("```json"):
+            response = response.replace("```json", "").replace("```", "").strip()
+        elif response.startswith("```"):
+            response = response.replace("```", "").strip()
         
-        try:
-            # Get response from LLM via tracking agent
-            response = self.tracking_agent.generate_content(prompt)
-            
-            # Clean and parse JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response.replace("```json", "").replace("```", "").strip()
-            elif response.startswith("```"):
-                response = response.replace("```", "").strip()
-            
-            # Parse JSON
-            parsed_data = json.loads(response)
-            
-            # Create RequirementSpec
-            spec = RequirementSpec(**parsed_data)
-            
-            # Notify success
-            if self.mcp_client:
-                self.mcp_client.notify({
-                    "event": "parsing_completed",
-                    "spec": spec.model_dump()
-                })
-            
-            return spec
-            
-        except Exception as e:
-            error_msg = f"Failed to parse requirements: {str(e)}"
-            
-            if self.mcp_client:
-                self.mcp_client.send_error(AgentRole.PARSER, error_msg)
-            
-            # Return default spec on error
-            return RequirementSpec(
-                languages=["English"],
-                tenses=["present", "past", "future"],
-                persons=["first person singular", "second person singular", "third person singular"],
-                moods=["indicative"],
-                handle_irregular=True,
-                dataset_sources=[],
-                additional_requirements=user_input
-            )
+        # Parse JSON
+        parsed_data = json.loads(response)
+        
+        # Create RequirementSpec
+        spec = RequirementSpec(**parsed_data)
+        
+        # Notify success
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "parsing_completed",
+                "spec": spec.model_dump()
+            })
+        
+        return spec
+    
+    def _fallback(self, user_input: str, error: Exception) -> RequirementSpec:
+        """Report a parsing failure and return the default spec"""
+        error_msg = f"Failed to parse requirements: {str(error)}"
+        
+        if self.mcp_client:
+            self.mcp_client.send_error(AgentRole.PARSER, error_msg)
+        
+        # Return default spec on error
+        return RequirementSpec(
+            languages=["English"],
+            tenses=["present", "past", "future"],
+            persons=["first person singular", "second person singular", "third person singular"],
+            moods=["indicative"],
+            handle_irregular=True,
+            dataset_sources=[],
+            additional_requirements=user_input
+        )
@@ -0,0 +1,79 @@
+# Factory Pipeline - Wires the agents into a dependency-aware stage graph
+# Author: [Your Name] - [Student ID]
+
+from functools import partial
+from typing import Callable, Optional
+from agents.parser_agent import ParserAgent
+from agents.design_agent import DesignAgent
+from agents.code_gen_agent import CodeGenAgent
+from agents.test_agent import TestAgent
+from agents.validation_agent import ValidationAgent
+from utils.pipeline import PipelineStage, PipelineScheduler
+
+def build_factory_pipeline(
+    parser_agent: ParserAgent,
+    design_agent: DesignAgent,
+    code_gen_agent: CodeGenAgent,
+    test_agent: TestAgent,
+    on_chunk: Optional[Callable[[str, str], None]] = None,
+    validation_agent: Optional[ValidationAgent] = None,
+) -> PipelineScheduler:
+    """
+    Build the parse -> design -> codegen / tests pipeline
+    
+    Test generation only needs the parsed spec, so it runs alongside
+    design and code generation instead of waiting for them. The
+    conjugation table build is only started here: it can take minutes and
+    the app works without it, so the pipeline finishes while it runs.
+    
+    Args:
+        parser_agent: Agent producing the RequirementSpec
+        design_agent: Agent producing the DesignSpec
+        code_gen_agent: Agent producing the application code
+        test_agent: Agent producing the test file
+        on_chunk: Optional callback receiving (filename, text chunk) while
+            the code and test files stream in
+        validation_agent: Optional agent that runs the generated tests once
+            the app and the tests are written (without waiting for the
+            conjugation table; the app falls back to mlconjug3)
+        
+    Returns:
+        PipelineScheduler taking "requirements" and producing
+        "spec", "design", "generated_code", "conjugation_table" (a Future
+        resolving to the table build result) and "test_code" (plus
+        "validation" with a validation agent)
+    """
+    stages = [
+        PipelineStage(
+            "parse", parser_agent.parse_requirements,
+            inputs=["requirements"], outputs=["spec"],
+            label="📝 Parsing requirements",
+        ),
+        PipelineStage(
+            "design", design_agent.create_design,
+            inputs=["spec"], outputs=["design"],
+            label="🎨 Creating design",
+        ),
+        PipelineStage(
+            "codegen", partial(code_gen_agent.generate_code, on_chunk=on_chunk),
+            inputs=["spec", "design"], outputs=["generated_code"],
+            label="💻 Generating code", weight=2.0,
+        ),
+        PipelineStage(
+            "table", code_gen_agent.start_conjugation_table,
+            inputs=["generated_code"], outputs=["conjugation_table"],
+            label="🗄️ Starting conjugation table build", weight=0.1,
+        ),
+        PipelineStage(
+            "tests", partial(test_agent.generate_tests, on_chunk=on_chunk),
+            inputs=["spec"], outputs=["test_code"],
+            label="🧪 Generating tests",
+        ),
+    ]
+    if validation_agent is not None:
+        stages.append(PipelineStage(
+            "validate", validation_agent.validate,
+            inputs=["generated_code", "test_code"], outputs=["validation"],
+            label="🔬 Running generated tests",
+        ))
+    return PipelineScheduler(stages)
@@ -0,0 +1,155 @@
+# Rule Parser - Local keyword extractor for common requirement texts
+# Author: [Your Name] - [Student ID]
+#
+# Most requirement texts are short lists such as "English and Spanish,
+# present, past and future, irregular verbs". They are tokenized and every
+# token must be either a known keyword phrase (language, tense, mood, person,
+# dataset) or a filler word. Anything else -- an unknown language, a
+# negation, "all tenses", extra feature requests -- makes the input
+# ambiguous and it is left to the LLM.
+
+import re
+from typing import Dict, List, Optional, Tuple
+from mcp import RequirementSpec
+
+# Languages mlconjug3 can conjugate, keyed by the words users write
+LANGUAGES = {
+    "english": "English",
+    "spanish": "Spanish", "español": "Spanish", "espanol": "Spanish", "castilian": "Spanish",
+    "french": "French", "français": "French", "francais": "French",
+    "italian": "Italian", "italiano": "Italian",
+    "portuguese": "Portuguese", "português": "Portuguese", "portugues": "Portuguese",
+    "romanian": "Romanian", "română": "Romanian", "romana": "Romanian",
+}
+
+TENSES = {
+    "present": "present",
+    "simple present": "present",
+    "present simple": "present",
+    "present perfect": "present perfect",
+    "present progressive": "present progressive",
+    "present continuous": "present progressive",
+    "past": "past",
+    "simple past": "past",
+    "past simple": "past",
+    "past perfect": "past perfect",
+    "pluperfect": "past perfect",
+    "preterite": "preterite",
+    "preterit": "preterite",
+    "imperfect": "imperfect",
+    "future": "future",
+    "simple future": "future",
+    "future perfect": "future perfect",
+    "conditional": "conditional",
+}
+
+MOODS = {
+    "indicative": "indicative",
+    "subjunctive": "subjunctive",
+    "imperative": "imperative",
+}
+
+PERSONS = [
+    "first person singular",
+    "second person singular",
+    "third person singular",
+    "first person plural",
+    "second person plural",
+    "third person plural",
+]
+
+DATASETS = {
+    "mlconjug3": "mlconjug3",
+    "mlconjug": "mlconjug3",
+}
+
+# Words that carry no requirement on their own
+FILLER = frozenset("""
+    a an the and or plus also both as well of in for to on with using via into
+    i we you it this that which should must can could will would shall please
+    need needs want wants like create build make write generate develop
+    implement design produce give provide support supports supporting supported
+    handle handles handling handled include includes including included
+    cover covers covering
+    simple basic small little only just
+    verb verbs conjugator conjugators conjugation conjugations conjugate
+    conjugates conjugating application app tool program module script
+    tense tenses language languages mood moods form forms is are be
+""".split())
+
+# Longest keyword phrase, in words
+_MAX_PHRASE = 3
+
+def _phrase_table() -> Dict[Tuple[str, ...], Tuple[str, str]]:
+    """Map each keyword phrase (as a token tuple) to its (kind, value)"""
+    table: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+    for kind, mapping in (("language", LANGUAGES), ("tense", TENSES), ("mood", MOODS), ("dataset", DATASETS)):
+        for phrase, value in mapping.items():
+            table[tuple(phrase.split())] = (kind, value)
+    for person in PERSONS:
+        ordinal, _, number = person.split()
+        table[(ordinal, "person", number)] = ("person", person)
+        table[({"first": "1st", "second": "2nd", "third": "3rd"}[ordinal], "person", number)] = ("person", person)
+    for words in (("all", "persons"), ("all", "pronouns"), ("every", "person")):
+        table[words] = ("person", "*")
+    table[("irregular",)] = ("irregular", "irregular")
+    table[("regular",)] = ("irregular", "regular")
+    return table
+
+_PHRASES = _phrase_table()
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+def _append_unique(values: List[str], value: str) -> None:
+    """Append value unless already present (keeps first-mention order)"""
+    if value not in values:
+        values.append(value)
+
+def extract_spec(user_input: str) -> Optional[RequirementSpec]:
+    """
+    Build a RequirementSpec from the requirement text without an LLM
+
+    Args:
+        user_input: Natural language requirements
+
+    Returns:
+        RequirementSpec when every word is understood and at least one
+        language and one tense are named; None when the input is ambiguous
+    """
+    tokens = _TOKEN.findall(user_input.lower())
+    found: Dict[str, List[str]] = {"language": [], "tense": [], "mood": [], "person": [], "dataset": [], "irregular": []}
+
+    i = 0
+    while i < len(tokens):
+        for size in range(min(_MAX_PHRASE, len(tokens) - i), 0, -1):
+            match = _PHRASES.get(tuple(tokens[i:i + size]))
+            if match:
+                kind, value = match
+                _append_unique(found[kind], value)
+                i += size
+                break
+        else:
+            if tokens[i] not in FILLER:
+                return None
+            i += 1
+
+    if not found["language"] or not found["tense"]:
+        return None
+
+    # "regular verbs" without "irregular" may mean regular verbs only
+    if found["irregular"] == ["regular"]:
+        return None
+
+    persons = found["person"]
+    if not persons or "*" in persons:
+        persons = list(PERSONS)
+
+    return RequirementSpec(
+        languages=found["language"],
+        tenses=found["tense"],
+        persons=persons,
+        moods=found["mood"] or ["indicative"],
+        handle_irregular=True,
+        dataset_sources=found["dataset"],
+        additional_requirements="",
+    )
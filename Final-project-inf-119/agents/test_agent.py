@@ -1,7 +1,7 @@
 # Test Generation Agent - Generates test cases for the application
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, List
+from typing import Callable, Optional, List
 from mcp import MCPClient, AgentRole, RequirementSpec, GeneratedCode, TestCase
 from agents.tracking_agent import TrackingAgent
 from utils.helpers import clean_code_block, save_to_file
@@ -12,29 +12,74 @@ class TestAgent:
     Agent responsible for generating comprehensive test cases
     """
     
-    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None):
-        """Initialize test generation agent"""
+    def __init__(self, tracking_agent: TrackingAgent, mcp_client: Optional[MCPClient] = None,
+                 output_dir: str = TESTS_DIR):
+        """
+        Initialize test generation agent
+
+        Args:
+            tracking_agent: Tracking agent for LLM calls
+            mcp_client: MCP client for communication
+            output_dir: Directory the generated tests are written to
+        """
         self.tracking_agent = tracking_agent
         self.mcp_client = mcp_client
+        self.output_dir = output_dir
     
-    def generate_tests(self, spec: RequirementSpec, generated_code: List[GeneratedCode]) -> str:
+    def generate_tests(self, spec: RequirementSpec, generated_code: Optional[List[GeneratedCode]] = None,
+                       on_chunk: Optional[Callable[[str, str], None]] = None) -> str:
         """
         Generate test cases for the application
 
+        Args:
+            spec: Requirement specification
+            generated_code: List of generated code files (unused by the
+                prompt, which only needs the spec)
+            on_chunk: Optional callback receiving (filename, text chunk) as
+                the response streams in
+
+        Returns:
+            Test file content as string
+        """
+        test_code = self.tracking_agent.generate_content(
+            self._start(spec, generated_code),
+            on_chunk=self._stream_to(on_chunk),
+            agent=AgentRole.TEST_GEN.value
+        )
+        return self._finish(test_code)
+
+    async def agenerate_tests(self, spec: RequirementSpec, generated_code: Optional[List[GeneratedCode]] = None,
+                              on_chunk: Optional[Callable[[str, str], None]] = None) -> str:
+        """
+        Async version of generate_tests
+
         Args:
             spec: Requirement specification
             generated_code: List of generated code files
+            on_chunk: Optional callback receiving (filename, text chunk)
 
         Returns:
             Test file content as string
         """
+        test_code = await self.tracking_agent.agenerate_content(
+            self._start(spec, generated_code),
+            on_chunk=self._stream_to(on_chunk),
+            agent=AgentRole.TEST_GEN.value
+        )
+        return self._finish(test_code)
+
+    def _stream_to(self, on_chunk: Optional[Callable[[str, str], None]]):
+        """Adapt a (filename, chunk) callback to TrackingAgent's chunk callback"""
+        if on_chunk is None:
+            return None
+        return lambda chunk: on_chunk("test_conjugator.py", chunk)
+
+    def _start(self, spec: RequirementSpec, generated_code: Optional[List[GeneratedCode]] = None) -> str:
+        """Notify that test generation started and build the LLM prompt"""
         if self.mcp_client:
             self.mcp_client.notify({"event": "test_generation_started"})
 
-        # Get the main conjugator code (not used directly here, but kept for context)
-        conjugator_code = next((gc for gc in generated_code if "conjugator" in gc.filename), None)
-
-        prompt = f"""
+        return f"""
 You are writing pytest tests for verb_conjugator.py.
 
 The module under test provides this public API:
@@ -91,7 +136,8 @@ Write a single test file named test_conjugator.py that:
 Return ONLY the full Python source code for test_conjugator.py, with no surrounding backticks.
 """
 
-        test_code = self.tracking_agent.generate_content(prompt)
+    def _finish(self, test_code: str) -> str:
+        """Clean up and save the generated test file"""
         test_code = clean_code_block(test_code)
 
         # Ensure proper imports
@@ -99,7 +145,7 @@ Return ONLY the full Python source code for test_conjugator.py, with no surround
             test_code = "import pytest\n" + test_code
 
         # Save test file
-        test_filepath = f"{TESTS_DIR}/test_conjugator.py"
+        test_filepath = f"{self.output_dir}/test_conjugator.py"
         save_to_file(test_code, test_filepath)
 
         if self.mcp_client:
@@ -0,0 +1,289 @@
+import importlib.util
+import logging
+import sys
+import threading
+import types
+import pytest
+from mcp import RequirementSpec, DesignSpec
+from agents import FakeBackend, TrackingAgent, CodeGenAgent
+from agents.code_templates import COMMON_VERBS, render_conjugator, render_ui
+from utils.rate_limiter import RateLimiter
+
+# Template-rendered verb_conjugator.py
+def _design():
+    return DesignSpec(architecture="a", modules=[], data_schema={}, dependencies=[], implementation_notes="")
+
+class _FakeVerb:
+    def __init__(self, info):
+        self.conjug_info = info
+
+class _FakeConjugator:
+    """mlconjug3.Conjugator stand-in returning one form per pronoun"""
+    INFO = {
+        "en": ("indicative", ["indicative present", "indicative past tense"], ["I", "you", "he/she/it", "we", "they"]),
+        "fr": ("Indicatif", ["Présent", "Imparfait"], ["je", "tu", "il/elle", "nous", "ils/elles"]),
+    }
+
+    def __init__(self, language):
+        self.language = language
+
+    def conjugate(self, verb):
+        mood, tenses, pronouns = self.INFO[self.language]
+        return _FakeVerb({mood: {t: {p: f"{verb}-{t}-{p}" for p in pronouns} for t in tenses}})
+
+def _load_rendered(code, monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "mlconjug3", types.SimpleNamespace(Conjugator=_FakeConjugator))
+    path = tmp_path / "verb_conjugator.py"
+    path.write_text(code, encoding="utf-8")
+    module = types.ModuleType("verb_conjugator")
+    module.__file__ = str(path)
+    exec(compile(code, str(path), "exec"), module.__dict__)
+    return module
+
+def test_conjugator_template_renders_spec_languages_and_tenses(tmp_path, monkeypatch):
+    spec = RequirementSpec(languages=["French"], tenses=["present", "imperfect"], persons=[])
+    module = _load_rendered(render_conjugator(spec), monkeypatch, tmp_path)
+
+    assert module.conjugate_verb("French", " Parler ", "IMPERFECT")["Nous"] == "parler-Imparfait-nous"
+    assert module.conjugate_verb("en", "walk", "present")["He/She/It"] == "walk-indicative present-he/she/it"
+    with pytest.raises(module.ConjugationError, match="Unsupported language: es"):
+        module.conjugate_verb("es", "hablar", "present")
+    with pytest.raises(module.ConjugationError, match="Unsupported tense: future"):
+        module.conjugate_verb("French", "parler", "future")
+    with pytest.raises(module.ConjugationError, match="Unsupported tense: imperfect"):
+        module.conjugate_verb("English", "walk", "imperfect")
+    with pytest.raises(module.ConjugationError, match="nonexistentverb"):
+        module.conjugate_verb("English", "nonexistentverb", "present")
+
+def test_conjugator_template_defers_unexpressible_specs_to_llm(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert render_conjugator(RequirementSpec(languages=["German"], tenses=["present"], persons=[])) is None
+    assert render_conjugator(RequirementSpec(languages=["English"], tenses=["imperfect"], persons=[])) is None
+    assert render_conjugator(RequirementSpec(languages=["English"], tenses=["present"], persons=[], moods=["subjunctive"])) is None
+    assert render_conjugator(RequirementSpec(languages=["English"], tenses=["present"], persons=[],
+                                             additional_requirements="Add a CSV export")) is None
+
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    design = _design()
+    code_gen = CodeGenAgent(agent, output_dir=str(tmp_path))
+    files = code_gen.generate_code(RequirementSpec(languages=["German"], tenses=["present"], persons=[]), design)
+    files += code_gen.generate_code(RequirementSpec(languages=["Spanish"], tenses=["past"], persons=[]), design)
+
+    assert "generated by the Language Verb Conjugator Factory" not in files[0].code
+    assert "generated by the Language Verb Conjugator Factory" in files[2].code
+    fast_path = agent.get_usage_report()["fastPath"]["code_gen"]
+    assert (fast_path["hits"], fast_path["misses"]) == (1, 1)
+
+def test_generated_conjugator_caches_models_and_memoizes(tmp_path, monkeypatch):
+    loads = []
+    conjugations = []
+
+    class _CountingConjugator(_FakeConjugator):
+        def __init__(self, language):
+            loads.append(language)
+            super().__init__(language)
+
+        def conjugate(self, verb):
+            conjugations.append(verb)
+            return super().conjugate(verb)
+
+    spec = RequirementSpec(languages=["English", "French"], tenses=["present"], persons=[])
+    module = _load_rendered(render_conjugator(spec), monkeypatch, tmp_path)
+    monkeypatch.setattr(sys.modules["mlconjug3"], "Conjugator", _CountingConjugator)
+
+    first = module.conjugate_verb("English", "walk", "present")
+    first["I"] = "changed"
+    for _ in range(100):
+        assert module.conjugate_verb("en", " WALK ", "Present")["I"] == "walk-indicative present-I"
+    module.conjugate_verb("French", "parler", "present")
+    module.conjugate_verb("fr", "finir", "present")
+
+    assert loads == ["en", "fr"]
+    assert conjugations == ["walk", "parler", "finir"]
+    assert module._RESOLVED_KEYS[("fr", "present")] == ("Indicatif", "Présent")
+
+    module.clear_cache()
+    module.conjugate_verb("English", "walk", "present")
+    assert conjugations[-1] == "walk" and loads == ["en", "fr"]
+
+# Precomputed conjugation table next to verb_conjugator.py
+FAKE_MLCONJUG3 = '''
+PRONOUNS = {"en": ["I", "you", "he/she/it", "we", "they"], "fr": ["je", "tu", "il/elle", "nous", "ils/elles"]}
+MOODS = {"en": ("indicative", "indicative present"), "fr": ("Indicatif", "Présent")}
+
+class _Verb:
+    def __init__(self, info):
+        self.conjug_info = info
+
+class _Manager:
+    def __init__(self, language):
+        self.verbs = {"en": {"walk": 0, "jump": 0}, "fr": {"parler": 0}}[language]
+
+class Conjugator:
+    def __init__(self, language="en"):
+        self.language = language
+        self.conjug_manager = _Manager(language)
+
+    def conjugate(self, verb):
+        mood, tense = MOODS[self.language]
+        return _Verb({mood: {tense: {p: verb + "/" + p for p in PRONOUNS[self.language]}}})
+'''
+
+class _NoModel:
+    def __init__(self, language):
+        raise AssertionError("model loaded for a verb in the table")
+
+def test_code_gen_builds_conjugation_table_in_parallel(tmp_path, monkeypatch):
+    package = tmp_path / "site" / "mlconjug3"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(FAKE_MLCONJUG3, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path / "site"))
+
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    code_gen = CodeGenAgent(agent, output_dir=str(tmp_path / "app"))
+    spec = RequirementSpec(languages=["English", "French"], tenses=["present"], persons=[])
+    files = code_gen.generate_code(spec, _design())
+    table = code_gen.build_conjugation_table(files)
+
+    assert table["status"] == "built", table["error"]
+    assert (tmp_path / "app" / "conjugations.sqlite3").exists()
+    # Common verbs plus the fake model's verb list, one tense each
+    assert table["rows"]["en"] == len(set(COMMON_VERBS["en"].split()) | {"walk", "jump"})
+
+    module = _load_rendered(files[0].code, monkeypatch, tmp_path / "app")
+    monkeypatch.setattr(sys.modules["mlconjug3"], "Conjugator", _NoModel)
+    assert module.conjugate_verb("French", "parler", "present")["Nous"] == "parler/nous"
+    assert module.conjugate_verb("English", "jump", "present")["We"] == "jump/we"
+    with pytest.raises(AssertionError, match="model loaded"):
+        module.conjugate_verb("English", "zigzag", "present")
+
+def test_conjugation_table_is_not_installed_for_a_regenerated_app(tmp_path, monkeypatch):
+    package = tmp_path / "site" / "mlconjug3"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(FAKE_MLCONJUG3, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path / "site"))
+
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    code_gen = CodeGenAgent(agent, output_dir=str(tmp_path / "app"))
+    first = code_gen.generate_code(RequirementSpec(languages=["English"], tenses=["present"], persons=[]), _design())
+    # A second generation overwrites the app before the first build runs
+    code_gen.generate_code(RequirementSpec(languages=["French"], tenses=["present"], persons=[]), _design())
+    table = code_gen.build_conjugation_table(first)
+
+    assert table["status"] == "skipped" and "regenerated" in table["error"]
+    assert sorted(p.name for p in (tmp_path / "app").iterdir()) == ["gradio_ui.py", "verb_conjugator.py"]
+
+def test_conjugation_table_build_failure_is_reported(tmp_path, monkeypatch):
+    package = tmp_path / "site" / "mlconjug3"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("raise ImportError('mlconjug3 is broken')", encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path / "site"))
+
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    code_gen = CodeGenAgent(agent, output_dir=str(tmp_path / "app"))
+    spec = RequirementSpec(languages=["English"], tenses=["present"], persons=[])
+    files = code_gen.generate_code(spec, _design())
+    table = code_gen.build_conjugation_table(files)
+
+    assert table["status"] == "failed" and "mlconjug3 is broken" in table["error"]
+    assert not (tmp_path / "app" / "conjugations.sqlite3").exists()
+
+    module = _load_rendered(files[0].code, monkeypatch, tmp_path / "app")
+    monkeypatch.setitem(sys.modules, "mlconjug3", None)
+    with pytest.raises(module.ConjugationError, match="mlconjug3 is not installed"):
+        module.conjugate_verb("English", "walk", "present")
+    assert set(module.preload()) == {"en"}
+
+# Batch API of the generated conjugator
+def test_generated_conjugate_many_dedupes_and_keeps_order(tmp_path, monkeypatch):
+    conjugations = []
+
+    class _CountingConjugator(_FakeConjugator):
+        def conjugate(self, verb):
+            conjugations.append(verb)
+            return super().conjugate(verb)
+
+    spec = RequirementSpec(languages=["English", "French"], tenses=["present"], persons=[])
+    module = _load_rendered(render_conjugator(spec), monkeypatch, tmp_path)
+    monkeypatch.setattr(sys.modules["mlconjug3"], "Conjugator", _CountingConjugator)
+
+    results = module.conjugate_many("English", ["walk", " Walk", "jump", "", "walk"], ["present", "future"])
+    assert [r["present"]["I"] if isinstance(r["present"], dict) else None for r in results] == [
+        "walk-indicative present-I", "walk-indicative present-I", "jump-indicative present-I", None,
+        "walk-indicative present-I",
+    ]
+    assert str(results[3]["present"]) == "Verb cannot be empty"
+    assert all(str(r["future"]) == "Unsupported tense: future" for r in results if r is not results[3])
+    assert conjugations == ["walk", "jump"]
+
+    mixed = module.conjugate_many(["fr", "German", "English"], ["parler", "gehen", "walk"], "present")
+    assert mixed[0]["present"]["Je"] == "parler-Présent-je"
+    assert str(mixed[1]["present"]) == "Unsupported language: German"
+    assert mixed[2]["present"] == module.conjugate_verb("English", "walk", "present")
+    with pytest.raises(ValueError):
+        module.conjugate_many(["English"], ["walk", "jump"], "present")
+
+def test_generated_conjugate_many_uses_worker_processes(tmp_path, monkeypatch):
+    spec = RequirementSpec(languages=["English", "French"], tenses=["present"], persons=[])
+    path = tmp_path / "verb_conjugator.py"
+    path.write_text(render_conjugator(spec), encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "mlconjug3", types.SimpleNamespace(Conjugator=_FakeConjugator))
+    module_spec = importlib.util.spec_from_file_location("verb_conjugator", path)
+    module = importlib.util.module_from_spec(module_spec)
+    monkeypatch.setitem(sys.modules, "verb_conjugator", module)
+    module_spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "PARALLEL_MIN_BATCH", 10)
+
+    verbs = [f"verb{i % 30}" for i in range(60)]
+    languages = ["English" if i % 2 else "French" for i in range(60)]
+    parallel = module.conjugate_many(languages, verbs, "present", processes=2)
+    module.clear_cache()
+    assert parallel == module.conjugate_many(languages, verbs, "present")
+    assert parallel[1]["present"]["We"] == "verb1-indicative present-we"
+
+# Preloading in the generated gradio_ui.py
+def test_generated_ui_preloads_models_and_logs_latency(tmp_path, monkeypatch, caplog):
+    preloaded = []
+    release = threading.Event()
+    conjugator = types.ModuleType("verb_conjugator")
+    conjugator.ConjugationError = type("ConjugationError", (Exception,), {})
+    conjugator.conjugate_verb = lambda language, verb, tense: {"I": verb + "ed"}
+    conjugator.preload = lambda languages: (release.wait(5), preloaded.append(list(languages)))
+    monkeypatch.setitem(sys.modules, "verb_conjugator", conjugator)
+
+    code = render_ui(RequirementSpec(languages=["English", "Spanish"], tenses=["Past"], persons=[]))
+    ui = types.ModuleType("gradio_ui")
+    exec(compile(code, str(tmp_path / "gradio_ui.py"), "exec"), ui.__dict__)
+
+    readiness = ui.watch_readiness()
+    assert next(readiness).startswith("⏳")
+    with caplog.at_level(logging.INFO, logger="gradio_ui"):
+        release.set()
+        assert next(readiness).startswith("✅ Ready")
+        assert ui.conjugate("walk", "English", "Past") == "I: walked"
+        ui.conjugate("jump", "English", "Past")
+
+    assert preloaded == [["English", "Spanish"]]
+    assert ui.start_preload() is ui.start_preload()
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("Preloaded 2 language(s)") for m in messages)
+    assert sum(m.startswith("First request took") for m in messages) == 1
+    assert render_ui(RequirementSpec(languages=["English"], tenses=["present"], persons=[],
+                                     additional_requirements="Dark theme")) is None
+
+def test_code_gen_templates_replace_both_llm_calls(tmp_path):
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    code_gen = CodeGenAgent(agent, output_dir=str(tmp_path))
+    spec = RequirementSpec(languages=["English"], tenses=["present"], persons=[])
+
+    files = code_gen.generate_code(spec, _design())
+    assert [f.filename for f in files] == ["verb_conjugator.py", "gradio_ui.py"]
+    assert agent.get_usage_report()["usage"]["fake-model"]["numApiCalls"] == 0
+
+    # A spec the templates cannot express sends both files to the model
+    code_gen.generate_code(spec.model_copy(update={"additional_requirements": "Dark theme"}), _design())
+    report = agent.get_usage_report()
+    assert report["usage"]["fake-model"]["numApiCalls"] == 2
+    assert {name: (stats["hits"], stats["misses"]) for name, stats in report["fastPath"].items()} == {
+        "code_gen": (1, 1), "ui_gen": (1, 1),
+    }
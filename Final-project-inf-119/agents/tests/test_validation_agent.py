@@ -0,0 +1,89 @@
+import threading
+import pytest
+from agents import (
+    FakeBackend, TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent, ValidationAgent,
+    build_factory_pipeline,
+)
+from agents.validation_agent import collect_tests
+from utils.rate_limiter import RateLimiter
+
+# Validation stage: generated tests in isolated subprocesses
+GENERATED_TESTS = '''
+import time
+from verb_conjugator import shout
+
+def test_shout():
+    assert shout("hi") == "HI"
+
+def test_wrong():
+    assert shout("hi") == "hi"
+
+class TestSlow:
+    def test_hangs(self):
+        time.sleep(30)
+
+def helper():
+    pass
+'''
+
+def test_collect_tests_lists_functions_and_class_methods():
+    assert collect_tests(GENERATED_TESTS) == ["test_shout", "test_wrong", "TestSlow::test_hangs"]
+    with pytest.raises(SyntaxError):
+        collect_tests("def test_(:")
+
+def test_validation_agent_runs_tests_isolated_with_timeout(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "verb_conjugator.py").write_text("def shout(text):\n    return text.upper()\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_conjugator.py").write_text(GENERATED_TESTS)
+
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    validator = ValidationAgent(agent, conjugator_dir=str(tmp_path / "app"), tests_dir=str(tmp_path / "tests"),
+                                workers=3, timeout=5)
+    summary = validator.validate()
+
+    outcomes = {test["name"]: test["outcome"] for test in summary["tests"]}
+    assert outcomes == {"test_shout": "passed", "test_wrong": "failed", "TestSlow::test_hangs": "timeout"}
+    assert (summary["status"], summary["total"], summary["passed"], summary["timeouts"]) == ("failed", 3, 1, 1)
+    assert summary["passRate"] == pytest.approx(0.333)
+    assert "AssertionError" in next(t["output"] for t in summary["tests"] if t["name"] == "test_wrong")
+    # Tests overlap, so the wall time stays near the slowest one
+    assert summary["wallSeconds"] < summary["testSeconds"]["max"] + 3
+    report = agent.get_usage_report()["validation"]
+    assert report["passed"] == 1 and all("output" not in test for test in report["tests"])
+    assert not (tmp_path / "tests" / ".pytest_cache").exists()
+
+    assert validator.validate(test_code="def helper(): pass")["status"] == "error"
+
+@pytest.fixture
+def table_release(monkeypatch):
+    """Hold conjugation table builds until set, or until the test ends"""
+    release = threading.Event()
+
+    def build(self, generated_code):
+        release.wait()
+        return {"status": "built"}
+
+    monkeypatch.setattr(CodeGenAgent, "build_conjugation_table", build)
+    try:
+        yield release
+    finally:
+        # Frees the shared table build worker for later tests
+        release.set()
+
+def test_pipeline_validates_generated_app(tmp_path, monkeypatch, table_release):
+    # Validation must not wait for the (slow, optional) conjugation table
+    monkeypatch.chdir(tmp_path)
+    agent = TrackingAgent(backend=FakeBackend(), rate_limiter=RateLimiter(None, None))
+    code_gen, test_gen = CodeGenAgent(agent), TestAgent(agent)
+    pipeline = build_factory_pipeline(
+        ParserAgent(agent), DesignAgent(agent), code_gen, test_gen,
+        validation_agent=ValidationAgent(agent, conjugator_dir=code_gen.output_dir, tests_dir=test_gen.output_dir),
+    )
+
+    values = pipeline.run({"requirements": "English present"})
+    assert values["validation"]["total"] == len(collect_tests(values["test_code"])) > 0
+    assert agent.get_usage_report()["validation"]["total"] == values["validation"]["total"]
+    assert not values["conjugation_table"].done()
+    table_release.set()
+    assert values["conjugation_table"].result(timeout=5) == {"status": "built"}
@@ -1,11 +1,21 @@
 # Tracking Agent - Monitors and reports model usage
 # Author: [Your Name] - [Student ID]
 
-import google.generativeai as genai
-from typing import Dict, Optional
-from mcp import MCPClient, AgentRole, UsageStats
-from config.api_config import GOOGLE_API_KEY, MODEL_NAME, USAGE_REPORT_FILE
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+from mcp import MCPClient, AgentRole, UsageStats, CallRecord, FastPathStats
+from agents.backends import ModelBackend, create_backend
+from config.api_config import (
+    USAGE_REPORT_FILE, RESPONSE_CACHE_ENABLED,
+    LLM_MAX_CONCURRENCY, LLM_MAX_RETRIES, CALL_LOG_SIZE,
+)
 from utils.helpers import save_json
+from utils.metrics import CallMetrics
+from utils.rate_limiter import RateLimiter, get_shared_rate_limiter, is_retryable_error, backoff_delay
+from utils.response_cache import ResponseCache
 
 class TrackingAgent:
     """
@@ -13,80 +23,262 @@ class TrackingAgent:
     Wraps LLM calls and maintains usage statistics
     """
     # Initialize the tracking agent
-    def __init__(self, mcp_client: Optional[MCPClient] = None):
+    def __init__(
+        self,
+        mcp_client: Optional[MCPClient] = None,
+        cache: Optional[ResponseCache] = None,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = LLM_MAX_RETRIES,
+        backend: Optional[ModelBackend] = None,
+        call_slots: Optional[threading.BoundedSemaphore] = None,
+    ):
         """
         Initialize tracking agent
         
         Args:
             mcp_client: MCP client for communication
+            cache: Optional response cache; one is created when
+                RESPONSE_CACHE_ENABLED is set and none is given
+            max_concurrency: Maximum number of model calls in flight at once
+            rate_limiter: Request/token quota; defaults to the limiter shared
+                by every agent in the process
+            max_retries: Retries for quota and transient errors
+            backend: Model backend; defaults to the one named by MODEL_BACKEND
+            call_slots: Semaphore shared with other tracking agents to cap
+                their combined in-flight calls (overrides max_concurrency)
         """
         self.mcp_client = mcp_client
         
-        # Configure Gemini API
-        genai.configure(api_key=GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel(model_name=MODEL_NAME)
+        # Caps in-flight model calls across threads and event loops
+        self.max_concurrency = max_concurrency
+        self._call_slots = call_slots or threading.BoundedSemaphore(max_concurrency)
+        
+        # Client-side quota and retry policy
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.max_retries = max_retries
+        
+        # Response cache is opt-in
+        if cache is None and RESPONSE_CACHE_ENABLED:
+            cache = ResponseCache()
+        self.cache = cache
+        
+        # Model backend (Gemini unless configured otherwise)
+        self.backend = backend or create_backend()
+        self.model_name = self.backend.model_name
         
         # Usage statistics per model
         self.usage_stats: Dict[str, UsageStats] = {}
         
         # Initialize stats for the model
-        if MODEL_NAME not in self.usage_stats:
-            self.usage_stats[MODEL_NAME] = UsageStats(model_name=MODEL_NAME)
+        if self.model_name not in self.usage_stats:
+            self.usage_stats[self.model_name] = UsageStats(model_name=self.model_name)
+        
+        # Per-call metrics: recent call log plus histograms per model and per agent
+        self.call_log = deque(maxlen=CALL_LOG_SIZE)
+        self.model_metrics: Dict[str, CallMetrics] = {}
+        self.agent_metrics: Dict[str, CallMetrics] = {}
+        
+        # Inputs agents handled locally instead of calling the model
+        self.fast_path_stats: Dict[str, FastPathStats] = {}
+        
+        # Latest validation run of the generated app (see ValidationAgent)
+        self.validation: Optional[Dict] = None
+        self._stats_lock = threading.Lock()
     
     # Generate content and track usage
-    def generate_content(self, prompt: str, **kwargs) -> str:
+    def generate_content(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None,
+                         agent: Optional[str] = None, **kwargs) -> str:
         """
         Generate content using the LLM and track usage
         
         Args:
             prompt: Prompt for the model
+            on_chunk: Optional callback; when given the response is streamed
+                and each text chunk is passed to it as it arrives
+            agent: Name of the calling agent, used to break down metrics
             **kwargs: Additional arguments for generation
             
         Returns:
-            Generated text
+            Generated text (the full response, also in streaming mode)
         """
-        try:
-            # Make API call
-            response = self.model.generate_content(prompt, **kwargs)
+        # Serve identical calls from cache when enabled
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(self.model_name, prompt, kwargs)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                with self._stats_lock:
+                    self.usage_stats[self.model_name].add_cache_hit(cached["tokens"], cached["latency"])
+                
+                if self.mcp_client:
+                    self.mcp_client.notify({
+                        "event": "cache_hit",
+                        "model": self.model_name,
+                        "tokens": cached["tokens"]
+                    })
+                
+                if on_chunk:
+                    on_chunk(cached["text"])
+                return cached["text"]
+        
+        stats = self.usage_stats[self.model_name]
+        estimated_tokens = len(prompt) // 4
+        
+        # Remember whether any chunk reached the caller; a partially
+        # streamed response cannot be retried without duplicating output
+        streamed = []
+        forward = None
+        if on_chunk:
+            def forward(chunk: str):
+                streamed.append(chunk)
+                on_chunk(chunk)
+        
+        attempt = 0
+        while True:
+            # Wait for room in the shared request/token quota
+            waited = self.rate_limiter.acquire(estimated_tokens)
+            with self._stats_lock:
+                stats.rate_limit_wait += waited
             
-            # Extract token usage from response metadata
-            # Note: Gemini API provides usage metadata
-            tokens_used = 0
-            if hasattr(response, 'usage_metadata'):
-                tokens_used = (
-                    response.usage_metadata.prompt_token_count + 
-                    response.usage_metadata.candidates_token_count
-                )
+            started = None
+            try:
+                # Make API call
+                with self._call_slots:
+                    started = time.perf_counter()
+                    response = self.backend.generate(prompt, on_chunk=forward, **kwargs)
+                    latency = time.perf_counter() - started
+                break
+                
+            except Exception as e:
+                # Track failed calls too (latency only; no tokens are reported)
+                failed_latency = time.perf_counter() - started if started else 0.0
+                self._record_call(agent, failed_latency, 0, 0, success=False)
+                self.rate_limiter.record_tokens(estimated_tokens, 0)
+                
+                if attempt >= self.max_retries or streamed or not is_retryable_error(e):
+                    if self.mcp_client:
+                        self.mcp_client.send_error(
+                            AgentRole.TRACKING,
+                            f"API call failed: {str(e)}"
+                        )
+                    raise e
+                
+                # Back off with jitter before trying again
+                delay = backoff_delay(attempt)
+                with self._stats_lock:
+                    stats.add_retry(delay)
+                time.sleep(delay)
+                attempt += 1
+        
+        tokens_used = response.total_tokens
+        text = response.text
+        
+        # Track the API call
+        self._record_call(agent, latency, response.prompt_tokens, response.output_tokens, success=True)
+        self.rate_limiter.record_tokens(estimated_tokens, tokens_used)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, text, tokens_used, latency)
+        
+        # Notify via MCP if available
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "api_call",
+                "model": self.model_name,
+                "tokens": tokens_used
+            })
+        
+        return text
+    
+    def _record_call(self, agent: Optional[str], latency: float, prompt_tokens: int,
+                     output_tokens: int, success: bool) -> None:
+        """
+        Record one model call in the usage stats and metrics
+        
+        Args:
+            agent: Calling agent name (None if unknown)
+            latency: Wall-clock seconds of the call
+            prompt_tokens: Prompt tokens consumed
+            output_tokens: Output tokens produced
+            success: Whether the call succeeded
+        """
+        tokens_per_second = output_tokens / latency if success and latency > 0 else None
+        record = CallRecord(
+            model_name=self.model_name,
+            agent=agent,
+            latency=latency,
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+            tokens_per_second=tokens_per_second or 0.0,
+            success=success,
+        )
+        
+        with self._stats_lock:
+            stats = self.usage_stats[self.model_name]
+            if success:
+                stats.add_call(prompt_tokens + output_tokens)
             else:
-                # Estimate tokens if not available (rough estimate: 1 token ≈ 4 chars)
-                tokens_used = (len(prompt) + len(response.text)) // 4
-            
-            # Track the API call
-            self.usage_stats[MODEL_NAME].add_call(tokens_used)
-            
-            # Notify via MCP if available
-            if self.mcp_client:
-                self.mcp_client.notify({
-                    "event": "api_call",
-                    "model": MODEL_NAME,
-                    "tokens": tokens_used
-                })
-            
-            return response.text
+                stats.num_api_calls += 1
             
-        except Exception as e:
-            # Track failed calls too
-            self.usage_stats[MODEL_NAME].num_api_calls += 1
-            
-            if self.mcp_client:
-                self.mcp_client.send_error(
-                    AgentRole.TRACKING,
-                    f"API call failed: {str(e)}"
-                )
+            self.call_log.append(record)
+            for metrics, key in ((self.model_metrics, self.model_name), (self.agent_metrics, agent or "unknown")):
+                if key not in metrics:
+                    metrics[key] = CallMetrics()
+                metrics[key].record(latency, prompt_tokens, output_tokens, success, tokens_per_second)
+    
+    def record_fast_path(self, agent: str, hit: bool, seconds: float = 0.0) -> None:
+        """
+        Record whether an agent's local fast path handled an input
+        
+        Args:
+            agent: Agent name
+            hit: True if the input was handled without calling the model
+            seconds: Time the local path took (hits only)
+        """
+        with self._stats_lock:
+            if agent not in self.fast_path_stats:
+                self.fast_path_stats[agent] = FastPathStats(agent=agent)
+            if hit:
+                self.fast_path_stats[agent].add_hit(seconds)
+            else:
+                self.fast_path_stats[agent].add_miss()
+    
+    def record_validation(self, summary: Dict) -> None:
+        """
+        Record the result of running the generated tests
+        
+        Args:
+            summary: Validation summary; per-test output is left out of the report
+        """
+        report = dict(summary)
+        report["tests"] = [
+            {key: value for key, value in test.items() if key != "output"}
+            for test in summary.get("tests", [])
+        ]
+        with self._stats_lock:
+            self.validation = report
+    
+    # Generate content without blocking the event loop
+    async def agenerate_content(self, prompt: str, **kwargs) -> str:
+        """
+        Async version of generate_content
+        
+        The call runs in a worker thread so several prompts can be in flight
+        at once; the number of concurrent model calls is still bounded by
+        max_concurrency.
+        
+        Args:
+            prompt: Prompt for the model
+            **kwargs: Additional arguments for generation
             
-            raise e
+        Returns:
+            Generated text
+        """
+        return await asyncio.to_thread(self.generate_content, prompt, **kwargs)
+    
     # Get usage report
-    def get_usage_report(self) -> Dict[str, Dict[str, int]]:
+    def get_usage_report(self) -> Dict[str, Dict]:
         """
         Get usage report in the required format
         
@@ -96,19 +288,78 @@ class TrackingAgent:
         usage = {}
         total_tokens = 0
 
-        for model_name, stats in self.usage_stats.items():
-            usage[model_name] = {
-                "numApiCalls": stats.num_api_calls,
-                "totalTokens": stats.total_tokens,
-            }
-            total_tokens += stats.total_tokens
+        with self._stats_lock:
+            for model_name, stats in self.usage_stats.items():
+                usage[model_name] = self._model_usage(model_name, stats)
+                total_tokens += stats.total_tokens
+
+            by_agent = {name: metrics.summary() for name, metrics in self.agent_metrics.items()}
+            fast_path = {name: self._fast_path_usage(stats) for name, stats in self.fast_path_stats.items()}
+            validation = self.validation
 
         report = {
             "total_tokens": total_tokens,
             "usage": usage,
+            "byAgent": by_agent,
+            "fastPath": fast_path,
+            "validation": validation,
         }
         return report
     
+    def _model_usage(self, model_name: str, stats: UsageStats) -> Dict:
+        """
+        Usage entry for one model (caller holds the stats lock)
+        
+        Args:
+            model_name: Model the entry describes
+            stats: Usage statistics for that model
+            
+        Returns:
+            Dictionary of counters plus latency/throughput percentiles
+        """
+        usage = {
+            "numApiCalls": stats.num_api_calls,
+            "totalTokens": stats.total_tokens,
+            "cacheHits": stats.cache_hits,
+            "cachedTokens": stats.cached_tokens,
+            "latencySavedSeconds": round(stats.cache_latency_saved, 3),
+            "rateLimitWaitSeconds": round(stats.rate_limit_wait, 3),
+            "retries": stats.retries,
+            "retryWaitSeconds": round(stats.retry_wait, 3),
+        }
+        
+        metrics = self.model_metrics.get(model_name)
+        if metrics:
+            summary = metrics.summary()
+            for key in ("failedCalls", "promptTokens", "outputTokens", "latencySeconds", "tokensPerSecond"):
+                usage[key] = summary[key]
+        return usage
+    
+    def _fast_path_usage(self, stats: FastPathStats) -> Dict:
+        """
+        Fast-path entry for one agent (caller holds the stats lock)
+        
+        Saved latency is estimated from the mean latency of the agent's own
+        model calls (or of all calls if the agent has made none yet), less
+        the time spent on the local path.
+        
+        Args:
+            stats: Fast-path statistics for the agent
+            
+        Returns:
+            Dictionary with hits, misses, hit rate and estimated latency saved
+        """
+        metrics = self.agent_metrics.get(stats.agent) or self.model_metrics.get(self.model_name)
+        model_latency = metrics.latency.total / metrics.latency.count if metrics and metrics.latency.count else 0.0
+        saved = max(0.0, stats.hits * model_latency - stats.local_seconds)
+        return {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hitRate": round(stats.hit_rate, 3),
+            "localSeconds": round(stats.local_seconds, 4),
+            "latencySavedSeconds": round(saved, 3),
+        }
+    
     def save_usage_report(self, filepath: str = USAGE_REPORT_FILE):
         """
         Save usage report to JSON file
@@ -128,6 +379,11 @@ class TrackingAgent:
     
     def reset_stats(self):
         """Reset all usage statistics"""
-        for stats in self.usage_stats.values():
-            stats.num_api_calls = 0
-            stats.total_tokens = 0
+        with self._stats_lock:
+            for model_name in list(self.usage_stats):
+                self.usage_stats[model_name] = UsageStats(model_name=model_name)
+            self.call_log.clear()
+            self.model_metrics.clear()
+            self.agent_metrics.clear()
+            self.fast_path_stats.clear()
+            self.validation = None
@@ -0,0 +1,189 @@
+# Validation Agent - Runs the generated tests against the generated app
+# Author: [Your Name] - [Student ID]
+
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from mcp import MCPClient, GeneratedCode
+from agents.tracking_agent import TrackingAgent
+from config.api_config import CONJUGATOR_DIR, TESTS_DIR, VALIDATION_WORKERS, VALIDATION_TEST_TIMEOUT
+from utils.helpers import summarize_latencies
+
+# Generated test file the validation runs
+TEST_FILE = "test_conjugator.py"
+
+# Lines of pytest output kept for each test that did not pass
+OUTPUT_TAIL_LINES = 20
+
+def collect_tests(test_code: str) -> List[str]:
+    """
+    List the tests in a test file without importing it
+
+    Args:
+        test_code: Source of the test file
+
+    Returns:
+        pytest node names ("test_x" or "TestClass::test_x") in file order
+
+    Raises:
+        SyntaxError: If the file does not parse
+    """
+    names = []
+    for node in ast.parse(test_code).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            names.append(node.name)
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test"):
+                    names.append(f"{node.name}::{item.name}")
+    return names
+
+class ValidationAgent:
+    """
+    Agent responsible for checking that the generated app passes its tests
+    Every test runs in its own pytest subprocess (so a crash, hang or
+    leaked state cannot affect the others), spread over a pool of workers,
+    and is killed after a per-test timeout.
+    """
+
+    def __init__(
+        self,
+        tracking_agent: TrackingAgent,
+        mcp_client: Optional[MCPClient] = None,
+        conjugator_dir: str = CONJUGATOR_DIR,
+        tests_dir: str = TESTS_DIR,
+        workers: Optional[int] = VALIDATION_WORKERS,
+        timeout: float = VALIDATION_TEST_TIMEOUT,
+    ):
+        """
+        Initialize validation agent
+
+        Args:
+            tracking_agent: Tracking agent the results are reported to
+            mcp_client: MCP client for communication
+            conjugator_dir: Directory holding the generated application
+            tests_dir: Directory holding the generated tests
+            workers: Tests run at once (default: one per CPU core)
+            timeout: Seconds a single test may take
+        """
+        self.tracking_agent = tracking_agent
+        self.mcp_client = mcp_client
+        self.conjugator_dir = conjugator_dir
+        self.tests_dir = tests_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+
+    def validate(self, generated_code: Optional[List[GeneratedCode]] = None,
+                 test_code: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run the generated tests
+
+        Args:
+            generated_code: Generated application files (already saved)
+            test_code: Generated test file content (already saved); read
+                from tests_dir when not given
+
+        Returns:
+            Summary with status, counts, pass rate, timings and per-test results
+        """
+        if test_code is None:
+            with open(os.path.join(self.tests_dir, TEST_FILE), "r", encoding="utf-8") as f:
+                test_code = f.read()
+
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "validation_started"})
+
+        started = time.perf_counter()
+        try:
+            names = collect_tests(test_code)
+            error = None if names else "No tests found"
+        except SyntaxError as e:
+            names, error = [], f"SyntaxError: {e}"
+
+        results = []
+        if names:
+            with tempfile.TemporaryDirectory(prefix="validation-") as scratch:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(names))) as pool:
+                    results = list(pool.map(lambda item: self._run_test(item[1], os.path.join(scratch, str(item[0]))),
+                                            enumerate(names)))
+
+        summary = self._summarize(results, time.perf_counter() - started, error)
+        self.tracking_agent.record_validation(summary)
+
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "validation_completed",
+                "status": summary["status"],
+                "passRate": summary["passRate"],
+            })
+
+        return summary
+
+    def _run_test(self, name: str, basetemp: str) -> Dict[str, Any]:
+        """
+        Run one test in a fresh pytest process
+
+        Args:
+            name: pytest node name within TEST_FILE
+            basetemp: Private pytest temporary directory for this test
+
+        Returns:
+            Result with name, outcome (passed, failed, error or timeout),
+            seconds and, unless it passed, the tail of the output
+        """
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.abspath(self.conjugator_dir)] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        command = [
+            sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+            f"--basetemp={basetemp}", f"{TEST_FILE}::{name}",
+        ]
+
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(command, cwd=self.tests_dir, env=env, capture_output=True,
+                                       text=True, timeout=self.timeout)
+            outcome = {0: "passed", 1: "failed"}.get(completed.returncode, "error")
+            output = completed.stdout + completed.stderr
+        except subprocess.TimeoutExpired:
+            outcome = "timeout"
+            output = f"Timed out after {self.timeout}s"
+        except OSError as e:
+            outcome = "error"
+            output = f"{type(e).__name__}: {e}"
+
+        result: Dict[str, Any] = {"name": name, "outcome": outcome, "seconds": round(time.perf_counter() - started, 3)}
+        if outcome != "passed":
+            result["output"] = "\n".join(output.strip().splitlines()[-OUTPUT_TAIL_LINES:])
+        return result
+
+    def _summarize(self, results: List[Dict[str, Any]], elapsed: float, error: Optional[str]) -> Dict[str, Any]:
+        """Aggregate per-test results into the validation summary"""
+        counts = {outcome: sum(r["outcome"] == outcome for r in results)
+                  for outcome in ("passed", "failed", "error", "timeout")}
+        total = len(results)
+        if error:
+            status = "error"
+        else:
+            status = "passed" if counts["passed"] == total else "failed"
+        return {
+            "status": status,
+            "error": error,
+            "total": total,
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "errors": counts["error"],
+            "timeouts": counts["timeout"],
+            "passRate": round(counts["passed"] / total, 3) if total else 0.0,
+            "wallSeconds": round(elapsed, 3),
+            "testSeconds": summarize_latencies([r["seconds"] for r in results]),
+            "workers": self.workers,
+            "tests": results,
+        }
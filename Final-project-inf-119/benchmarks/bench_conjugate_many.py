@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# Generated conjugator batch API benchmark (conjugate_many vs a conjugate_verb loop)
+# Author: [Your Name] - [Student ID]
+#
+# Renders verb_conjugator.py from the template into a temporary directory and
+# measures lookups per second for the same request list with a cold memo.
+# mlconjug3 is used when installed; otherwise a stand-in model that burns
+# --stub-cost-ms of CPU per conjugation is put on the path.
+#
+# Usage:
+#   python benchmarks/bench_conjugate_many.py --requests 20000 --verbs 2000 --processes 4
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp import RequirementSpec
+from agents.code_templates import render_conjugator
+
+STUB_MLCONJUG3 = '''
+import os
+import time
+
+COST = float(os.environ.get("STUB_COST_MS", "0.5")) / 1000
+PRONOUNS = {"en": ["I", "you", "he/she/it", "we", "they"],
+            "fr": ["je", "tu", "il/elle", "nous", "ils/elles"],
+            "es": ["yo", "tú", "él", "nosotros", "ellos"]}
+TENSES = {"en": ("indicative", ["indicative present", "indicative past tense", "indicative future"]),
+          "fr": ("Indicatif", ["Présent", "Passé Simple", "Futur"]),
+          "es": ("Indicativo", ["Indicativo presente", "Indicativo pretérito perfecto simple", "Indicativo futuro"])}
+
+class _Verb:
+    def __init__(self, info):
+        self.conjug_info = info
+
+class Conjugator:
+    def __init__(self, language="en"):
+        self.language = language
+
+    def conjugate(self, verb):
+        deadline = time.perf_counter() + COST
+        while time.perf_counter() < deadline:
+            pass
+        mood, tenses = TENSES[self.language]
+        return _Verb({mood: {t: {p: verb + "-" + p for p in PRONOUNS[self.language]} for t in tenses}})
+'''
+
+def load_module(workdir: str, stub: bool):
+    """Render and import verb_conjugator.py from workdir"""
+    spec = RequirementSpec(languages=["English", "French", "Spanish"], tenses=["present", "past", "future"], persons=[])
+    with open(os.path.join(workdir, "verb_conjugator.py"), "w", encoding="utf-8") as f:
+        f.write(render_conjugator(spec))
+    if stub:
+        os.makedirs(os.path.join(workdir, "mlconjug3"))
+        with open(os.path.join(workdir, "mlconjug3", "__init__.py"), "w", encoding="utf-8") as f:
+            f.write(STUB_MLCONJUG3)
+    sys.path.insert(0, workdir)
+
+    module_spec = importlib.util.spec_from_file_location("verb_conjugator", os.path.join(workdir, "verb_conjugator.py"))
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules["verb_conjugator"] = module
+    module_spec.loader.exec_module(module)
+    return module
+
+def make_requests(count: int, distinct: int, seed: int) -> Tuple[List[str], List[str]]:
+    """(languages, verbs) with Zipf-like repetition, as real traffic has"""
+    rng = random.Random(seed)
+    pool = [(language, f"verb{i}") for i in range(distinct) for language in ("English", "French", "Spanish")]
+    weights = [1.0 / (rank + 1) for rank in range(len(pool))]
+    picks = rng.choices(pool, weights=weights, k=count)
+    return [language for language, _ in picks], [verb for _, verb in picks]
+
+def run_benchmark(requests: int, distinct: int, processes: int, seed: int, stub_cost_ms: float) -> Dict[str, Any]:
+    """
+    Time the loop, conjugate_many and conjugate_many with worker processes
+
+    Returns:
+        JSON-serializable results
+    """
+    os.environ["STUB_COST_MS"] = str(stub_cost_ms)
+    try:
+        import mlconjug3  # noqa: F401
+        stub = False
+    except ImportError:
+        stub = True
+
+    with tempfile.TemporaryDirectory() as workdir:
+        module = load_module(workdir, stub)
+        languages, verbs = make_requests(requests, distinct, seed)
+        tenses = ["present", "past", "future"]
+        lookups = requests * len(tenses)
+
+        # Warm the models so every variant measures lookups, not model loading
+        for code in module.TENSES:
+            module.get_conjugator(code)
+
+        def loop():
+            for language, verb in zip(languages, verbs):
+                for tense in tenses:
+                    try:
+                        module.conjugate_verb(language, verb, tense)
+                    except module.ConjugationError:
+                        pass
+
+        variants = [
+            ("conjugate_verb loop", loop),
+            ("conjugate_many", lambda: module.conjugate_many(languages, verbs, tenses)),
+        ]
+        if processes > 1:
+            variants.append((f"conjugate_many x{processes} processes",
+                             lambda: module.conjugate_many(languages, verbs, tenses, processes=processes)))
+
+        results = []
+        for name, func in variants:
+            module.clear_cache()
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            results.append({"variant": name, "seconds": elapsed, "lookups_per_sec": lookups / elapsed})
+
+    return {
+        "requests": requests,
+        "distinct_verbs": distinct,
+        "lookups": lookups,
+        "model": "stub" if stub else "mlconjug3",
+        "stub_cost_ms": stub_cost_ms if stub else None,
+        "results": results,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the generated conjugate_many batch API")
+    parser.add_argument("--requests", type=int, default=20000, help="verbs per batch (with repeats)")
+    parser.add_argument("--verbs", type=int, default=2000, help="distinct verbs per language")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes for the parallel variant")
+    parser.add_argument("--stub-cost-ms", type=float, default=0.5, help="CPU per conjugation of the stand-in model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.requests, args.verbs, args.processes, args.seed, args.stub_cost_ms)
+
+    print(f"{results['lookups']:,} lookups ({results['requests']:,} verbs x 3 tenses), model: {results['model']}")
+    baseline = results["results"][0]["seconds"]
+    print(f"{'variant':34} {'seconds':>9} {'lookups/s':>12} {'speedup':>8}")
+    for entry in results["results"]:
+        print(f"{entry['variant']:34} {entry['seconds']:9.3f} {entry['lookups_per_sec']:12,.0f} "
+              f"{baseline / entry['seconds']:7.2f}x")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
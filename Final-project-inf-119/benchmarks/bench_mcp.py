@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# MCP message throughput benchmark
+# Author: [Your Name] - [Student ID]
+#
+# Usage:
+#   python benchmarks/bench_mcp.py --messages 20000 --batch 64 --output bench_mcp.json
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp import MCPServer, MCPMessage, AgentRole, MessageType
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+# Producers send to these roles round-robin; one consumer drains each
+RECEIVERS = (AgentRole.PARSER, AgentRole.DESIGN, AgentRole.CODE_GEN, AgentRole.TEST_GEN)
+
+def make_messages(count: int, sender: AgentRole) -> List[MCPMessage]:
+    """Pre-build directed messages so only routing is timed"""
+    return [
+        MCPMessage(
+            message_type=MessageType.REQUEST,
+            sender=sender,
+            receiver=RECEIVERS[i % len(RECEIVERS)],
+            content={"i": i},
+        )
+        for i in range(count)
+    ]
+
+def run_once(threads: int, messages: int, batch: int) -> float:
+    """
+    Push messages through a fresh server with the given number of producers
+
+    Args:
+        threads: Producer thread count
+        messages: Total messages across all producers
+        batch: Messages per send_many call, or 0 for one send_message per message
+
+    Returns:
+        Messages per second (send to receive)
+    """
+    server = MCPServer(queue_maxsize=messages, history_capacity=1000)
+    per_thread = messages // threads
+    total = per_thread * threads
+    payloads = [make_messages(per_thread, AgentRole.TRACKING) for _ in range(threads)]
+    received = [0] * len(RECEIVERS)
+    expected = [sum(1 for p in payloads for m in p if m.receiver == role) for role in RECEIVERS]
+    start = threading.Barrier(threads + len(RECEIVERS) + 1)
+
+    def produce(items: List[MCPMessage]):
+        start.wait()
+        if batch:
+            for i in range(0, len(items), batch):
+                server.send_many(items[i:i + batch])
+        else:
+            for message in items:
+                server.send_message(message)
+
+    def consume(index: int):
+        start.wait()
+        while received[index] < expected[index]:
+            received[index] += len(server.drain(RECEIVERS[index], max_n=batch or 1, timeout=1.0))
+
+    workers = [threading.Thread(target=produce, args=(p,)) for p in payloads]
+    workers += [threading.Thread(target=consume, args=(i,)) for i in range(len(RECEIVERS))]
+    for worker in workers:
+        worker.start()
+
+    start.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return total / (time.perf_counter() - started)
+
+def run_benchmark(messages: int, batch: int, repeat: int) -> Dict[str, Any]:
+    """
+    Measure single and batched throughput at each thread count
+
+    Returns:
+        JSON-serializable results (best of repeat runs)
+    """
+    results: Dict[str, Any] = {"messages": messages, "batch": batch, "single": {}, "batched": {}}
+    for threads in THREAD_COUNTS:
+        results["single"][threads] = max(run_once(threads, messages, 0) for _ in range(repeat))
+        results["batched"][threads] = max(run_once(threads, messages, batch) for _ in range(repeat))
+    return results
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MCP message throughput")
+    parser.add_argument("--messages", type=int, default=20000, help="messages per run")
+    parser.add_argument("--batch", type=int, default=64, help="messages per send_many/drain call")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per configuration (best is kept)")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.messages, args.batch, args.repeat)
+
+    print(f"{'producers':>10} {'single msg/s':>14} {'batched msg/s':>14}")
+    for threads in THREAD_COUNTS:
+        print(f"{threads:10d} {results['single'][threads]:14,.0f} {results['batched'][threads]:14,.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# End-to-end pipeline benchmark on the offline FakeBackend
+# Author: [Your Name] - [Student ID]
+#
+# Usage:
+#   python benchmarks/bench_pipeline.py --iterations 50 --output bench_pipeline.json
+#   python benchmarks/bench_pipeline.py --baseline bench_pipeline.json --tolerance 0.2
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp import MCPServer, MCPClient, AgentRole, RequirementSpec, DesignSpec
+from agents import (
+    TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent,
+    FakeBackend, build_factory_pipeline,
+)
+from agents.fake_responses import PARSER_RESPONSE, DESIGN_RESPONSE, CONJUGATOR_CODE
+from utils.helpers import save_to_file, summarize_latencies
+from utils.rate_limiter import RateLimiter
+
+REQUIREMENTS = (
+    "Create a verb conjugator for English and Spanish that supports present, "
+    "past, and future tenses. Include irregular verb handling."
+)
+
+class TimedMCPServer(MCPServer):
+    """MCPServer that records how long each send_message call takes"""
+
+    def __init__(self):
+        super().__init__()
+        self.send_times: List[float] = []
+
+    def send_message(self, message):
+        started = time.perf_counter()
+        super().send_message(message)
+        self.send_times.append(time.perf_counter() - started)
+
+def run_pipeline_once(latency: float, workdir: str) -> Dict[str, Any]:
+    """
+    Run the full pipeline once against a fresh set of agents
+
+    Returns:
+        Dictionary with per-stage seconds, total seconds and MCP send times
+    """
+    server = TimedMCPServer()
+    tracking = TrackingAgent(
+        mcp_client=MCPClient(server, AgentRole.TRACKING),
+        backend=FakeBackend(latency=latency),
+        rate_limiter=RateLimiter(None, None),
+    )
+    pipeline = build_factory_pipeline(
+        ParserAgent(tracking, MCPClient(server, AgentRole.PARSER)),
+        DesignAgent(tracking, MCPClient(server, AgentRole.DESIGN)),
+        CodeGenAgent(tracking, MCPClient(server, AgentRole.CODE_GEN), output_dir=f"{workdir}/conjugator"),
+        TestAgent(tracking, MCPClient(server, AgentRole.TEST_GEN), output_dir=f"{workdir}/tests"),
+    )
+
+    stage_times: Dict[str, float] = {}
+
+    def on_event(event):
+        if event.kind == "completed":
+            stage_times[event.stage.name] = event.elapsed
+
+    started = time.perf_counter()
+    pipeline.run({"requirements": REQUIREMENTS}, on_event=on_event)
+    total = time.perf_counter() - started
+
+    return {"stages": stage_times, "total": total, "mcp_send": server.send_times}
+
+def time_operation(func, repeat: int) -> List[float]:
+    """Time repeated calls of func"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+def measure_overheads(workdir: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Microbenchmarks for the non-LLM work the pipeline does"""
+    spec_data = json.loads(PARSER_RESPONSE)
+    design_data = json.loads(DESIGN_RESPONSE)
+    path = os.path.join(workdir, "overhead", "verb_conjugator.py")
+
+    return {
+        "pydantic_requirement_spec": summarize_latencies(
+            time_operation(lambda: RequirementSpec(**spec_data), repeat)
+        ),
+        "pydantic_design_spec": summarize_latencies(
+            time_operation(lambda: DesignSpec(**design_data), repeat)
+        ),
+        "file_write": summarize_latencies(
+            time_operation(lambda: save_to_file(CONJUGATOR_CODE, path), repeat)
+        ),
+    }
+
+def git_commit() -> str:
+    """Short hash of the current commit, if available"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run_benchmark(iterations: int, latency: float, overhead_repeat: int) -> Dict[str, Any]:
+    """
+    Run the benchmark suite
+
+    Returns:
+        JSON-serializable results
+    """
+    stage_samples: Dict[str, List[float]] = {}
+    totals: List[float] = []
+    mcp_sends: List[float] = []
+    mcp_per_run: List[float] = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Warm-up run (imports, first file creation)
+        run_pipeline_once(latency, workdir)
+
+        for _ in range(iterations):
+            result = run_pipeline_once(latency, workdir)
+            for stage, elapsed in result["stages"].items():
+                stage_samples.setdefault(stage, []).append(elapsed)
+            totals.append(result["total"])
+            mcp_sends.extend(result["mcp_send"])
+            mcp_per_run.append(sum(result["mcp_send"]))
+
+        overhead = measure_overheads(workdir, overhead_repeat)
+
+    overhead["mcp_send_message"] = summarize_latencies(mcp_sends)
+    overhead["mcp_send_message_per_run"] = summarize_latencies(mcp_per_run)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "iterations": iterations,
+            "backend_latency": latency,
+        },
+        "stages": {name: summarize_latencies(samples) for name, samples in stage_samples.items()},
+        "total": summarize_latencies(totals),
+        "overhead": overhead,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare p50/p95 figures against a baseline
+
+    Returns:
+        Human readable regression descriptions
+    """
+    regressions = []
+    sections = [("stages", current["stages"], baseline.get("stages", {})),
+                ("overhead", current["overhead"], baseline.get("overhead", {}))]
+    sections.append(("total", {"pipeline": current["total"]}, {"pipeline": baseline.get("total", {})}))
+
+    for section, now, before in sections:
+        for name, stats in now.items():
+            for key in ("p50", "p95"):
+                old = before.get(name, {}).get(key)
+                if old and stats[key] > old * (1 + tolerance):
+                    regressions.append(
+                        f"{section}.{name}.{key}: {stats[key] * 1000:.3f}ms "
+                        f"(baseline {old * 1000:.3f}ms, +{(stats[key] / old - 1) * 100:.0f}%)"
+                    )
+    return regressions
+
+def print_summary(results: Dict[str, Any]) -> None:
+    """Print a table of the results"""
+    print(f"{'metric':40} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    rows = [(f"stage {k}", v) for k, v in results["stages"].items()]
+    rows.append(("pipeline total", results["total"]))
+    rows += [(f"overhead {k}", v) for k, v in results["overhead"].items()]
+    for name, stats in rows:
+        print(f"{name:40} {stats['p50'] * 1000:10.3f} {stats['p95'] * 1000:10.3f} {stats['p99'] * 1000:10.3f}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the generation pipeline on a stub backend")
+    parser.add_argument("--iterations", type=int, default=50, help="pipeline runs to time")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per model call")
+    parser.add_argument("--overhead-repeat", type=int, default=1000, help="repetitions per microbenchmark")
+    parser.add_argument("--output", default="bench_pipeline.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations, args.latency, args.overhead_repeat)
+    print_summary(results)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n⚠️  Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
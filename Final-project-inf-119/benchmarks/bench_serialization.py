@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# MCPMessage construction and serialization benchmark
+# Author: [Your Name] - [Student ID]
+#
+# Usage:
+#   python benchmarks/bench_serialization.py --count 20000 --output bench_serialization.json
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp import MCPMessage, AgentRole, MessageType
+from mcp import serialization
+
+# Representative traffic: a tracking notification, an agent notification
+# carrying a dumped spec, and a correlated request
+SAMPLES = [
+    (MessageType.NOTIFICATION, AgentRole.TRACKING, None,
+     {"event": "api_call", "model": "gemini-2.5-flash", "tokens": 1834, "latency": 2.41, "agent": "parser"}, {}),
+    (MessageType.NOTIFICATION, AgentRole.PARSER, None,
+     {"event": "parsing_completed", "spec": {
+         "languages": ["English", "Spanish", "French"], "tenses": ["present", "past", "future"],
+         "persons": ["1st singular", "2nd singular", "3rd singular", "1st plural", "2nd plural", "3rd plural"],
+         "moods": ["indicative"], "handle_irregular": True, "dataset_sources": ["mlconjug3"],
+         "additional_requirements": "Include irregular verb handling",
+     }}, {}),
+    (MessageType.REQUEST, AgentRole.UI_GEN, AgentRole.PARSER,
+     {"action": "parse_requirements", "requirements": "English and Spanish, present and past"},
+     {"correlation_id": "3f2a9c0d5e6b47a8b1c2d3e4f5a6b7c8"}),
+]
+
+def rate(func: Callable[[], Any], count: int) -> float:
+    """Calls per second of func over count calls"""
+    started = time.perf_counter()
+    for _ in range(count):
+        func()
+    return count / (time.perf_counter() - started)
+
+def validated(sample) -> MCPMessage:
+    message_type, sender, receiver, content, metadata = sample
+    return MCPMessage(message_type=message_type, sender=sender, receiver=receiver,
+                      content=content, metadata=metadata)
+
+def fast(sample) -> MCPMessage:
+    message_type, sender, receiver, content, metadata = sample
+    return MCPMessage.fast(message_type, sender, content, receiver=receiver, metadata=metadata)
+
+def run_benchmark(count: int) -> Dict[str, Any]:
+    """
+    Measure construction and encode/decode rates per sample message
+
+    Returns:
+        JSON-serializable results
+    """
+    results: List[Dict[str, Any]] = []
+    for sample in SAMPLES:
+        message = validated(sample)
+        as_json = message.model_dump_json()
+        compact = serialization.encode(message)
+        results.append({
+            "message": f"{sample[0].value}:{sample[3].get('event') or sample[3].get('action')}",
+            "construct_msgs_per_sec": {
+                "validated": rate(lambda: validated(sample), count),
+                "fast": rate(lambda: fast(sample), count),
+            },
+            "encode_msgs_per_sec": {
+                "model_dump_json": rate(message.model_dump_json, count),
+                "compact": rate(lambda: serialization.encode(message), count),
+            },
+            "decode_msgs_per_sec": {
+                "model_validate_json": rate(lambda: MCPMessage.model_validate_json(as_json), count),
+                "compact": rate(lambda: serialization.decode(compact), count),
+            },
+            "bytes_per_msg": {
+                "model_dump_json": len(as_json.encode("utf-8")),
+                "compact": len(compact),
+            },
+        })
+    return {"count": count, "orjson": serialization.orjson is not None, "messages": results}
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MCPMessage construction and serialization")
+    parser.add_argument("--count", type=int, default=20000, help="operations per measurement")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count)
+
+    print(f"{'message':32} {'metric':10} {'current':>14} {'fast path':>14} {'speedup':>8}")
+    for entry in results["messages"]:
+        for metric, key in (("construct", "construct_msgs_per_sec"), ("encode", "encode_msgs_per_sec"),
+                            ("decode", "decode_msgs_per_sec"), ("bytes", "bytes_per_msg")):
+            current, new = entry[key].values()
+            ratio = new / current if metric != "bytes" else current / new
+            print(f"{entry['message']:32} {metric:10} {current:14,.0f} {new:14,.0f} {ratio:7.2f}x")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,37 +2,136 @@
 # Author: [Your Name] - [Student ID]
 
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+def _find_env_file() -> str:
+    """Nearest .env in this directory or a parent (where load_dotenv would look)"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return ""
+        directory = parent
+
+# Load environment variables (python-dotenv is only imported when a .env exists)
+_ENV_FILE = _find_env_file()
+if _ENV_FILE:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 # API Configuration
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY', '')
 
-# Validate API key
-if not GOOGLE_API_KEY or GOOGLE_API_KEY == 'your-api-key-here':
-    print("⚠️  WARNING: GOOGLE_API_KEY not set!")
-    print("Please set your API key in one of these ways:")
-    print("1. Create a .env file with: GOOGLE_API_KEY=your-key")
-    print("2. Set environment variable: export GOOGLE_API_KEY=your-key")
-    print("3. Edit config/api_config.py directly")
+_api_key_checked = False
+
+def warn_if_api_key_missing() -> None:
+    """Print setup instructions once if GOOGLE_API_KEY is not configured"""
+    global _api_key_checked
+    if _api_key_checked:
+        return
+    _api_key_checked = True
+    
+    if not GOOGLE_API_KEY or GOOGLE_API_KEY == 'your-api-key-here':
+        print("⚠️  WARNING: GOOGLE_API_KEY not set!")
+        print("Please set your API key in one of these ways:")
+        print("1. Create a .env file with: GOOGLE_API_KEY=your-key")
+        print("2. Set environment variable: export GOOGLE_API_KEY=your-key")
+        print("3. Edit config/api_config.py directly")
 
 # Model Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 MODEL_TEMPERATURE = 0.7
 MODEL_MAX_TOKENS = 8192
 
+# Model backend: "gemini" or "fake" (offline stand-in for load testing)
+MODEL_BACKEND = os.getenv('MODEL_BACKEND', 'gemini')
+
+# Maximum number of model calls in flight at once (shared by all agents)
+LLM_MAX_CONCURRENCY = 4
+
+# Client-side quota shared by all agents (None disables a limit)
+LLM_REQUESTS_PER_MINUTE = 15
+LLM_TOKENS_PER_MINUTE = 250000
+
+# Retry policy for quota and transient errors
+LLM_MAX_RETRIES = 5
+LLM_RETRY_BASE_DELAY = 1.0
+LLM_RETRY_MAX_DELAY = 32.0
+
+# Response Cache Configuration (opt-in)
+RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', '').lower() in ('1', 'true', 'yes')
+RESPONSE_CACHE_DIR = ".cache/responses"
+RESPONSE_CACHE_MAX_MEMORY_ENTRIES = 128
+RESPONSE_CACHE_MAX_DISK_BYTES = 50 * 1024 * 1024
+RESPONSE_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Local fast paths that skip the LLM when the input is unambiguous
+# (set FAST_PATH_ENABLED=0 to always call the model)
+FAST_PATH_ENABLED = os.getenv('FAST_PATH_ENABLED', '1').lower() not in ('0', 'false', 'no')
+
 # MCP Configuration
 MCP_SERVER_HOST = "localhost"
 MCP_SERVER_PORT = 8000
 
+# Unix socket path for the MCP socket transport (None uses host/port over TCP)
+MCP_SERVER_SOCKET = None
+
+# MCP message history: ring buffer bounds and optional JSONL spill file
+MCP_HISTORY_CAPACITY = 1000
+MCP_HISTORY_MAX_BYTES = 4 * 1024 * 1024
+MCP_HISTORY_SPILL_PATH = None
+
+# MCP agent queues: capacity and overflow policy ("block", "drop_oldest", "drop_newest")
+MCP_QUEUE_MAXSIZE = 1000
+MCP_QUEUE_POLICY = "drop_oldest"
+MCP_QUEUE_BLOCK_TIMEOUT = 5.0
+
+# Priority lanes (errors/cancels, requests/responses, notifications): a waiting
+# lane is served after being passed over this many times in a row
+MCP_QUEUE_PRIORITY_LANES = True
+MCP_QUEUE_STARVATION_LIMIT = 16
+
+# MCP dispatcher: handler worker threads and handlers running at once per role
+MCP_DISPATCH_WORKERS = 8
+MCP_DISPATCH_ROLE_CONCURRENCY = 2
+
 # Generation Configuration
 OUTPUT_DIR = "generated"
 CONJUGATOR_DIR = f"{OUTPUT_DIR}/conjugator"
 TESTS_DIR = f"{OUTPUT_DIR}/tests"
 USAGE_REPORT_FILE = "usage_report.json"
 
+# LRU size of the (language, verb, tense) memo in the generated conjugator
+CONJUGATION_CACHE_SIZE = 4096
+
+# Distinct lookups at which the generated conjugate_many may use worker processes
+CONJUGATE_MANY_PARALLEL_MIN = 2000
+
+# Precomputed conjugation table written next to verb_conjugator.py
+# (set CONJUGATION_TABLE_ENABLED=0 to skip the build step)
+CONJUGATION_TABLE_ENABLED = os.getenv('CONJUGATION_TABLE_ENABLED', '1').lower() not in ('0', 'false', 'no')
+CONJUGATION_TABLE_FILE = "conjugations.sqlite3"
+CONJUGATION_TABLE_VERBS = 3000
+CONJUGATION_TABLE_TIMEOUT = 600
+
+# Seconds between UI refreshes of the background table build status
+TABLE_STATUS_POLL_SECONDS = 2.0
+
+# Validation stage: each generated test runs in its own subprocess
+# (workers None = one per CPU core; set VALIDATION_ENABLED=0 to skip it in the UI)
+VALIDATION_ENABLED = os.getenv('VALIDATION_ENABLED', '1').lower() not in ('0', 'false', 'no')
+VALIDATION_WORKERS = None
+VALIDATION_TEST_TIMEOUT = 60
+
+# Batch mode (main.py --batch): output root and items generated at once
+BATCH_OUTPUT_DIR = f"{OUTPUT_DIR}/batch"
+BATCH_WORKERS = 4
+
+# Number of recent per-call records kept for the usage report
+CALL_LOG_SIZE = 1000
+
 # UI Configuration
 GRADIO_SERVER_NAME = "0.0.0.0"
 GRADIO_SERVER_PORT = 7860
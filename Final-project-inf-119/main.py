@@ -2,16 +2,118 @@
 # Main entry point for the Verb Conjugator Factory
 # Author: [Your Name] - [Student ID]
 
+import argparse
 import sys
 import os
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ui.gradio_app import VerbConjugatorFactoryUI
+def serve_mcp(address: str):
+    """Host a standalone MCP server for agent worker processes"""
+    from mcp import MCPServer, MCPSocketServer
+    from mcp.transport import parse_address
+    
+    socket_server = MCPSocketServer(MCPServer(), parse_address(address) if address else None)
+    print(f"📡 MCP server listening on {socket_server.requested_address}")
+    socket_server.serve_forever()
+
+def run_worker(role_name: str, address: str):
+    """Serve one agent role from this process against a remote MCP server"""
+    from mcp import MCPClient, AgentRole, RemoteMCPServer, MCPServer
+    from mcp.transport import parse_address, run_agent_worker
+    from agents import TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent, register_factory_handlers
+    
+    remote = RemoteMCPServer(parse_address(address) if address else None)
+    role = AgentRole(role_name)
+    tracking = TrackingAgent(mcp_client=MCPClient(remote, AgentRole.TRACKING))
+    
+    # Build the handlers locally, then serve only the requested role
+    handlers = MCPServer()
+    register_factory_handlers(
+        handlers,
+        ParserAgent(tracking, MCPClient(remote, AgentRole.PARSER)),
+        DesignAgent(tracking, MCPClient(remote, AgentRole.DESIGN)),
+        CodeGenAgent(tracking, MCPClient(remote, AgentRole.CODE_GEN)),
+        TestAgent(tracking, MCPClient(remote, AgentRole.TEST_GEN)),
+    )
+    if role not in handlers.agent_handlers:
+        raise SystemExit(f"No handler for role: {role_name}")
+    
+    print(f"👷 Serving {role.value} requests from {remote.address}")
+    try:
+        run_agent_worker(remote, role, handlers.agent_handlers[role])
+    except KeyboardInterrupt:
+        pass
+
+def run_batch(path: str, output_dir: str, workers: int, llm_concurrency: int, validate: bool = False):
+    """Generate an application for every requirement text in a directory or JSONL file"""
+    from agents.batch import BatchRunner, load_batch_items
+    
+    items = load_batch_items(path)
+    print(f"📦 Generating {len(items)} application(s) with {workers} worker(s), "
+          f"at most {llm_concurrency} model call(s) at once\n")
+    
+    def on_item(result):
+        icon = "✅" if result["status"] == "ok" else "❌"
+        detail = result["outputDir"] if result["status"] == "ok" else result["error"]
+        if "validation" in result:
+            validation = result["validation"]
+            detail += f" [tests {validation['passed']}/{validation['total']} passed]"
+        print(f"{icon} {result['id']} ({result['seconds']:.1f}s, {result['totalTokens']} tokens): {detail}")
+    
+    runner = BatchRunner(output_dir, workers=workers, max_llm_concurrency=llm_concurrency,
+                         validate=validate)
+    summary = runner.run(items, on_item=on_item)
+    
+    print(f"\n{summary['succeeded']}/{summary['items']} succeeded in {summary['wallSeconds']:.1f}s "
+          f"({summary['itemsPerMinute']} items/min, {summary['totalTokens']} tokens)")
+    print(f"Summary written to {os.path.join(output_dir, 'batch_summary.json')}")
+    if summary["validationPassRate"] is not None:
+        print(f"Generated tests passed: {summary['validationPassRate']:.0%}")
+    if summary["failed"]:
+        sys.exit(1)
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Language Verb Conjugator Factory")
+    parser.add_argument("--mcp-server", nargs="?", const="", metavar="ADDRESS",
+                        help="host a standalone MCP server (host:port or unix socket path)")
+    parser.add_argument("--mcp-worker", metavar="ROLE",
+                        help="serve one agent role (parser, design, code_gen, test_gen) from this process")
+    parser.add_argument("--mcp-address", default="", metavar="ADDRESS",
+                        help="MCP server address for --mcp-worker (default from config)")
+    parser.add_argument("--batch", metavar="PATH",
+                        help="headless mode: generate an app for each requirement file in a directory or line of a JSONL file")
+    parser.add_argument("--output-dir", default=None, help="batch output root (default from config)")
+    parser.add_argument("--workers", type=int, default=None, help="batch items generated at once")
+    parser.add_argument("--llm-concurrency", type=int, default=None, help="model calls in flight across the batch")
+    parser.add_argument("--validate", action="store_true", help="also run each batch item's generated tests")
+    args = parser.parse_args()
+    
+    if args.batch:
+        from config.api_config import BATCH_OUTPUT_DIR, BATCH_WORKERS, LLM_MAX_CONCURRENCY
+        run_batch(
+            args.batch,
+            args.output_dir or BATCH_OUTPUT_DIR,
+            args.workers or BATCH_WORKERS,
+            args.llm_concurrency or LLM_MAX_CONCURRENCY,
+            args.validate,
+        )
+        return
+    
+    if args.mcp_server is not None:
+        serve_mcp(args.mcp_server)
+        return
+    if args.mcp_worker:
+        run_worker(args.mcp_worker, args.mcp_address)
+        return
+    
+    from config.api_config import warn_if_api_key_missing
+    from ui.gradio_app import VerbConjugatorFactoryUI
+    
+    warn_if_api_key_missing()
+    
     print("=" * 60)
     print("🏭 Language Verb Conjugator Factory")
     print("=" * 60)
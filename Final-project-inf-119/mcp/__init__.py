@@ -1,7 +1,11 @@
 # MCP module initialization
-from .protocol import MCPMessage, AgentRole, MessageType, RequirementSpec, DesignSpec, GeneratedCode, TestCase, UsageStats
+from .protocol import MCPMessage, AgentRole, MessageType, RequirementSpec, DesignSpec, GeneratedCode, TestCase, UsageStats, CallRecord, FastPathStats
+from .history import MessageHistory
+from .queues import BoundedMessageQueue, OverflowPolicy
 from .server import MCPServer
-from .client import MCPClient
+from .client import MCPClient, MCPCallError
+from .dispatcher import MCPDispatcher
+from .transport import MCPSocketServer, RemoteMCPServer, TransportError
 
 __all__ = [
     'MCPMessage',
@@ -12,6 +16,16 @@ __all__ = [
     'GeneratedCode',
     'TestCase',
     'UsageStats',
+    'CallRecord',
+    'FastPathStats',
+    'MessageHistory',
+    'BoundedMessageQueue',
+    'OverflowPolicy',
     'MCPServer',
-    'MCPClient'
+    'MCPClient',
+    'MCPCallError',
+    'MCPDispatcher',
+    'MCPSocketServer',
+    'RemoteMCPServer',
+    'TransportError'
 ]
@@ -1,13 +1,31 @@
 # MCP Client implementation
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, Dict, Any
-from .protocol import MCPMessage, AgentRole, MessageType
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from .protocol import MCPMessage, AgentRole, MessageType, CORRELATION_ID, IN_REPLY_TO, new_correlation_id
+from .queues import BoundedMessageQueue
 from .server import MCPServer
+from config.api_config import MCP_QUEUE_MAXSIZE
+
+class MCPCallError(Exception):
+    """Raised through a call() future when the receiver answers with an ERROR"""
+    
+    def __init__(self, message: MCPMessage):
+        super().__init__(message.content.get("error", "MCP call failed"))
+        self.message = message
 
 class MCPClient:
     """
     MCP Client for agents to communicate with the server
+    
+    call() may be used from many threads at once: a background router
+    thread reads this agent's queue, completes the future whose correlation
+    ID each reply carries, and keeps every other message for
+    receive_message().
     """
     
     def __init__(self, server: MCPServer, role: AgentRole):
@@ -15,60 +33,110 @@ class MCPClient:
         Initialize MCP client
         
         Args:
-            server: MCP server instance
+            server: MCP server instance (or a RemoteMCPServer)
             role: This agent's role
         """
         self.server = server
         self.role = role
+        
+        # Outstanding calls: correlation ID -> (future, deadline)
+        self._pending: Dict[str, Tuple[Future, Optional[float]]] = {}
+        self._pending_lock = threading.Lock()
+        self._router: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._inbox = BoundedMessageQueue(MCP_QUEUE_MAXSIZE)
     
-    def send_request(self, receiver: AgentRole, content: Dict[str, Any]) -> None:
+    def send_request(self, receiver: AgentRole, content: Dict[str, Any],
+                     correlation_id: Optional[str] = None) -> str:
         """
         Send a request to another agent
         
         Args:
             receiver: Target agent role
             content: Request content
+            correlation_id: ID to tag the request with (generated if omitted)
+            
+        Returns:
+            The request's correlation ID
         """
-        message = MCPMessage(
-            message_type=MessageType.REQUEST,
-            sender=self.role,
+        correlation_id = correlation_id or new_correlation_id()
+        message = MCPMessage.fast(
+            MessageType.REQUEST, self.role, content,
             receiver=receiver,
-            content=content
+            metadata={CORRELATION_ID: correlation_id}
         )
         self.server.send_message(message)
+        return correlation_id
     
-    def send_response(self, receiver: AgentRole, content: Dict[str, Any]) -> None:
+    def send_response(self, receiver: AgentRole, content: Dict[str, Any],
+                      in_reply_to: Optional[str] = None) -> None:
         """
         Send a response to another agent
         
         Args:
             receiver: Target agent role
             content: Response content
+            in_reply_to: Correlation ID of the request being answered
         """
-        message = MCPMessage(
-            message_type=MessageType.RESPONSE,
-            sender=self.role,
+        message = MCPMessage.fast(
+            MessageType.RESPONSE, self.role, content,
             receiver=receiver,
-            content=content
+            metadata={IN_REPLY_TO: in_reply_to} if in_reply_to else {}
         )
         self.server.send_message(message)
     
-    def send_error(self, receiver: AgentRole, error: str) -> None:
+    def send_error(self, receiver: AgentRole, error: str, in_reply_to: Optional[str] = None) -> None:
         """
         Send an error message
         
         Args:
             receiver: Target agent role
             error: Error description
+            in_reply_to: Correlation ID of the request that failed
         """
-        message = MCPMessage(
-            message_type=MessageType.ERROR,
-            sender=self.role,
+        message = MCPMessage.fast(
+            MessageType.ERROR, self.role, {"error": error},
             receiver=receiver,
-            content={"error": error}
+            metadata={IN_REPLY_TO: in_reply_to} if in_reply_to else {}
         )
         self.server.send_message(message)
     
+    def call(self, receiver: AgentRole, content: Dict[str, Any], timeout: Optional[float] = None) -> Future:
+        """
+        Send a request and return a future for its response
+        
+        The future resolves to the RESPONSE message, or fails with
+        MCPCallError for an ERROR reply and TimeoutError when no reply
+        arrives within timeout.
+        
+        Args:
+            receiver: Target agent role
+            content: Request content
+            timeout: Seconds to wait for the reply, None waits indefinitely
+            
+        Returns:
+            concurrent.futures.Future of the response MCPMessage
+        """
+        self._ensure_router()
+        
+        future: Future = Future()
+        correlation_id = new_correlation_id()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_lock:
+            self._pending[correlation_id] = (future, deadline)
+        
+        try:
+            self.send_request(receiver, content, correlation_id)
+        except Exception as e:
+            with self._pending_lock:
+                self._pending.pop(correlation_id, None)
+            future.set_exception(e)
+        return future
+    
+    async def acall(self, receiver: AgentRole, content: Dict[str, Any], timeout: Optional[float] = None) -> MCPMessage:
+        """Async version of call() that awaits the response message"""
+        return await asyncio.wrap_future(self.call(receiver, content, timeout))
+    
     def notify(self, content: Dict[str, Any], receiver: Optional[AgentRole] = None) -> None:
         """
         Send a notification
@@ -77,22 +145,100 @@ class MCPClient:
             content: Notification content
             receiver: Optional specific receiver, None for broadcast
         """
-        message = MCPMessage(
-            message_type=MessageType.NOTIFICATION,
-            sender=self.role,
-            receiver=receiver,
-            content=content
+        message = MCPMessage.fast(
+            MessageType.NOTIFICATION, self.role, content,
+            receiver=receiver
         )
         self.server.send_message(message)
     
+    def subscribe(self, topics: Optional[Iterable[str]] = None) -> None:
+        """
+        Subscribe this agent to broadcast topics
+        
+        Args:
+            topics: Message types or notification event names; None for all
+        """
+        self.server.subscribe(self.role, topics)
+    
     def receive_message(self, timeout: Optional[float] = None) -> Optional[MCPMessage]:
         """
         Receive a message for this agent
         
+        Replies to outstanding call() requests are not returned here.
+        
         Args:
             timeout: Timeout in seconds
             
         Returns:
             MCPMessage or None
         """
+        if self._router:
+            return self._inbox.get(timeout)
         return self.server.get_message(self.role, timeout)
+    
+    def receive_many(self, max_n: Optional[int] = None, timeout: Optional[float] = None) -> List[MCPMessage]:
+        """
+        Receive a batch of messages for this agent
+        
+        Args:
+            max_n: Maximum number of messages, None for all queued
+            timeout: Timeout in seconds for the first message
+            
+        Returns:
+            List of messages, empty if timeout
+        """
+        if self._router:
+            return self._inbox.get_many(max_n, timeout)
+        return self.server.drain(self.role, max_n, timeout)
+    
+    def close(self) -> None:
+        """Stop the reply router and fail calls still waiting"""
+        if self._router:
+            self._stop.set()
+            self._router.join()
+            self._router = None
+        
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(TimeoutError("MCP client closed before a reply arrived"))
+    
+    def _ensure_router(self) -> None:
+        """Start the reply router thread on first use"""
+        with self._pending_lock:
+            if self._router is None:
+                self._stop.clear()
+                self._router = threading.Thread(
+                    target=self._route_replies, name=f"mcp-router-{self.role.value}", daemon=True
+                )
+                self._router.start()
+    
+    def _route_replies(self) -> None:
+        """Hand replies to their waiting futures and everything else to the inbox"""
+        while not self._stop.is_set():
+            for message in self.server.drain(self.role, timeout=0.1):
+                with self._pending_lock:
+                    entry = self._pending.pop(message.in_reply_to, None) if message.in_reply_to else None
+                
+                if entry is None:
+                    self._inbox.put(message)
+                elif entry[0].done():
+                    # Cancelled by the caller
+                    continue
+                elif message.message_type == MessageType.ERROR:
+                    entry[0].set_exception(MCPCallError(message))
+                else:
+                    entry[0].set_result(message)
+            
+            self._expire_calls()
+    
+    def _expire_calls(self) -> None:
+        """Fail calls whose deadline has passed"""
+        now = time.monotonic()
+        with self._pending_lock:
+            expired = [cid for cid, (_, deadline) in self._pending.items() if deadline is not None and deadline <= now]
+            futures = [self._pending.pop(cid)[0] for cid in expired]
+        for future in futures:
+            if not future.done():
+                future.set_exception(TimeoutError("No reply to MCP call within timeout"))
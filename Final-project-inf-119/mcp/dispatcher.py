@@ -0,0 +1,249 @@
+# MCP Dispatcher - Runs registered agent handlers on a worker pool
+# Author: [Your Name] - [Student ID]
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+from .protocol import MCPMessage, AgentRole, MessageType, reply_metadata
+from .server import MCPServer
+from config.api_config import MCP_DISPATCH_WORKERS, MCP_DISPATCH_ROLE_CONCURRENCY
+
+# Messages pulled from a role queue per drain call
+DISPATCH_BATCH = 64
+
+logger = logging.getLogger(__name__)
+
+class MCPDispatcher:
+    """
+    Delivers queued messages to the handlers registered with an MCPServer
+    Each registered role gets a pump thread that drains its queue and hands
+    messages to a shared thread pool. Messages to one role from the same
+    sender are handled strictly in the order they leave the queue (arrival
+    order within a priority lane); messages from different senders run
+    concurrently, up to the role's concurrency limit.
+
+    A handler may be a plain function or a coroutine function. If it
+    returns an MCPMessage, that message is sent; if it raises while
+    handling a REQUEST, an ERROR message goes back to the sender.
+    """
+
+    def __init__(
+        self,
+        server: MCPServer,
+        max_workers: int = MCP_DISPATCH_WORKERS,
+        role_concurrency: Optional[Dict[AgentRole, int]] = None,
+        default_role_concurrency: int = MCP_DISPATCH_ROLE_CONCURRENCY,
+    ):
+        """
+        Initialize the dispatcher
+
+        Args:
+            server: Server whose registered handlers should be driven
+            max_workers: Size of the shared handler thread pool
+            role_concurrency: Per-role limits on handlers running at once
+            default_role_concurrency: Limit for roles not in role_concurrency
+                (1 gives strict in-order handling for the whole role)
+        """
+        self.server = server
+        self.max_workers = max_workers
+        self.role_concurrency = dict(role_concurrency or {})
+        self.default_role_concurrency = default_role_concurrency
+
+        self.handled: Dict[AgentRole, int] = {}
+        self.failed: Dict[AgentRole, int] = {}
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pumps: Dict[AgentRole, threading.Thread] = {}
+        self._slots: Dict[AgentRole, threading.BoundedSemaphore] = {}
+        self._stop = threading.Event()
+
+        # Ordering lanes: queued messages per (role, sender) and the lanes
+        # that currently have a worker processing them
+        self._lanes: Dict[Tuple[AgentRole, AgentRole], Deque[MCPMessage]] = {}
+        self._active: Set[Tuple[AgentRole, AgentRole]] = set()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    @property
+    def running(self) -> bool:
+        """Whether the dispatcher has been started and not stopped"""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Start pump threads for every role registered on the server"""
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-dispatch")
+        with self.server.lock:
+            roles = list(self.server.agent_handlers)
+
+        for role in roles:
+            limit = self.role_concurrency.get(role, self.default_role_concurrency)
+            self._slots[role] = threading.BoundedSemaphore(limit)
+            pump = threading.Thread(target=self._pump, args=(role,), name=f"mcp-pump-{role.value}", daemon=True)
+            self._pumps[role] = pump
+            pump.start()
+
+        self.server.running = True
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop pulling new messages and shut the worker pool down
+
+        Args:
+            wait: Whether to wait for in-flight handlers to finish
+        """
+        if not self.running:
+            return
+
+        self._stop.set()
+        for pump in self._pumps.values():
+            pump.join()
+        self._executor.shutdown(wait=wait)
+
+        self._executor = None
+        self._pumps = {}
+        self.server.running = False
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every registered role's queue is empty and no handler runs
+
+        Args:
+            timeout: Seconds to wait, None waits indefinitely
+
+        Returns:
+            True if idle, False on timeout
+        """
+        def idle():
+            return not self._active and all(
+                self.server.agent_queues[role].qsize() == 0 for role in self._pumps
+            )
+
+        with self._idle:
+            return self._idle.wait_for(idle, timeout)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get handled and failed counts per role
+
+        Returns:
+            Dictionary keyed by role value
+        """
+        with self._lock:
+            return {
+                role.value: {
+                    "handled": self.handled.get(role, 0),
+                    "failed": self.failed.get(role, 0),
+                    "concurrency": self.role_concurrency.get(role, self.default_role_concurrency),
+                }
+                for role in self._pumps
+            }
+
+    def __enter__(self) -> "MCPDispatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _pump(self, role: AgentRole) -> None:
+        """Move messages from a role queue into ordering lanes"""
+        queue = self.server.agent_queues[role]
+        while not self._stop.is_set():
+            if not queue.wait(timeout=0.1):
+                continue
+
+            # Take the batch and file it into lanes in one step so wait_idle
+            # never sees a message that is neither queued nor in a lane
+            started = []
+            with self._lock:
+                for message in queue.get_many(DISPATCH_BATCH, timeout=0):
+                    key = (role, message.sender)
+                    self._lanes.setdefault(key, deque()).append(message)
+                    if key not in self._active:
+                        self._active.add(key)
+                        started.append(key)
+
+            # A lane that is already running picks up its new messages itself
+            for key in started:
+                # Waits here when the role is at its concurrency limit
+                self._slots[role].acquire()
+                self._executor.submit(self._run_lane, role, key)
+
+    def _run_lane(self, role: AgentRole, key: Tuple[AgentRole, AgentRole]) -> None:
+        """Handle queued messages for one (role, sender) lane in order"""
+        drained = False
+        try:
+            while True:
+                with self._lock:
+                    lane = self._lanes[key]
+                    if not lane:
+                        del self._lanes[key]
+                        self._active.discard(key)
+                        self._idle.notify_all()
+                        drained = True
+                        return
+                    message = lane.popleft()
+                try:
+                    self._handle(role, message)
+                except Exception:
+                    # One bad message must not stall its sender's later ones
+                    logger.exception("Dispatching a message to %s failed", role.value)
+        finally:
+            if not drained:
+                # Release the lane so the sender is not blocked forever and
+                # wait_idle() can return
+                with self._lock:
+                    self._lanes.pop(key, None)
+                    self._active.discard(key)
+                    self._idle.notify_all()
+            self._slots[role].release()
+
+    def _handle(self, role: AgentRole, message: MCPMessage) -> None:
+        """Call the role's handler for one message"""
+        succeeded = call_handler(self.server, role, self.server.agent_handlers[role], message)
+        with self._lock:
+            self.handled[role] = self.handled.get(role, 0) + 1
+            if not succeeded:
+                self.failed[role] = self.failed.get(role, 0) + 1
+
+def call_handler(server: Any, role: AgentRole, handler: Callable, message: MCPMessage) -> bool:
+    """
+    Run a handler on one message and send its result
+
+    Args:
+        server: MCPServer (or anything with send_message) for replies
+        role: Role the handler serves
+        handler: Plain or coroutine handler function
+        message: Message to handle
+
+    Returns:
+        True if the handler succeeded and its result was sent; False
+        otherwise (an error reply is attempted for requests, and a failure
+        to send it is logged rather than raised)
+    """
+    try:
+        result = handler(message)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+        if isinstance(result, MCPMessage):
+            server.send_message(result)
+        return True
+    except Exception as e:
+        if message.message_type == MessageType.REQUEST:
+            try:
+                server.send_message(MCPMessage.fast(
+                    MessageType.ERROR, role, {"error": str(e)},
+                    receiver=message.sender,
+                    metadata=reply_metadata(message),
+                ))
+            except Exception:
+                logger.exception("Sending the error reply from %s to %s failed", role.value, message.sender.value)
+        return False
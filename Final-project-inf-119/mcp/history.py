@@ -0,0 +1,197 @@
+# MCP message history with bounded memory
+# Author: [Your Name] - [Student ID]
+
+import os
+import threading
+from collections import deque
+from itertools import islice
+from typing import Iterator, List, Optional
+from .protocol import MCPMessage
+from .serialization import encode_lossy, decode
+
+# Every Nth spilled line gets a byte offset in the sparse index
+SPILL_INDEX_STRIDE = 256
+
+class MessageHistory:
+    """
+    Fixed-capacity ring buffer of MCP messages
+    The buffer is bounded both by message count and by an approximate memory
+    budget (compact serialized size). Evicted messages are optionally appended
+    to a JSONL spill file, and page() reads across the file and the buffer without
+    copying the whole history.
+    """
+
+    def __init__(self, capacity: int, max_bytes: int, spill_path: Optional[str] = None):
+        """
+        Initialize the history
+
+        Args:
+            capacity: Maximum number of messages kept in memory
+            max_bytes: Approximate memory budget for messages kept in memory
+            spill_path: JSONL file receiving evicted messages (None drops them)
+        """
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+
+        self._buffer = deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Spill file bookkeeping
+        self._spilled = 0
+        self._spill_end = 0
+        self._spill_index: List[int] = []
+        self._spill_file = None
+        if spill_path:
+            self._open_spill()
+
+    def __len__(self) -> int:
+        """Number of messages kept in memory"""
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[MCPMessage]:
+        """Iterate over a snapshot of the in-memory messages"""
+        with self._lock:
+            messages = [message for message, _ in self._buffer]
+        return iter(messages)
+
+    @property
+    def total(self) -> int:
+        """Number of retained messages, spilled plus in memory"""
+        return self._spilled + len(self._buffer)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate size of the in-memory messages"""
+        return self._bytes
+
+    def append(self, message: MCPMessage) -> None:
+        """
+        Add a message, evicting the oldest ones when over budget
+
+        Args:
+            message: Message to record
+        """
+        self.extend([message])
+
+    def extend(self, messages: List[MCPMessage]) -> None:
+        """
+        Add several messages under one lock acquisition
+
+        Args:
+            messages: Messages to record, in order
+        """
+        # Measure sizes before taking the lock so JSON encoding runs concurrently;
+        # content JSON cannot hold is sized by its str() rather than rejected
+        sized = [(message, len(encode_lossy(message))) for message in messages]
+
+        with self._lock:
+            for entry in sized:
+                self._buffer.append(entry)
+                self._bytes += entry[1]
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest messages until within budget (caller holds the lock)"""
+        while len(self._buffer) > self.capacity or (
+            self._bytes > self.max_bytes and len(self._buffer) > 1
+        ):
+            evicted, evicted_size = self._buffer.popleft()
+            self._bytes -= evicted_size
+            if self._spill_file:
+                self._spill(evicted)
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[MCPMessage]:
+        """
+        Read a page of history, oldest first
+
+        Offsets span spilled messages followed by in-memory ones.
+
+        Args:
+            offset: Index of the first message to return
+            limit: Maximum number of messages (None for all remaining)
+
+        Returns:
+            List of messages
+        """
+        with self._lock:
+            spilled = self._spilled
+            remaining = self.total - offset if limit is None else limit
+            results: List[MCPMessage] = []
+
+            if offset < spilled and remaining > 0:
+                count = min(remaining, spilled - offset)
+                results.extend(self._read_spill(offset, count))
+                remaining -= count
+
+            if remaining > 0:
+                start = max(0, offset - spilled)
+                results.extend(message for message, _ in islice(self._buffer, start, start + remaining))
+
+            return results
+
+    def clear(self) -> None:
+        """Remove all messages from memory and truncate the spill file"""
+        with self._lock:
+            self._buffer.clear()
+            self._bytes = 0
+            if self._spill_file:
+                self._spill_file.seek(0)
+                self._spill_file.truncate()
+                self._spilled = 0
+                self._spill_end = 0
+                self._spill_index = []
+
+    def close(self) -> None:
+        """Close the spill file"""
+        with self._lock:
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def _open_spill(self) -> None:
+        """Open the spill file, indexing any lines from a previous run"""
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._spill_file = open(self.spill_path, "a+b")
+        self._spill_file.seek(0)
+        position = 0
+        for line in self._spill_file:
+            if self._spilled % SPILL_INDEX_STRIDE == 0:
+                self._spill_index.append(position)
+            position += len(line)
+            self._spilled += 1
+        self._spill_end = position
+
+    def _spill(self, message: MCPMessage) -> None:
+        """Append a message to the spill file (caller holds the lock)"""
+        line = encode_lossy(message) + b"\n"
+        if self._spilled % SPILL_INDEX_STRIDE == 0:
+            self._spill_index.append(self._spill_end)
+        self._spill_file.write(line)
+        self._spill_end += len(line)
+        self._spilled += 1
+
+    def _read_spill(self, offset: int, count: int) -> List[MCPMessage]:
+        """Read count spilled messages starting at offset (caller holds the lock)"""
+        self._spill_file.flush()
+        block = offset // SPILL_INDEX_STRIDE
+        self._spill_file.seek(self._spill_index[block])
+
+        # Skip to the requested line within the indexed block
+        for _ in range(offset - block * SPILL_INDEX_STRIDE):
+            self._spill_file.readline()
+
+        messages = []
+        for _ in range(count):
+            line = self._spill_file.readline()
+            if not line:
+                break
+            messages.append(decode(line))
+
+        # Appends always go to the end regardless of the read position
+        self._spill_file.seek(0, os.SEEK_END)
+        return messages
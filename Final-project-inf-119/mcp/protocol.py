@@ -1,10 +1,18 @@
 # Model Context Protocol definitions
 # Author: [Your Name] - [Student ID]
 
+import uuid
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, VERSION as PYDANTIC_VERSION
 from enum import Enum
 
+# Instance layout MCPMessage.fast writes directly (pydantic 2 BaseModel slots)
+PYDANTIC_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+
+# Metadata keys pairing requests with their responses
+CORRELATION_ID = "correlation_id"
+IN_REPLY_TO = "in_reply_to"
+
 class MessageType(str, Enum):
     """Types of messages in MCP"""
     REQUEST = "request"
@@ -28,6 +36,82 @@ class MCPMessage(BaseModel):
     receiver: Optional[AgentRole] = None
     content: Dict[str, Any]
     metadata: Dict[str, Any] = {}
+    
+    @classmethod
+    def fast(
+        cls,
+        message_type: MessageType,
+        sender: AgentRole,
+        content: Dict[str, Any],
+        receiver: Optional[AgentRole] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "MCPMessage":
+        """
+        Build a message without validation
+        
+        For messages the system produces itself, where the enum members and
+        dicts are already the right types. External input should go through
+        the normal constructor.
+        
+        Args:
+            message_type: Type of message
+            sender: Sending agent role
+            content: Message content
+            receiver: Target agent role, None for broadcast
+            metadata: Optional metadata
+            
+        Returns:
+            MCPMessage
+        """
+        values = {
+            "message_type": message_type,
+            "sender": sender,
+            "receiver": receiver,
+            "content": content,
+            "metadata": {} if metadata is None else metadata,
+        }
+        if not _MANUAL_CONSTRUCT:
+            return cls.model_construct(_fields_set=_MESSAGE_FIELDS, **values)
+
+        # Same end state as model_construct() at about half the cost: every
+        # field is given, so its per-field default handling is skipped
+        message = cls.__new__(cls)
+        object.__setattr__(message, "__dict__", values)
+        object.__setattr__(message, "__pydantic_fields_set__", set(_MESSAGE_FIELDS))
+        object.__setattr__(message, "__pydantic_extra__", None)
+        object.__setattr__(message, "__pydantic_private__", None)
+        return message
+    
+    @property
+    def correlation_id(self) -> Optional[str]:
+        """ID assigned to a request, if any"""
+        return self.metadata.get(CORRELATION_ID)
+    
+    @property
+    def in_reply_to(self) -> Optional[str]:
+        """Correlation ID of the request this message answers, if any"""
+        return self.metadata.get(IN_REPLY_TO)
+
+_MESSAGE_FIELDS = frozenset(MCPMessage.model_fields)
+
+# Fall back to model_construct() if pydantic changes the instance layout
+_MANUAL_CONSTRUCT = PYDANTIC_VERSION.startswith("2.") and tuple(BaseModel.__slots__) == PYDANTIC_SLOTS
+
+def new_correlation_id() -> str:
+    """Generate a unique correlation ID"""
+    return uuid.uuid4().hex
+
+def reply_metadata(request: MCPMessage) -> Dict[str, Any]:
+    """
+    Metadata for a reply to a request
+    
+    Args:
+        request: Message being answered
+        
+    Returns:
+        Metadata carrying the request's correlation ID, if it had one
+    """
+    return {IN_REPLY_TO: request.correlation_id} if request.correlation_id else {}
 
 class RequirementSpec(BaseModel):
     """Structured requirement specification"""
@@ -61,13 +145,62 @@ class TestCase(BaseModel):
     description: str
     expected_pass: bool = True
 
+class CallRecord(BaseModel):
+    """Metrics for a single model call"""
+    model_name: str
+    agent: Optional[str] = None
+    latency: float
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    tokens_per_second: float = 0.0
+    success: bool = True
+
 class UsageStats(BaseModel):
     """Model usage statistics"""
     model_name: str
     num_api_calls: int = 0
     total_tokens: int = 0
-    
+    cache_hits: int = 0
+    cached_tokens: int = 0
+    cache_latency_saved: float = 0.0
+    rate_limit_wait: float = 0.0
+    retries: int = 0
+    retry_wait: float = 0.0
+
     def add_call(self, tokens: int):
         """Add an API call to statistics"""
         self.num_api_calls += 1
         self.total_tokens += tokens
+
+    def add_cache_hit(self, tokens: int, latency: float):
+        """Add a response served from cache to statistics"""
+        self.cache_hits += 1
+        self.cached_tokens += tokens
+        self.cache_latency_saved += latency
+
+    def add_retry(self, delay: float):
+        """Add a retried call and its backoff delay to statistics"""
+        self.retries += 1
+        self.retry_wait += delay
+
+class FastPathStats(BaseModel):
+    """Local fast-path statistics for one agent"""
+    agent: str
+    hits: int = 0
+    misses: int = 0
+    local_seconds: float = 0.0
+
+    def add_hit(self, seconds: float):
+        """Add an input handled locally and the time it took"""
+        self.hits += 1
+        self.local_seconds += seconds
+
+    def add_miss(self):
+        """Add an input that had to go to the model"""
+        self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of inputs handled locally"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
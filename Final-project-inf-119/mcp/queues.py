@@ -0,0 +1,252 @@
+# Bounded message queues for MCP agents
+# Author: [Your Name] - [Student ID]
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Iterable, List, Optional
+from .protocol import MCPMessage, MessageType
+from config.api_config import MCP_QUEUE_STARVATION_LIMIT
+
+class OverflowPolicy(str, Enum):
+    """What a full queue does with a new message"""
+    BLOCK = "block"              # wait for space (up to block_timeout, then drop the new message)
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued message
+    DROP_NEWEST = "drop_newest"  # discard the incoming message
+
+# Priority lanes, most urgent first
+CONTROL_LANE = 0   # errors and cancellations
+NORMAL_LANE = 1    # requests and responses
+BULK_LANE = 2      # notifications / telemetry
+NUM_LANES = 3
+
+LANE_BY_TYPE = {
+    MessageType.ERROR: CONTROL_LANE,
+    MessageType.REQUEST: NORMAL_LANE,
+    MessageType.RESPONSE: NORMAL_LANE,
+    MessageType.NOTIFICATION: BULK_LANE,
+}
+
+# Request actions treated as control traffic
+CONTROL_ACTIONS = frozenset({"cancel"})
+
+# Metadata key that overrides the lane (0-2) of a message
+PRIORITY = "priority"
+
+def message_lane(message: MCPMessage) -> int:
+    """
+    Priority lane of a message
+
+    An explicit metadata "priority" wins; otherwise (or when it is not a
+    number) the lane follows the message type, with cancel requests
+    promoted to the control lane.
+
+    Args:
+        message: Message being queued
+
+    Returns:
+        Lane index (0 is served first)
+    """
+    priority = message.metadata.get(PRIORITY)
+    if priority is not None:
+        try:
+            return min(max(int(priority), 0), NUM_LANES - 1)
+        except (TypeError, ValueError, OverflowError):
+            # A malformed priority must not fail delivery to other recipients
+            pass
+    if message.message_type == MessageType.REQUEST and message.content.get("action") in CONTROL_ACTIONS:
+        return CONTROL_LANE
+    return LANE_BY_TYPE[message.message_type]
+
+class BoundedMessageQueue:
+    """
+    Fixed-capacity priority queue of MCP messages with an overflow policy
+    Messages sit in per-priority FIFO lanes (control, normal, bulk) that
+    share one capacity. get() serves the most urgent waiting lane, except
+    that a lane passed over starvation_limit times in a row is served next.
+    When full, room is made at the expense of less urgent lanes first, so a
+    flood of notifications cannot push out an error. Drops are counted so
+    memory stays flat under sustained traffic and the loss is still visible.
+
+    Order is only preserved within a lane: a notification queued before a
+    request may be delivered after it.
+    """
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                 block_timeout: Optional[float] = None, prioritize: bool = True,
+                 starvation_limit: int = MCP_QUEUE_STARVATION_LIMIT):
+        """
+        Initialize the queue
+
+        Args:
+            maxsize: Maximum number of queued messages
+            policy: Overflow policy when the queue is full
+            block_timeout: For BLOCK, seconds to wait for space before
+                dropping the new message (None waits indefinitely)
+            prioritize: Use priority lanes; False gives a plain FIFO
+            starvation_limit: Times a waiting lane may be passed over before
+                it is served ahead of more urgent lanes
+        """
+        self.maxsize = maxsize
+        self.policy = OverflowPolicy(policy)
+        self.block_timeout = block_timeout
+        self.prioritize = prioritize
+        self.starvation_limit = starvation_limit
+        self.dropped = 0
+
+        self._lanes = [deque() for _ in range(NUM_LANES)]
+        self._skipped = [0] * NUM_LANES
+        self._size = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def qsize(self) -> int:
+        """Number of queued messages"""
+        return self._size
+
+    def lane_sizes(self) -> List[int]:
+        """Number of queued messages per lane, most urgent first"""
+        with self._lock:
+            return [len(lane) for lane in self._lanes]
+
+    def put(self, message: MCPMessage) -> bool:
+        """
+        Enqueue a message, applying the overflow policy if full
+
+        Args:
+            message: Message to enqueue
+
+        Returns:
+            True if the message was queued, False if it was dropped
+        """
+        with self._lock:
+            return self._put_locked(message)
+
+    def put_many(self, messages: Iterable[MCPMessage]) -> int:
+        """
+        Enqueue several messages under one lock acquisition
+
+        Args:
+            messages: Messages to enqueue, in order
+
+        Returns:
+            Number of messages queued (the rest were dropped)
+        """
+        with self._lock:
+            return sum(self._put_locked(message) for message in messages)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[MCPMessage]:
+        """
+        Dequeue the next message by priority
+
+        Args:
+            timeout: Seconds to wait for a message (None waits indefinitely)
+
+        Returns:
+            MCPMessage or None on timeout
+        """
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: self._size, timeout):
+                return None
+            message = self._pop_next()
+            self._not_full.notify()
+            return message
+
+    def get_many(self, max_n: Optional[int] = None, timeout: Optional[float] = None) -> List[MCPMessage]:
+        """
+        Dequeue up to max_n messages at once, in priority order
+
+        Waits up to timeout for the first message, then takes whatever else
+        is already queued without waiting further.
+
+        Args:
+            max_n: Maximum number of messages (None for all queued)
+            timeout: Seconds to wait for the first message (None waits indefinitely)
+
+        Returns:
+            List of messages, empty on timeout
+        """
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: self._size, timeout):
+                return []
+            count = self._size if max_n is None else min(max_n, self._size)
+            messages = [self._pop_next() for _ in range(count)]
+            self._not_full.notify(count)
+            return messages
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the queue holds at least one message, without taking it
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a message is queued, False on timeout
+        """
+        with self._lock:
+            return bool(self._not_empty.wait_for(lambda: self._size, timeout))
+
+    def _put_locked(self, message: MCPMessage) -> bool:
+        """Enqueue one message applying the overflow policy (caller holds the lock)"""
+        lane = message_lane(message) if self.prioritize else NORMAL_LANE
+
+        if self._size >= self.maxsize:
+            victim = self._least_urgent_lane()
+            if victim > lane:
+                # Less urgent traffic makes room regardless of policy
+                self._evict(victim)
+            elif victim == lane and self.policy == OverflowPolicy.DROP_OLDEST:
+                self._evict(victim)
+            elif self.policy != OverflowPolicy.BLOCK or not self._wait_for_space():
+                # Never evict more urgent messages for this one
+                self.dropped += 1
+                return False
+
+        self._lanes[lane].append(message)
+        self._size += 1
+        self._not_empty.notify()
+        return True
+
+    def _least_urgent_lane(self) -> int:
+        """Highest-numbered non-empty lane (caller holds the lock, queue not empty)"""
+        for lane in range(NUM_LANES - 1, -1, -1):
+            if self._lanes[lane]:
+                return lane
+        return NORMAL_LANE
+
+    def _evict(self, lane: int) -> None:
+        """Drop one message from a lane per the policy (caller holds the lock)"""
+        if self.policy == OverflowPolicy.DROP_NEWEST:
+            self._lanes[lane].pop()
+        else:
+            self._lanes[lane].popleft()
+        self._size -= 1
+        self.dropped += 1
+
+    def _pop_next(self) -> MCPMessage:
+        """Take the next message by priority and starvation (caller holds the lock, queue not empty)"""
+        waiting = [lane for lane in range(NUM_LANES) if self._lanes[lane]]
+        chosen = waiting[0]
+
+        # A lane passed over too often goes first, the longest-starved one winning
+        starved = [lane for lane in waiting[1:] if self._skipped[lane] >= self.starvation_limit]
+        if starved:
+            chosen = max(starved, key=lambda lane: self._skipped[lane])
+
+        for lane in waiting:
+            self._skipped[lane] = 0 if lane == chosen else self._skipped[lane] + 1
+        self._size -= 1
+        return self._lanes[chosen].popleft()
+
+    def _wait_for_space(self) -> bool:
+        """Wait until the queue has room (caller holds the lock)"""
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        while self._size >= self.maxsize:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._not_full.wait(remaining)
+        return True
@@ -0,0 +1,126 @@
+# Compact MCP message serialization
+# Author: [Your Name] - [Student ID]
+#
+# A message is encoded as a JSON array instead of an object:
+#   [type, sender, receiver, content, metadata]
+# where type/sender/receiver are small integer codes (receiver is null for
+# broadcasts) and metadata is omitted when empty. Field names and enum
+# strings are not repeated in every message, and decoding skips pydantic
+# validation because only this module produces the encoding.
+#
+# orjson (installed with gradio) is used when available; the standard
+# library json module produces equivalent output otherwise.
+
+import json
+from typing import Iterable, List, Union
+from .protocol import MCPMessage, AgentRole, MessageType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Codes are positions in these tuples; only append new members at the end
+MESSAGE_TYPES = tuple(MessageType)
+AGENT_ROLES = tuple(AgentRole)
+
+_TYPE_CODES = {member: code for code, member in enumerate(MESSAGE_TYPES)}
+_ROLE_CODES = {member: code for code, member in enumerate(AGENT_ROLES)}
+
+if orjson is not None:
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def _dumps(data) -> bytes:
+        return _encoder.encode(data).encode("utf-8")
+
+    def _loads(data: Union[bytes, str]):
+        return json.loads(data)
+
+def to_compact(message: MCPMessage) -> list:
+    """Compact array form of a message"""
+    receiver = message.receiver
+    item = [
+        _TYPE_CODES[message.message_type],
+        _ROLE_CODES[message.sender],
+        None if receiver is None else _ROLE_CODES[receiver],
+        message.content,
+    ]
+    if message.metadata:
+        item.append(message.metadata)
+    return item
+
+def from_compact(item: list) -> MCPMessage:
+    """Rebuild a message from its compact array form (no validation)"""
+    receiver = item[2]
+    return MCPMessage.fast(
+        MESSAGE_TYPES[item[0]],
+        AGENT_ROLES[item[1]],
+        item[3],
+        receiver=None if receiver is None else AGENT_ROLES[receiver],
+        metadata=item[4] if len(item) > 4 else None,
+    )
+
+def encode(message: MCPMessage) -> bytes:
+    """
+    Encode one message
+
+    Args:
+        message: Message to encode
+
+    Returns:
+        UTF-8 bytes of the compact form
+    """
+    return _dumps(to_compact(message))
+
+_lossy_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+def encode_lossy(message: MCPMessage) -> bytes:
+    """
+    Encode one message, whatever its content
+
+    Values JSON cannot represent (sets, objects, integers beyond 64 bits
+    for orjson) are written as their str(), so the result may not decode
+    back to an equal message. For history sizing and spilling, which must
+    never stop a message from being delivered.
+
+    Args:
+        message: Message to encode
+
+    Returns:
+        UTF-8 bytes of the compact form
+    """
+    try:
+        return encode(message)
+    except (TypeError, ValueError):
+        return _lossy_encoder.encode(to_compact(message)).encode("utf-8")
+
+def decode(data: Union[bytes, str]) -> MCPMessage:
+    """
+    Decode one message
+
+    Lines written by model_dump_json (a JSON object) are also accepted, so
+    older history spill files stay readable.
+
+    Args:
+        data: Encoded message
+
+    Returns:
+        MCPMessage
+    """
+    item = _loads(data)
+    if isinstance(item, dict):
+        return MCPMessage.model_validate(item)
+    return from_compact(item)
+
+def encode_many(messages: Iterable[MCPMessage]) -> bytes:
+    """Encode a list of messages as one JSON array"""
+    return _dumps([to_compact(message) for message in messages])
+
+def decode_many(data: Union[bytes, str]) -> List[MCPMessage]:
+    """Decode the output of encode_many"""
+    return [from_compact(item) for item in _loads(data)]
@@ -1,10 +1,38 @@
 # MCP Server implementation
 # Author: [Your Name] - [Student ID]
 
-from typing import Dict, List, Optional, Callable
-from queue import Queue
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Callable, Set
 import threading
 from .protocol import MCPMessage, AgentRole, MessageType
+from .history import MessageHistory
+from .queues import BoundedMessageQueue, OverflowPolicy
+from config.api_config import (
+    MCP_HISTORY_CAPACITY, MCP_HISTORY_MAX_BYTES, MCP_HISTORY_SPILL_PATH,
+    MCP_QUEUE_MAXSIZE, MCP_QUEUE_POLICY, MCP_QUEUE_BLOCK_TIMEOUT, MCP_QUEUE_PRIORITY_LANES,
+)
+
+# Subscribing to this topic receives every broadcast
+ALL_TOPICS = "*"
+
+def message_topics(message: MCPMessage) -> Set[str]:
+    """
+    Topics a message is published under
+    
+    Every message is published under its message type ("notification",
+    "error", ...); notifications carrying an "event" field are also
+    published under the event name (e.g. "api_call").
+    
+    Args:
+        message: Message being routed
+        
+    Returns:
+        Set of topic names
+    """
+    topics = {message.message_type.value}
+    event = message.content.get("event")
+    if isinstance(event, str):
+        topics.add(event)
+    return topics
 
 class MCPServer:
     """
@@ -12,20 +40,52 @@ class MCPServer:
     Manages communication between agents
     """
     
-    def __init__(self):
-        """Initialize the MCP server"""
-        # Message queues for each agent
-        self.agent_queues: Dict[AgentRole, Queue] = {
-            role: Queue() for role in AgentRole
+    def __init__(
+        self,
+        history_capacity: int = MCP_HISTORY_CAPACITY,
+        history_max_bytes: int = MCP_HISTORY_MAX_BYTES,
+        history_spill_path: Optional[str] = MCP_HISTORY_SPILL_PATH,
+        queue_maxsize: int = MCP_QUEUE_MAXSIZE,
+        queue_policy: OverflowPolicy = MCP_QUEUE_POLICY,
+        queue_block_timeout: Optional[float] = MCP_QUEUE_BLOCK_TIMEOUT,
+        queue_priority_lanes: bool = MCP_QUEUE_PRIORITY_LANES,
+    ):
+        """
+        Initialize the MCP server
+        
+        Args:
+            history_capacity: Maximum number of messages kept in memory
+            history_max_bytes: Approximate memory budget for the history
+            history_spill_path: Optional JSONL file for evicted messages
+            queue_maxsize: Default capacity of each agent queue
+            queue_policy: Default overflow policy of each agent queue
+            queue_block_timeout: Longest a BLOCK-policy send waits for space
+            queue_priority_lanes: Serve errors/cancels, then requests and
+                responses, ahead of notifications (False for plain FIFOs)
+        """
+        # Bounded message queues for each agent
+        self.agent_queues: Dict[AgentRole, BoundedMessageQueue] = {
+            role: BoundedMessageQueue(
+                queue_maxsize, queue_policy, queue_block_timeout, prioritize=queue_priority_lanes
+            )
+            for role in AgentRole
         }
         
+        # Broadcast topics each agent subscribed to; roles without an
+        # entry only receive messages addressed to them directly.
+        # Replaced wholesale on change so senders can read it without locking.
+        self.subscriptions: Dict[AgentRole, FrozenSet[str]] = {}
+        
         # Registered agents and their handlers
         self.agent_handlers: Dict[AgentRole, Callable] = {}
         
-        # Message history for debugging
-        self.message_history: List[MCPMessage] = []
+        # Bounded message history for debugging
+        self.message_history = MessageHistory(
+            history_capacity, history_max_bytes, history_spill_path
+        )
         
-        # Server state
+        # Server state; the lock only guards registration and subscription
+        # changes, each queue and the history have their own locks
         self.running = False
         self.lock = threading.Lock()
     
@@ -40,24 +100,109 @@ class MCPServer:
         with self.lock:
             self.agent_handlers[role] = handler
     
-    def send_message(self, message: MCPMessage):
+    def subscribe(
+        self,
+        role: AgentRole,
+        topics: Optional[Iterable[str]] = None,
+        maxsize: Optional[int] = None,
+        policy: Optional[OverflowPolicy] = None,
+    ):
         """
-        Send a message to an agent
+        Subscribe an agent to broadcast topics
         
         Args:
-            message: MCPMessage to send
+            role: Agent role
+            topics: Message types or notification event names; None for all
+            maxsize: Optional new capacity for the agent's queue
+            policy: Optional new overflow policy for the agent's queue
         """
         with self.lock:
-            # Store in history
-            self.message_history.append(message)
+            subscriptions = dict(self.subscriptions)
+            added = [ALL_TOPICS] if topics is None else topics
+            subscriptions[role] = subscriptions.get(role, frozenset()).union(added)
+            self.subscriptions = subscriptions
             
-            # Route to appropriate queue
-            if message.receiver:
-                self.agent_queues[message.receiver].put(message)
+            queue = self.agent_queues[role]
+            if maxsize is not None:
+                queue.maxsize = maxsize
+            if policy is not None:
+                queue.policy = OverflowPolicy(policy)
+    
+    def unsubscribe(self, role: AgentRole, topics: Optional[Iterable[str]] = None):
+        """
+        Remove broadcast subscriptions
+        
+        Args:
+            role: Agent role
+            topics: Topics to drop; None drops all of them
+        """
+        with self.lock:
+            subscriptions = dict(self.subscriptions)
+            remaining = frozenset() if topics is None else subscriptions.get(role, frozenset()).difference(topics)
+            if remaining:
+                subscriptions[role] = remaining
             else:
-                # Broadcast to all agents
-                for queue in self.agent_queues.values():
-                    queue.put(message)
+                subscriptions.pop(role, None)
+            self.subscriptions = subscriptions
+    
+    def _route(self, message: MCPMessage) -> List[BoundedMessageQueue]:
+        """
+        Queues a message should be delivered to
+        
+        Args:
+            message: Message being routed
+            
+        Returns:
+            List of target queues
+        """
+        if message.receiver:
+            return [self.agent_queues[message.receiver]]
+        
+        topics = message_topics(message)
+        return [
+            self.agent_queues[role]
+            for role, subscribed in self.subscriptions.items()
+            if ALL_TOPICS in subscribed or topics & subscribed
+        ]
+    
+    def send_message(self, message: MCPMessage):
+        """
+        Send a message to an agent
+        
+        Directed messages go to the receiver's queue. Broadcasts go only to
+        agents subscribed to one of the message's topics.
+        
+        Args:
+            message: MCPMessage to send
+        """
+        # Store in history
+        self.message_history.append(message)
+        
+        # Route to appropriate queues; only the target queue locks are taken
+        for queue in self._route(message):
+            queue.put(message)
+    
+    def send_many(self, messages: Iterable[MCPMessage]) -> None:
+        """
+        Send several messages, taking each lock once per batch
+        
+        Per-receiver ordering matches the order of messages.
+        
+        Args:
+            messages: Messages to send
+        """
+        messages = list(messages)
+        self.message_history.extend(messages)
+        
+        batches: Dict[int, List[MCPMessage]] = {}
+        queues: Dict[int, BoundedMessageQueue] = {}
+        for message in messages:
+            for queue in self._route(message):
+                batches.setdefault(id(queue), []).append(message)
+                queues[id(queue)] = queue
+        
+        for key, batch in batches.items():
+            queues[key].put_many(batch)
     
     def get_message(self, role: AgentRole, timeout: Optional[float] = None) -> Optional[MCPMessage]:
         """
@@ -70,39 +215,72 @@ class MCPServer:
         Returns:
             MCPMessage or None if timeout
         """
-        try:
-            return self.agent_queues[role].get(timeout=timeout)
-        except:
-            return None
+        return self.agent_queues[role].get(timeout=timeout)
+    
+    def drain(self, role: AgentRole, max_n: Optional[int] = None, timeout: Optional[float] = None) -> List[MCPMessage]:
+        """
+        Get a batch of messages for a specific agent
+        
+        Waits up to timeout for the first message, then returns it together
+        with whatever else is already queued (up to max_n).
+        
+        Args:
+            role: Agent role
+            max_n: Maximum number of messages, None for all queued
+            timeout: Timeout in seconds for the first message
+            
+        Returns:
+            List of messages, empty if timeout
+        """
+        return self.agent_queues[role].get_many(max_n, timeout)
     
     def broadcast(self, sender: AgentRole, content: Dict, message_type: MessageType = MessageType.NOTIFICATION):
         """
-        Broadcast a message to all agents
+        Broadcast a message to all subscribed agents
         
         Args:
             sender: Sending agent role
             content: Message content
             message_type: Type of message
         """
-        message = MCPMessage(
-            message_type=message_type,
-            sender=sender,
-            receiver=None,
-            content=content
-        )
+        message = MCPMessage.fast(message_type, sender, content)
         self.send_message(message)
     
-    def get_history(self) -> List[MCPMessage]:
+    def get_history(self, offset: int = 0, limit: Optional[int] = None) -> List[MCPMessage]:
         """
-        Get message history
+        Get a page of message history, oldest first
+        
+        Spilled messages (if a spill file is configured) come before the
+        ones still in memory.
         
+        Args:
+            offset: Index of the first message to return
+            limit: Maximum number of messages, None for all remaining
+            
         Returns:
-            List of all messages
+            List of messages
         """
-        with self.lock:
-            return self.message_history.copy()
+        return self.message_history.page(offset, limit)
+    
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue depth and drop counters per agent
+        
+        Returns:
+            Dictionary keyed by role value
+        """
+        return {
+            role.value: {
+                "size": queue.qsize(),
+                "maxsize": queue.maxsize,
+                "policy": queue.policy.value,
+                "dropped": queue.dropped,
+                "lanes": queue.lane_sizes(),
+                "subscriptions": sorted(self.subscriptions.get(role, ())),
+            }
+            for role, queue in self.agent_queues.items()
+        }
     
     def clear_history(self):
         """Clear message history"""
-        with self.lock:
-            self.message_history.clear()
+        self.message_history.clear()
@@ -0,0 +1,380 @@
+import threading
+import time
+import pytest
+from pydantic import BaseModel, VERSION as PYDANTIC_VERSION
+from mcp import (
+    MCPServer, MCPClient, MCPMessage, AgentRole, MessageType, MCPDispatcher, MCPSocketServer,
+    RemoteMCPServer, MCPCallError, BoundedMessageQueue, protocol, serialization,
+)
+from mcp.queues import BULK_LANE, CONTROL_LANE, NORMAL_LANE, message_lane
+from mcp.transport import OP_SEND
+
+def _note(i):
+    return MCPMessage(
+        message_type=MessageType.NOTIFICATION,
+        sender=AgentRole.PARSER,
+        content={"event": "tick", "i": i},
+    )
+
+# MessageHistory ring buffer
+def test_history_is_bounded_and_pages_in_memory():
+    server = MCPServer(history_capacity=3)
+    for i in range(5):
+        server.send_message(_note(i))
+
+    assert len(server.message_history) == 3
+    assert [m.content["i"] for m in server.get_history()] == [2, 3, 4]
+    assert [m.content["i"] for m in server.get_history(offset=1, limit=1)] == [3]
+
+def test_history_spills_evicted_messages_to_disk(tmp_path):
+    spill = str(tmp_path / "history.jsonl")
+    server = MCPServer(history_capacity=2, history_spill_path=spill)
+    for i in range(600):
+        server.send_message(_note(i))
+
+    assert server.message_history.total == 600
+    assert [m.content["i"] for m in server.get_history(offset=300, limit=3)] == [300, 301, 302]
+    assert [m.content["i"] for m in server.get_history(offset=597)] == [597, 598, 599]
+
+    # A new server on the same file picks up where the old one stopped
+    server.message_history.close()
+    reopened = MCPServer(history_capacity=2, history_spill_path=spill)
+    assert reopened.message_history.total == 598
+
+def test_history_respects_memory_budget():
+    server = MCPServer(history_capacity=100, history_max_bytes=300)
+    for i in range(10):
+        server.send_message(_note(i))
+    assert server.message_history.memory_bytes <= 300
+    assert len(server.message_history) < 10
+
+def test_history_never_blocks_content_json_cannot_hold(tmp_path):
+    server = MCPServer(history_capacity=1, history_spill_path=str(tmp_path / "history.jsonl"))
+    client = MCPClient(server, AgentRole.TRACKING)
+    client.notify({"n": 2**70})
+    client.notify({"s": {1, 2}})
+    client.notify({"i": 3})
+
+    assert server.message_history.total == 3
+    assert server.get_history(limit=1)[0].content["n"] == 2**70
+    assert server.get_history(offset=1, limit=1)[0].content["s"] == "{1, 2}"
+
+# Subscriptions and bounded queues
+def test_broadcast_reaches_only_subscribers():
+    server = MCPServer()
+    MCPClient(server, AgentRole.TRACKING).subscribe(["tick"])
+    MCPClient(server, AgentRole.DESIGN).subscribe(["api_call"])
+
+    server.send_message(_note(1))
+
+    assert server.get_message(AgentRole.TRACKING, timeout=0.1).content["i"] == 1
+    assert server.get_message(AgentRole.DESIGN, timeout=0.01) is None
+    assert server.get_message(AgentRole.TEST_GEN, timeout=0.01) is None
+
+    # Directed messages ignore subscriptions
+    server.send_message(_note(2).model_copy(update={"receiver": AgentRole.TEST_GEN}))
+    assert server.get_message(AgentRole.TEST_GEN, timeout=0.1).content["i"] == 2
+
+@pytest.mark.parametrize("policy, kept", [("drop_oldest", [2, 3]), ("drop_newest", [0, 1])])
+def test_full_queue_applies_overflow_policy(policy, kept):
+    server = MCPServer()
+    server.subscribe(AgentRole.TRACKING, maxsize=2, policy=policy)
+    for i in range(4):
+        server.send_message(_note(i))
+
+    received = [server.get_message(AgentRole.TRACKING, timeout=0.1).content["i"] for _ in range(2)]
+    assert received == kept
+    assert server.get_queue_stats()["tracking"]["dropped"] == 2
+
+def test_block_policy_drops_after_timeout():
+    server = MCPServer(queue_maxsize=1, queue_policy="block", queue_block_timeout=0.05)
+    server.subscribe(AgentRole.TRACKING)
+    server.send_message(_note(0))
+    server.send_message(_note(1))
+
+    assert server.get_queue_stats()["tracking"]["dropped"] == 1
+    assert server.get_message(AgentRole.TRACKING, timeout=0.1).content["i"] == 0
+
+# Batched send/receive
+def test_send_many_and_drain_preserve_order():
+    server = MCPServer()
+    server.subscribe(AgentRole.TRACKING)
+    server.send_many(_note(i) for i in range(5))
+
+    assert [m.content["i"] for m in server.drain(AgentRole.TRACKING, max_n=3, timeout=0.1)] == [0, 1, 2]
+    assert [m.content["i"] for m in server.drain(AgentRole.TRACKING, timeout=0.1)] == [3, 4]
+    assert server.drain(AgentRole.TRACKING, timeout=0.01) == []
+    assert server.message_history.total == 5
+
+def test_concurrent_senders_lose_nothing():
+    server = MCPServer(history_capacity=10000, queue_maxsize=10000)
+    server.subscribe(AgentRole.TRACKING)
+
+    def produce(base):
+        for i in range(200):
+            server.send_message(_note(base + i))
+
+    threads = [threading.Thread(target=produce, args=(n * 1000,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    received = server.drain(AgentRole.TRACKING, timeout=0.1)
+    assert len(received) == 1600
+    assert server.message_history.total == 1600
+
+# Handler dispatch
+def _request(sender, i):
+    return MCPMessage(
+        message_type=MessageType.REQUEST,
+        sender=sender,
+        receiver=AgentRole.DESIGN,
+        content={"i": i},
+    )
+
+def test_dispatcher_keeps_per_sender_order_and_runs_senders_in_parallel():
+    server = MCPServer()
+    seen = {AgentRole.PARSER: [], AgentRole.CODE_GEN: []}
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(message):
+        with lock:
+            running.append(message)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(message)
+            seen[message.sender].append(message.content["i"])
+
+    server.register_agent(AgentRole.DESIGN, handler)
+    with MCPDispatcher(server, role_concurrency={AgentRole.DESIGN: 2}) as dispatcher:
+        server.send_many(_request(sender, i) for i in range(10) for sender in seen)
+        assert dispatcher.wait_idle(timeout=5)
+        assert dispatcher.get_stats()["design"]["handled"] == 20
+
+    assert seen[AgentRole.PARSER] == list(range(10))
+    assert seen[AgentRole.CODE_GEN] == list(range(10))
+    assert max(peak) == 2
+
+def test_dispatcher_replies_with_error_when_handler_fails():
+    server = MCPServer()
+
+    def handler(message):
+        raise ValueError("boom")
+
+    server.register_agent(AgentRole.DESIGN, handler)
+    with MCPDispatcher(server) as dispatcher:
+        server.send_message(_request(AgentRole.PARSER, 0))
+        assert dispatcher.wait_idle(timeout=5)
+        assert dispatcher.get_stats()["design"]["failed"] == 1
+
+    error = server.get_message(AgentRole.PARSER, timeout=1)
+    assert error.message_type == MessageType.ERROR
+    assert error.content["error"] == "boom"
+
+class _UnreachableRepliesServer(MCPServer):
+    """Server whose replies from DESIGN fail to send, like a dropped connection"""
+
+    def send_message(self, message):
+        if message.sender == AgentRole.DESIGN:
+            raise ConnectionError("connection lost")
+        super().send_message(message)
+
+def test_dispatcher_keeps_serving_a_sender_when_replies_fail():
+    server = _UnreachableRepliesServer()
+    handled = []
+
+    def handler(message):
+        handled.append(message.content["i"])
+        if message.content["i"] == 1:
+            raise ValueError("boom")
+        return MCPMessage.fast(MessageType.RESPONSE, AgentRole.DESIGN, {}, receiver=message.sender)
+
+    server.register_agent(AgentRole.DESIGN, handler)
+    with MCPDispatcher(server) as dispatcher:
+        for i in range(3):
+            server.send_message(_request(AgentRole.PARSER, i))
+        assert dispatcher.wait_idle(timeout=5)
+        server.send_message(_request(AgentRole.PARSER, 3))
+        assert dispatcher.wait_idle(timeout=5)
+        stats = dispatcher.get_stats()["design"]
+
+    assert handled == [0, 1, 2, 3]
+    assert (stats["handled"], stats["failed"]) == (4, 4)
+
+# Socket transport
+@pytest.mark.parametrize("use_unix", [False, True])
+def test_client_talks_to_server_over_socket(tmp_path, use_unix):
+    address = str(tmp_path / "mcp.sock") if use_unix else ("127.0.0.1", 0)
+    server = MCPServer()
+
+    with MCPSocketServer(server, address) as socket_server:
+        remote = RemoteMCPServer(socket_server.address)
+        parser = MCPClient(remote, AgentRole.PARSER)
+        design = MCPClient(remote, AgentRole.DESIGN)
+
+        design.subscribe(["tick"])
+        parser.send_request(AgentRole.DESIGN, {"action": "create_design"})
+        remote.send_many(_note(i) for i in range(3))
+
+        request = design.receive_message(timeout=1)
+        assert request.content == {"action": "create_design"}
+        assert request.sender == AgentRole.PARSER
+        assert [m.content["i"] for m in design.receive_many(timeout=1)] == [0, 1, 2]
+        assert parser.receive_message(timeout=0.05) is None
+        remote.close()
+
+    assert server.message_history.total == 4
+
+def test_malformed_one_way_send_does_not_shift_replies(tmp_path):
+    server = MCPServer()
+    with MCPSocketServer(server, str(tmp_path / "mcp.sock")) as socket_server:
+        remote = RemoteMCPServer(socket_server.address)
+        design = MCPClient(remote, AgentRole.DESIGN)
+
+        remote._call(OP_SEND, b"[3,99,null,{}]", expect_reply=False)
+        remote.send_message(_request(AgentRole.PARSER, 7))
+        assert [m.content["i"] for m in remote.drain(AgentRole.DESIGN, timeout=1)] == [7]
+        assert design.receive_message(timeout=0.05) is None
+        remote.close()
+
+# Correlated calls
+def _echo_with_delay(message):
+    time.sleep(message.content["delay"])
+    if message.content.get("fail"):
+        raise ValueError("bad request")
+    return MCPMessage(
+        message_type=MessageType.RESPONSE,
+        sender=AgentRole.DESIGN,
+        receiver=message.sender,
+        content={"i": message.content["i"]},
+        metadata={"in_reply_to": message.correlation_id},
+    )
+
+def test_concurrent_calls_get_their_own_replies():
+    server = MCPServer()
+    server.register_agent(AgentRole.DESIGN, _echo_with_delay)
+    client = MCPClient(server, AgentRole.PARSER)
+
+    with MCPDispatcher(server, default_role_concurrency=8):
+        # Later calls finish first, so replies arrive out of order
+        futures = [client.call(AgentRole.DESIGN, {"i": i, "delay": 0.05 * (5 - i)}) for i in range(5)]
+        assert [f.result(timeout=5).content["i"] for f in futures] == list(range(5))
+
+        failed = client.call(AgentRole.DESIGN, {"i": 0, "delay": 0, "fail": True})
+        with pytest.raises(MCPCallError, match="bad request"):
+            failed.result(timeout=5)
+
+        slow = client.call(AgentRole.DESIGN, {"i": 0, "delay": 1.0}, timeout=0.1)
+        with pytest.raises(TimeoutError):
+            slow.result(timeout=5)
+
+        # Uncorrelated traffic still reaches receive_message
+        server.send_message(_note(7).model_copy(update={"receiver": AgentRole.PARSER}))
+        assert client.receive_message(timeout=1).content["i"] == 7
+
+    client.close()
+
+# Fast construction and compact serialization
+def test_fast_message_round_trips_through_compact_encoding():
+    message = MCPMessage(
+        message_type=MessageType.REQUEST,
+        sender=AgentRole.UI_GEN,
+        receiver=AgentRole.PARSER,
+        content={"requirements": "Español", "n": [1, 2.5, None]},
+        metadata={"correlation_id": "abc"},
+    )
+    fast = MCPMessage.fast(
+        MessageType.REQUEST, AgentRole.UI_GEN, dict(message.content),
+        receiver=AgentRole.PARSER, metadata={"correlation_id": "abc"},
+    )
+    assert fast == message
+    assert fast.model_dump_json() == message.model_dump_json()
+
+    encoded = serialization.encode(message)
+    assert len(encoded) < len(message.model_dump_json())
+    assert serialization.decode(encoded) == message
+    assert serialization.decode_many(serialization.encode_many([message, _note(1)])) == [message, _note(1)]
+
+    # History spill lines written before the compact format still load
+    assert serialization.decode(message.model_dump_json()) == message
+
+def test_fast_message_matches_model_construct_on_installed_pydantic(monkeypatch):
+    # MCPMessage.fast writes these slots itself; a pydantic upgrade that
+    # changes them must be caught here, not by corrupted messages
+    assert PYDANTIC_VERSION.startswith("2.")
+    assert tuple(BaseModel.__slots__) == protocol.PYDANTIC_SLOTS
+    assert protocol._MANUAL_CONSTRUCT
+
+    args = (MessageType.REQUEST, AgentRole.UI_GEN, {"a": 1})
+    manual = MCPMessage.fast(*args, metadata={"k": "v"})
+    monkeypatch.setattr(protocol, "_MANUAL_CONSTRUCT", False)
+    constructed = MCPMessage.fast(*args, metadata={"k": "v"})
+
+    for slot in protocol.PYDANTIC_SLOTS:
+        assert getattr(manual, slot) == getattr(constructed, slot)
+    assert manual.model_dump() == constructed.model_dump()
+
+# Priority lanes
+def _error(i):
+    return MCPMessage(
+        message_type=MessageType.ERROR,
+        sender=AgentRole.DESIGN,
+        receiver=AgentRole.TRACKING,
+        content={"error": "failed", "i": i},
+    )
+
+def test_errors_and_cancels_overtake_notification_flood():
+    queue = BoundedMessageQueue(maxsize=100, starvation_limit=1000)
+    for i in range(50):
+        queue.put(_note(i))
+    queue.put(_error(0))
+    queue.put(_request(AgentRole.PARSER, 1))
+    queue.put(MCPMessage(message_type=MessageType.REQUEST, sender=AgentRole.PARSER, content={"action": "cancel"}))
+
+    first = queue.get_many(max_n=3)
+    assert [m.message_type for m in first] == [MessageType.ERROR, MessageType.REQUEST, MessageType.REQUEST]
+    assert first[1].content == {"action": "cancel"}
+    assert queue.lane_sizes() == [0, 0, 50]
+
+def test_full_queue_sheds_notifications_before_errors():
+    queue = BoundedMessageQueue(maxsize=3, policy="drop_newest")
+    for i in range(3):
+        queue.put(_note(i))
+    assert queue.put(_error(0))
+    assert queue.dropped == 1
+    assert [m.content["i"] for m in queue.get_many()] == [0, 0, 1]
+
+    # A queue full of errors refuses notifications instead of evicting errors
+    for i in range(3):
+        queue.put(_error(i))
+    assert not queue.put(_note(9))
+    assert queue.lane_sizes() == [3, 0, 0]
+
+def test_lower_lanes_are_not_starved():
+    queue = BoundedMessageQueue(maxsize=100, starvation_limit=4)
+    for i in range(20):
+        queue.put(_error(i))
+    queue.put(_note(0))
+
+    order = [m.message_type for m in queue.get_many(max_n=6)]
+    assert order.index(MessageType.NOTIFICATION) == 4
+
+def test_malformed_priority_falls_back_to_type_lane():
+    def with_priority(message, priority):
+        return message.model_copy(update={"metadata": {"priority": priority}})
+
+    assert message_lane(with_priority(_note(0), "0")) == CONTROL_LANE
+    assert message_lane(with_priority(_note(0), 7)) == BULK_LANE
+    assert message_lane(with_priority(_note(0), "high")) == BULK_LANE
+    assert message_lane(with_priority(_error(0), [1])) == CONTROL_LANE
+    assert message_lane(with_priority(_request(AgentRole.PARSER, 1), float("inf"))) == NORMAL_LANE
+
+    # One malformed message does not break a batch for the others
+    server = MCPServer()
+    client = MCPClient(server, AgentRole.TRACKING)
+    server.send_many([with_priority(_error(0), "high"), _error(1)])
+    assert [m.content["i"] for m in client.receive_many(timeout=1)] == [0, 1]
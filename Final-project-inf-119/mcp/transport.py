@@ -0,0 +1,377 @@
+# MCP Transport - Socket server and client proxy for out-of-process agents
+# Author: [Your Name] - [Student ID]
+#
+# Frame layout (all integers big-endian):
+#   4 bytes  payload length
+#   1 byte   op code
+#   N bytes  payload: messages in the compact form from mcp.serialization,
+#            other arguments and replies as UTF-8 JSON
+#
+# SEND / SEND_MANY are one-way (a malformed one is logged and dropped);
+# every other op gets exactly one OK or ERROR frame back. Requests on a connection are handled in order, so a
+# GET issued after a SEND on the same connection sees that send.
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from .protocol import MCPMessage, AgentRole
+from .server import MCPServer
+from .dispatcher import call_handler
+from .serialization import encode, decode, encode_many, decode_many
+from config.api_config import MCP_SERVER_HOST, MCP_SERVER_PORT, MCP_SERVER_SOCKET
+
+# Op codes
+OP_SEND = 1
+OP_SEND_MANY = 2
+OP_GET = 3
+OP_DRAIN = 4
+OP_SUBSCRIBE = 5
+OP_UNSUBSCRIBE = 6
+OP_OK = 0x80
+OP_ERROR = 0x81
+
+HEADER = struct.Struct(">IB")
+
+# Ops the client does not read a reply for
+ONE_WAY_OPS = frozenset({OP_SEND, OP_SEND_MANY})
+
+logger = logging.getLogger(__name__)
+
+# A Unix socket path, or a (host, port) pair for TCP
+Address = Union[str, Tuple[str, int]]
+
+class TransportError(ConnectionError):
+    """Raised when the remote MCP server reports an error or the connection drops"""
+
+def default_address() -> Address:
+    """Address from config: MCP_SERVER_SOCKET if set, else MCP_SERVER_HOST/PORT"""
+    if MCP_SERVER_SOCKET:
+        return MCP_SERVER_SOCKET
+    return (MCP_SERVER_HOST, MCP_SERVER_PORT)
+
+def parse_address(text: str) -> Address:
+    """
+    Parse a command-line address
+
+    Args:
+        text: "host:port" for TCP, or a filesystem path for a Unix socket
+
+    Returns:
+        Address
+    """
+    host, sep, port = text.rpartition(":")
+    if sep and port.isdigit() and "/" not in text:
+        return (host or MCP_SERVER_HOST, int(port))
+    return text
+
+def send_frame(sock: socket.socket, op: int, payload: bytes = b"") -> None:
+    """Write one frame"""
+    sock.sendall(HEADER.pack(len(payload), op) + payload)
+
+def recv_frame(sock: socket.socket) -> Optional[Tuple[int, bytes]]:
+    """
+    Read one frame
+
+    Returns:
+        (op, payload), or None if the peer closed the connection
+    """
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    length, op = HEADER.unpack(header)
+    payload = _recv_exact(sock, length) if length else b""
+    if payload is None:
+        raise TransportError("Connection closed mid-frame")
+    return op, payload
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None on a clean close before any byte"""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            if buffer:
+                raise TransportError("Connection closed mid-frame")
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+def _dump(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    """Serves one client connection until it closes"""
+
+    def handle(self):
+        mcp_server: MCPServer = self.server.mcp_server
+        sock = self.request
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            try:
+                frame = recv_frame(sock)
+            except (TransportError, OSError):
+                return
+            if frame is None:
+                return
+
+            op, payload = frame
+            try:
+                reply = self._dispatch(mcp_server, op, payload)
+            except Exception as e:
+                if op in ONE_WAY_OPS:
+                    # No reply is read for these; an ERROR frame would be
+                    # taken as the answer to the client's next request
+                    logger.warning("Dropped a one-way MCP op %d: %s", op, e)
+                else:
+                    send_frame(sock, OP_ERROR, str(e).encode("utf-8"))
+                continue
+            if reply is not None:
+                send_frame(sock, OP_OK, reply)
+
+    def _dispatch(self, mcp_server: MCPServer, op: int, payload: bytes) -> Optional[bytes]:
+        """Apply one request; returns the reply payload, or None for one-way ops"""
+        if op == OP_SEND:
+            mcp_server.send_message(decode(payload))
+            return None
+        if op == OP_SEND_MANY:
+            mcp_server.send_many(decode_many(payload))
+            return None
+
+        args = json.loads(payload)
+        role = AgentRole(args["role"])
+        if op == OP_GET:
+            message = mcp_server.get_message(role, args.get("timeout"))
+            return encode(message) if message else b"null"
+        if op == OP_DRAIN:
+            return encode_many(mcp_server.drain(role, args.get("max_n"), args.get("timeout")))
+        if op == OP_SUBSCRIBE:
+            mcp_server.subscribe(role, args.get("topics"), args.get("maxsize"), args.get("policy"))
+            return b"null"
+        if op == OP_UNSUBSCRIBE:
+            mcp_server.unsubscribe(role, args.get("topics"))
+            return b"null"
+        raise ValueError(f"Unknown op code: {op}")
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+else:
+    _UnixServer = None
+
+class MCPSocketServer:
+    """
+    Exposes an in-process MCPServer over a Unix socket or localhost TCP
+    Each client connection gets its own thread, so a blocking GET on one
+    connection does not hold up sends on another.
+    """
+
+    def __init__(self, server: MCPServer, address: Optional[Address] = None):
+        """
+        Initialize the socket server
+
+        Args:
+            server: MCPServer to expose
+            address: Unix socket path or (host, port); defaults to config.
+                Port 0 picks a free port (see .address after start()).
+        """
+        self.mcp_server = server
+        self.requested_address = address if address is not None else default_address()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Address:
+        """Bound address (with the real port when port 0 was requested)"""
+        if self._server is None:
+            return self.requested_address
+        return self._server.server_address
+
+    def start(self) -> "MCPSocketServer":
+        """Bind and serve in a background thread"""
+        if isinstance(self.requested_address, str):
+            if _UnixServer is None:
+                raise OSError("Unix sockets are not supported on this platform")
+            if os.path.exists(self.requested_address):
+                os.unlink(self.requested_address)
+            self._server = _UnixServer(self.requested_address, _ConnectionHandler)
+        else:
+            self._server = _TCPServer(self.requested_address, _ConnectionHandler)
+
+        self._server.mcp_server = self.mcp_server
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mcp-socket-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted"""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if isinstance(self.requested_address, str) and os.path.exists(self.requested_address):
+            os.unlink(self.requested_address)
+        self._server = None
+
+    def __enter__(self) -> "MCPSocketServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+class RemoteMCPServer:
+    """
+    Client-side stand-in for an MCPServer in another process
+    Implements the methods MCPClient uses, so MCPClient(RemoteMCPServer(addr),
+    role) works unchanged. Each thread keeps one persistent connection,
+    reused for every call it makes.
+    """
+
+    def __init__(self, address: Optional[Address] = None, connect_timeout: float = 5.0):
+        """
+        Initialize the proxy (connections are opened lazily)
+
+        Args:
+            address: Unix socket path or (host, port); defaults to config
+            connect_timeout: Seconds to wait when connecting
+        """
+        self.address = address if address is not None else default_address()
+        self.connect_timeout = connect_timeout
+        self._local = threading.local()
+        self._connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+
+    def send_message(self, message: MCPMessage) -> None:
+        """Send a message (see MCPServer.send_message)"""
+        self._call(OP_SEND, encode(message), expect_reply=False)
+
+    def send_many(self, messages: Iterable[MCPMessage]) -> None:
+        """Send several messages in one frame (see MCPServer.send_many)"""
+        self._call(OP_SEND_MANY, encode_many(messages), expect_reply=False)
+
+    def get_message(self, role: AgentRole, timeout: Optional[float] = None) -> Optional[MCPMessage]:
+        """Get one message for a role (see MCPServer.get_message)"""
+        data = self._call(OP_GET, _dump({"role": role.value, "timeout": timeout}))
+        return None if data == b"null" else decode(data)
+
+    def drain(self, role: AgentRole, max_n: Optional[int] = None, timeout: Optional[float] = None) -> List[MCPMessage]:
+        """Get a batch of messages for a role (see MCPServer.drain)"""
+        data = self._call(OP_DRAIN, _dump({"role": role.value, "max_n": max_n, "timeout": timeout}))
+        return decode_many(data)
+
+    def subscribe(self, role: AgentRole, topics: Optional[Iterable[str]] = None,
+                  maxsize: Optional[int] = None, policy: Optional[str] = None) -> None:
+        """Subscribe a role to broadcast topics (see MCPServer.subscribe)"""
+        self._call(OP_SUBSCRIBE, _dump({
+            "role": role.value,
+            "topics": None if topics is None else list(topics),
+            "maxsize": maxsize,
+            "policy": None if policy is None else str(getattr(policy, "value", policy)),
+        }))
+
+    def unsubscribe(self, role: AgentRole, topics: Optional[Iterable[str]] = None) -> None:
+        """Remove broadcast subscriptions (see MCPServer.unsubscribe)"""
+        self._call(OP_UNSUBSCRIBE, _dump({"role": role.value, "topics": None if topics is None else list(topics)}))
+
+    def close(self) -> None:
+        """Close every connection opened by this proxy"""
+        with self._lock:
+            for sock in self._connections:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+
+    def _connection(self) -> socket.socket:
+        """This thread's connection, opened on first use"""
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            if isinstance(self.address, str):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self.address)
+            sock.settimeout(None)
+            self._local.sock = sock
+            with self._lock:
+                self._connections.append(sock)
+        return sock
+
+    def _call(self, op: int, payload: bytes, expect_reply: bool = True) -> Optional[bytes]:
+        """Send a request frame and, unless one-way, read its reply"""
+        sock = self._connection()
+        try:
+            send_frame(sock, op, payload)
+            if not expect_reply:
+                return None
+            frame = recv_frame(sock)
+        except OSError as e:
+            self._drop_connection(sock)
+            raise TransportError(f"MCP connection failed: {e}") from e
+
+        if frame is None:
+            self._drop_connection(sock)
+            raise TransportError("MCP server closed the connection")
+        reply_op, data = frame
+        if reply_op == OP_ERROR:
+            raise TransportError(data.decode("utf-8"))
+        return data
+
+    def _drop_connection(self, sock: socket.socket) -> None:
+        """Forget a broken connection so the next call reconnects"""
+        self._local.sock = None
+        with self._lock:
+            if sock in self._connections:
+                self._connections.remove(sock)
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+def run_agent_worker(
+    server: Union[MCPServer, RemoteMCPServer],
+    role: AgentRole,
+    handler: Callable[[MCPMessage], Optional[MCPMessage]],
+    stop_event: Optional[threading.Event] = None,
+    batch: int = 16,
+) -> None:
+    """
+    Serve one agent role from the current process
+
+    Pulls the role's messages (from a local or remote server) and handles
+    them in order, with the same reply rules as MCPDispatcher.
+
+    Args:
+        server: MCPServer or RemoteMCPServer
+        role: Role to serve
+        handler: Message handler, as passed to MCPServer.register_agent
+        stop_event: Optional event that ends the loop when set
+        batch: Maximum messages fetched per round trip
+    """
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        for message in server.drain(role, max_n=batch, timeout=0.5):
+            call_handler(server, role, handler, message)
@@ -4,11 +4,15 @@
 import gradio as gr
 import os
 from typing import Tuple
+import queue
 import threading
-import time
+from concurrent.futures import Future
 from mcp import MCPServer, MCPClient, AgentRole
-from agents import TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent
-from config.api_config import GRADIO_SERVER_NAME, GRADIO_SERVER_PORT, USAGE_REPORT_FILE
+from agents import TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent, ValidationAgent, build_factory_pipeline
+from utils.pipeline import PipelineEvent, PipelineScheduler, RUNNING, DONE, FAILED
+from config.api_config import (
+    GRADIO_SERVER_NAME, GRADIO_SERVER_PORT, USAGE_REPORT_FILE, VALIDATION_ENABLED, TABLE_STATUS_POLL_SECONDS,
+)
 from utils.helpers import load_from_file, ensure_directory
 import zipfile
 import tempfile
@@ -31,6 +35,12 @@ class VerbConjugatorFactoryUI:
         self.design_agent = DesignAgent(self.tracking_agent)
         self.code_gen_agent = CodeGenAgent(self.tracking_agent)
         self.test_agent = TestAgent(self.tracking_agent)
+        self.validation_agent = ValidationAgent(self.tracking_agent) if VALIDATION_ENABLED else None
+        
+        # Status of the latest background conjugation table build, polled by the UI
+        self.table_status = ""
+        self._table_generation = 0
+        self._table_lock = threading.Lock()
         
         # Ensure output directories exist
         ensure_directory("generated/conjugator")
@@ -59,55 +69,67 @@ class VerbConjugatorFactoryUI:
 <div style="font-size:12px; color:#666; margin-top:6px;">Estimated progress: {p}%</div>
 """
 
-            # Step 1: Parse requirements (0-20%)
-            yield "📝 Parsing requirements...", "", "", "", "", _progress_html(10)
-            spec = self.parser_agent.parse_requirements(requirements)
-
-            # Step 2: Create design (20-40%)
-            yield "🎨 Creating design...", "", "", "", "", _progress_html(30)
-            design = self.design_agent.create_design(spec)
-
-            # Step 3: Generate code (40-70%) - run generation in background and show incremental progress
-            yield "💻 Generating code...", "", "", "", "", _progress_html(50)
-
-            gen_result = {"code": None, "error": None}
+            # Run the stage graph in the background; stages start as soon as
+            # their inputs are ready and report progress through events.
+            # Streamed code/test chunks arrive on the same queue.
+            updates = queue.Queue()
+            pipeline = build_factory_pipeline(
+                self.parser_agent, self.design_agent, self.code_gen_agent, self.test_agent,
+                on_chunk=lambda filename, chunk: updates.put((filename, chunk)),
+                validation_agent=self.validation_agent,
+            )
+            run_result = {"values": None, "error": None}
 
-            def _run_gen():
+            def _run_pipeline():
                 try:
-                    gen_result["code"] = self.code_gen_agent.generate_code(spec, design)
+                    run_result["values"] = pipeline.run(
+                        {"requirements": requirements}, on_event=updates.put
+                    )
                 except Exception as e:
-                    gen_result["error"] = e
-
-            gen_thread = threading.Thread(target=_run_gen, daemon=True)
-            gen_thread.start()
-
-            # While thread is running, increment the visual bar monotonically but keep the
-            # displayed percentage label at 50 to avoid a bouncing number.
-            visual_width = 50
-            max_visual = 69
-            while gen_thread.is_alive():
-                # slowly increase the visual bar width up to max_visual
-                if visual_width < max_visual:
-                    visual_width = min(max_visual, visual_width + 1)
-                # show the bar loading, but display the percent as 50 until finalization
-                yield f"💻 Generating code... (working)", "", "", "", "", _progress_html(visual_width).replace(f'Estimated progress: {visual_width}%', 'Estimated progress: 50%')
-                time.sleep(0.4)
-
-            # Thread finished
-            if gen_result["error"]:
-                raise gen_result["error"]
-
-            generated_code = gen_result["code"]
-
-            # Finalize code stage (bump displayed percent)
-            yield "💻 Finalizing code...", "", "", "", "", _progress_html(70)
-
-            # Step 4: Generate tests (70-85%)
-            yield "🧪 Generating tests...", "", "", "", "", _progress_html(75)
-            test_code = self.test_agent.generate_tests(spec, generated_code)
+                    run_result["error"] = e
+                finally:
+                    updates.put(None)
+
+            pipeline_thread = threading.Thread(target=_run_pipeline, daemon=True)
+            pipeline_thread.start()
+
+            status = "🚀 Starting pipeline..."
+            progress = 0
+            partial = {"verb_conjugator.py": "", "gradio_ui.py": "", "test_conjugator.py": ""}
+            yield status, "", "", "", "", _progress_html(progress)
+
+            finished = False
+            while not finished:
+                # Coalesce everything already queued into a single UI update
+                batch = [updates.get()]
+                while True:
+                    try:
+                        batch.append(updates.get_nowait())
+                    except queue.Empty:
+                        break
+
+                for item in batch:
+                    if item is None:
+                        finished = True
+                    elif isinstance(item, PipelineEvent):
+                        status = self._stage_status(pipeline, item)
+                        # Stages account for 0-85% of the bar
+                        progress = int(item.progress * 85)
+                    else:
+                        filename, chunk = item
+                        partial[filename] += chunk
+
+                partial_code = self._combine_code(partial["verb_conjugator.py"], partial["gradio_ui.py"])
+                yield status, partial_code, partial["test_conjugator.py"], "", "", _progress_html(progress)
+
+            if run_result["error"]:
+                raise run_result["error"]
+
+            spec = run_result["values"]["spec"]
+            test_code = run_result["values"]["test_code"]
 
             # Step 5: Save usage report (85-95%)
-            yield "📊 Saving usage report...", "", "", "", "", _progress_html(90)
+            yield "📊 Saving usage report...", partial_code, partial["test_conjugator.py"], "", "", _progress_html(90)
             self.tracking_agent.save_usage_report()
 
             # Load generated files
@@ -115,7 +137,7 @@ class VerbConjugatorFactoryUI:
             ui_code = load_from_file("generated/conjugator/gradio_ui.py")
 
             # Combine code for display
-            full_code = f"# verb_conjugator.py\n{conjugator_code}\n\n# gradio_ui.py\n{ui_code}"
+            full_code = self._combine_code(conjugator_code, ui_code)
 
             # Load usage report
             usage_report = load_from_file(USAGE_REPORT_FILE)
@@ -124,13 +146,82 @@ class VerbConjugatorFactoryUI:
             instructions = self._create_instructions(spec)
 
             # Done (100%)
-            yield "\n\n✅ Generation complete!", full_code, test_code, usage_report, instructions, _progress_html(100)
+            done_status = "\n\n✅ Generation complete!"
+            validation = run_result["values"].get("validation")
+            if validation:
+                done_status += "\n" + self._validation_status(validation)
+
+            # The app is usable now; the conjugation table finishes in the
+            # background and its result is shown by the table status poll
+            self._watch_table_build(run_result["values"]["conjugation_table"])
+            yield done_status, full_code, test_code, usage_report, instructions, _progress_html(100)
 
         except Exception as e:
             error_msg = f"❌ Error: {str(e)}"
             # When an error occurs, yield the error message and set progress to 0
             yield error_msg, "", "", "", "", _progress_html(0)
     
+    def _combine_code(self, conjugator_code: str, ui_code: str) -> str:
+        """Combine the generated modules for display"""
+        return f"# verb_conjugator.py\n{conjugator_code}\n\n# gradio_ui.py\n{ui_code}"
+
+    def _watch_table_build(self, table_build: Future) -> None:
+        """Show a table build's result in table_status once it finishes"""
+        with self._table_lock:
+            self._table_generation += 1
+            generation = self._table_generation
+            self.table_status = "🗄️ Conjugation table: building in the background..."
+
+        def on_done(future: Future) -> None:
+            try:
+                status = self._table_status(future.result())
+            except Exception as e:
+                status = f"⚠️ Conjugation table build failed: {e} (the app uses mlconjug3 directly)"
+            with self._table_lock:
+                # A newer generation's build owns the status line
+                if generation == self._table_generation:
+                    self.table_status = status
+
+        table_build.add_done_callback(on_done)
+
+    def get_table_status(self) -> str:
+        """Latest conjugation table status (polled by the interface)"""
+        return self.table_status
+
+    def _table_status(self, table: dict) -> str:
+        """Summarize the conjugation table build for the status box"""
+        if table["status"] == "built":
+            rows = sum(table["rows"].values())
+            return f"🗄️ Conjugation table: {rows} rows for {len(table['rows'])} language(s) in {table['seconds']:.1f}s"
+        if table["status"] == "failed":
+            return f"⚠️ Conjugation table build failed: {table['error']} (the app uses mlconjug3 directly)"
+        reason = f" ({table['error']})" if table["error"] else ""
+        return f"🗄️ Conjugation table: skipped{reason}"
+
+    def _validation_status(self, validation: dict) -> str:
+        """Summarize the generated test run for the status box"""
+        if validation["status"] == "error":
+            return f"⚠️ Generated tests could not run: {validation['error']}"
+        icon = "✅" if validation["status"] == "passed" else "❌"
+        lines = [
+            f"{icon} Generated tests: {validation['passed']}/{validation['total']} passed "
+            f"({validation['passRate']:.0%}) in {validation['wallSeconds']:.1f}s "
+            f"on {validation['workers']} worker(s), slowest test {validation['testSeconds']['max']:.1f}s"
+        ]
+        for test in validation["tests"]:
+            if test["outcome"] != "passed":
+                lines.append(f"   • {test['name']}: {test['outcome']} ({test['seconds']:.1f}s)")
+        return "\n".join(lines)
+
+    def _stage_status(self, pipeline: PipelineScheduler, event: PipelineEvent) -> str:
+        """Render one status line per pipeline stage"""
+        icons = {RUNNING: "⏳", DONE: "✅", FAILED: "❌"}
+        lines = []
+        for stage in pipeline.stages:
+            state = event.states[stage.name]
+            lines.append(f"{icons.get(state, '⬜')} {stage.label}")
+        return "\n".join(lines)
+
     def _create_instructions(self, spec) -> str:
         """Create instructions for running the generated application"""
         return f"""
@@ -147,6 +238,10 @@ cd generated/conjugator
 python gradio_ui.py
 ```
 
+Common verbs are served from the prebuilt `conjugations.sqlite3` next to
+`verb_conjugator.py` (mlconjug3 is only loaded for other verbs). Rebuild it with
+`python verb_conjugator.py --build-table`.
+
 ## 3. Run the Tests
 ```bash
 cd generated/tests
@@ -227,6 +322,7 @@ If not, <a id="dl" href="data:application/zip;base64,{b64}" download="{filename}
 
                 with gr.Column():
                     status_output = gr.Textbox(label="Generation Status", lines=10)
+                    table_status_output = gr.Textbox(label="Conjugation Table", lines=1, interactive=False)
                     # Simple HTML/CSS progress bar for a visual indicator (sleek green bar)
                     progress_html = gr.HTML(value="""
 <div style="margin-top:8px; width:100%; background:#f0f0f0; border-radius:6px; overflow:hidden; height:10px;">
@@ -254,6 +350,10 @@ If not, <a id="dl" href="data:application/zip;base64,{b64}" download="{filename}
                 outputs=[status_output, code_output, test_output, usage_output, instructions_output, progress_html]
             )
 
+            # The table is built after generation finishes; poll its status
+            # instead of holding the generate event open until it is done
+            gr.Timer(TABLE_STATUS_POLL_SECONDS).tick(fn=self.get_table_status, outputs=[table_status_output])
+
             
             # Add examples
             gr.Examples(
@@ -0,0 +1,41 @@
+import threading
+import time
+import pytest
+from agents import CodeGenAgent, FakeBackend
+from ui.gradio_app import VerbConjugatorFactoryUI
+from utils.rate_limiter import RateLimiter
+
+# Background conjugation table status
+@pytest.fixture
+def table_release(monkeypatch):
+    """Hold conjugation table builds until set, or until the test ends"""
+    release = threading.Event()
+
+    def build(self, generated_code):
+        release.wait()
+        return {"status": "built", "path": "", "rows": {"en": 3}, "seconds": 0.5, "error": None}
+
+    monkeypatch.setattr(CodeGenAgent, "build_conjugation_table", build)
+    try:
+        yield release
+    finally:
+        release.set()
+
+def test_generation_finishes_before_the_table_build(tmp_path, monkeypatch, table_release):
+    monkeypatch.chdir(tmp_path)
+    ui = VerbConjugatorFactoryUI()
+    ui.tracking_agent.backend = FakeBackend()
+    ui.tracking_agent.rate_limiter = RateLimiter(None, None)
+    ui.validation_agent = None
+
+    status = list(ui.generate_application("English present"))[-1][0]
+    assert "Generation complete" in status
+    assert ui.get_table_status() == "🗄️ Conjugation table: building in the background..."
+
+    table_release.set()
+    for _ in range(100):
+        if "rows" in ui.get_table_status():
+            break
+        time.sleep(0.05)
+    assert ui.get_table_status() == "🗄️ Conjugation table: 3 rows for 1 language(s) in 0.5s"
+    assert ui.create_interface() is not None
@@ -3,7 +3,7 @@
 
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 def ensure_directory(path: str) -> None:
     """
@@ -86,3 +86,41 @@ def clean_code_block(text: str) -> str:
     if text.endswith("```"):
         text = text.rsplit("```", 1)[0]
     return text.strip()
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Percentile of a list of numbers using linear interpolation.
+    
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        Interpolated percentile, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    """
+    Summarize a latency sample.
+    
+    Args:
+        values: Latencies in seconds
+        
+    Returns:
+        Dictionary with count, mean, p50, p95, p99 and max
+    """
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else 0.0,
+    }
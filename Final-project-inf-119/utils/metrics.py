@@ -0,0 +1,110 @@
+# Latency and throughput metrics for model calls
+# Author: [Your Name] - [Student ID]
+
+from collections import deque
+from typing import Any, Dict, Optional, Sequence
+from utils.helpers import percentile
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+class Histogram:
+    """
+    Fixed-bucket histogram with a bounded sample window for percentiles
+    Bucket counts cover every observation; percentiles are computed from
+    the most recent max_samples observations.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS, max_samples: int = 1000):
+        """
+        Initialize the histogram
+
+        Args:
+            buckets: Ascending bucket upper bounds
+            max_samples: Size of the percentile sample window
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, value: float) -> None:
+        """Add an observation"""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def summary(self, include_buckets: bool = True) -> Dict[str, Any]:
+        """
+        Summarize the histogram
+
+        Args:
+            include_buckets: Whether to include per-bucket counts
+
+        Returns:
+            Dictionary with count, mean, p50, p95, p99 and optional buckets
+        """
+        samples = list(self.samples)
+        result = {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50": round(percentile(samples, 50), 4),
+            "p95": round(percentile(samples, 95), 4),
+            "p99": round(percentile(samples, 99), 4),
+        }
+        if include_buckets:
+            labels = [f"<={bound}s" for bound in self.buckets] + [f">{self.buckets[-1]}s"]
+            result["histogram"] = dict(zip(labels, self.counts))
+        return result
+
+class CallMetrics:
+    """Aggregated per-call metrics for one model or one calling agent"""
+
+    def __init__(self):
+        """Initialize empty metrics"""
+        self.calls = 0
+        self.failures = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self.latency = Histogram()
+        self.tokens_per_second = Histogram(buckets=(10, 25, 50, 100, 200, 400, 800))
+
+    def record(self, latency: float, prompt_tokens: int, output_tokens: int,
+               success: bool, tokens_per_second: Optional[float] = None) -> None:
+        """
+        Add one model call
+
+        Args:
+            latency: Wall-clock seconds of the call
+            prompt_tokens: Prompt tokens consumed
+            output_tokens: Output tokens produced
+            success: Whether the call succeeded
+            tokens_per_second: Output throughput of the call, if known
+        """
+        self.calls += 1
+        if not success:
+            self.failures += 1
+        self.prompt_tokens += prompt_tokens
+        self.output_tokens += output_tokens
+        self.latency.record(latency)
+        if tokens_per_second is not None:
+            self.tokens_per_second.record(tokens_per_second)
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize in the usage report format"""
+        return {
+            "numApiCalls": self.calls,
+            "failedCalls": self.failures,
+            "promptTokens": self.prompt_tokens,
+            "outputTokens": self.output_tokens,
+            "totalTokens": self.prompt_tokens + self.output_tokens,
+            "latencySeconds": self.latency.summary(),
+            "tokensPerSecond": self.tokens_per_second.summary(include_buckets=False),
+        }
@@ -0,0 +1,206 @@
+# Dependency-aware pipeline scheduler
+# Author: [Your Name] - [Student ID]
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional
+
+# Stage states reported in PipelineEvent.states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+class PipelineStage:
+    """
+    One unit of work in a pipeline
+    The stage function is called with its declared inputs as positional
+    arguments. A stage with one output returns the value directly; a stage
+    with several outputs returns a tuple in declaration order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: List[str],
+        outputs: List[str],
+        label: Optional[str] = None,
+        weight: float = 1.0,
+    ):
+        """
+        Initialize a pipeline stage
+
+        Args:
+            name: Unique stage name
+            func: Callable doing the work
+            inputs: Names of the values the stage consumes
+            outputs: Names of the values the stage produces
+            label: Human readable description for progress reporting
+            weight: Relative share of total progress this stage represents
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.label = label or name
+        self.weight = weight
+
+class PipelineEvent:
+    """Progress notification emitted while a pipeline runs"""
+
+    def __init__(self, kind: str, stage: PipelineStage, progress: float,
+                 states: Dict[str, str], elapsed: float = 0.0,
+                 error: Optional[BaseException] = None):
+        """
+        Initialize a pipeline event
+
+        Args:
+            kind: "started", "completed" or "failed"
+            stage: Stage the event refers to
+            progress: Weighted fraction of the pipeline completed (0-1)
+            states: Snapshot of every stage's state
+            elapsed: Stage wall-clock seconds (completed/failed only)
+            error: Exception raised by the stage (failed only)
+        """
+        self.kind = kind
+        self.stage = stage
+        self.progress = progress
+        self.states = states
+        self.elapsed = elapsed
+        self.error = error
+
+class PipelineScheduler:
+    """
+    Runs pipeline stages as soon as their inputs are available
+    Independent stages execute concurrently on a thread pool.
+    """
+
+    def __init__(self, stages: List[PipelineStage], max_workers: Optional[int] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            stages: Stages making up the pipeline
+            max_workers: Thread pool size (defaults to one per stage)
+        """
+        self.stages = list(stages)
+        self.max_workers = max_workers or max(1, len(self.stages))
+        self._validate()
+
+    def _validate(self) -> None:
+        """Check for duplicate names/outputs and dependency cycles"""
+        names = set()
+        producers: Dict[str, str] = {}
+        for stage in self.stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"Output '{output}' produced by both '{producers[output]}' and '{stage.name}'"
+                    )
+                producers[output] = stage.name
+
+        # Kahn's algorithm over stage -> stage edges
+        indegree = {stage.name: 0 for stage in self.stages}
+        dependents: Dict[str, List[str]] = {stage.name: [] for stage in self.stages}
+        for stage in self.stages:
+            for upstream in {producers[i] for i in stage.inputs if i in producers}:
+                indegree[stage.name] += 1
+                dependents[upstream].append(stage.name)
+
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        if visited != len(self.stages):
+            raise ValueError("Pipeline stages contain a dependency cycle")
+
+    def run(self, initial: Dict[str, Any],
+            on_event: Optional[Callable[[PipelineEvent], None]] = None) -> Dict[str, Any]:
+        """
+        Execute the pipeline
+
+        Args:
+            initial: Values available before any stage runs
+            on_event: Callback receiving PipelineEvent objects
+
+        Returns:
+            Dictionary of the initial values plus every stage output
+
+        Raises:
+            ValueError: If a stage input can never become available
+            Exception: The first exception raised by a stage
+        """
+        values = dict(initial)
+        states = {stage.name: PENDING for stage in self.stages}
+        total_weight = sum(stage.weight for stage in self.stages) or 1.0
+        done_weight = 0.0
+        lock = threading.Lock()
+
+        available = set(values)
+        for stage in self.stages:
+            available.update(stage.outputs)
+        for stage in self.stages:
+            missing = [i for i in stage.inputs if i not in available]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' has unsatisfiable inputs: {missing}")
+
+        def emit(kind: str, stage: PipelineStage, elapsed: float = 0.0,
+                 error: Optional[BaseException] = None) -> None:
+            if on_event:
+                on_event(PipelineEvent(kind, stage, done_weight / total_weight,
+                                       dict(states), elapsed, error))
+
+        def execute(stage: PipelineStage):
+            with lock:
+                args = [values[i] for i in stage.inputs]
+            started = time.perf_counter()
+            result = stage.func(*args)
+            return result, time.perf_counter() - started
+
+        pending = list(self.stages)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                # Launch every stage whose inputs are all available
+                for stage in list(pending):
+                    if all(i in values for i in stage.inputs):
+                        pending.remove(stage)
+                        states[stage.name] = RUNNING
+                        emit("started", stage)
+                        running[pool.submit(execute, stage)] = stage
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        result, elapsed = future.result()
+                    except Exception as e:
+                        states[stage.name] = FAILED
+                        emit("failed", stage, error=e)
+                        for other in running:
+                            other.cancel()
+                        raise
+
+                    if len(stage.outputs) == 1:
+                        outputs = (result,)
+                    else:
+                        outputs = tuple(result) if stage.outputs else ()
+                    with lock:
+                        values.update(zip(stage.outputs, outputs))
+                    states[stage.name] = DONE
+                    done_weight += stage.weight
+                    emit("completed", stage, elapsed)
+
+        return values
@@ -0,0 +1,180 @@
+# Client-side rate limiting and retry helpers for model calls
+# Author: [Your Name] - [Student ID]
+
+import random
+import threading
+import time
+from typing import Optional
+
+from config.api_config import (
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    LLM_RETRY_BASE_DELAY,
+    LLM_RETRY_MAX_DELAY,
+)
+
+# Exception class names (google.api_core and friends) worth retrying
+RETRYABLE_ERROR_NAMES = {
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "Aborted",
+}
+
+# HTTP status codes worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """
+    Token bucket allowing bursts up to capacity and refilling at a fixed rate
+    Callers reserve capacity up front; a reservation that overdraws the
+    bucket is told how long to wait, so concurrent callers queue fairly
+    without holding the lock while sleeping.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize the bucket (starts full)
+
+        Args:
+            capacity: Maximum burst size
+            refill_per_second: Refill rate
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take amount from the bucket
+
+        Args:
+            amount: Units to consume
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(
+                self.capacity,
+                self._level + (now - self._updated) * self.refill_per_second,
+            )
+            self._updated = now
+            self._level -= amount
+            if self._level >= 0:
+                return 0.0
+            return -self._level / self.refill_per_second
+
+    def refund(self, amount: float) -> None:
+        """
+        Return (or, if negative, additionally charge) units
+
+        Args:
+            amount: Units to give back to the bucket
+        """
+        with self._lock:
+            self._level = min(self.capacity, self._level + amount)
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter for model calls
+    A limit of None (or 0) disables that dimension.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: Optional[float] = LLM_TOKENS_PER_MINUTE):
+        """
+        Initialize the rate limiter
+
+        Args:
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota
+        """
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0) if tokens_per_minute else None
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until a request of the given size fits in the quota
+
+        Args:
+            estimated_tokens: Expected token cost of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens and estimated_tokens:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record_tokens(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Reconcile a reservation with the tokens actually used
+
+        Args:
+            estimated_tokens: Tokens reserved in acquire
+            actual_tokens: Tokens reported by the model
+        """
+        if self.tokens:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+# Process-wide limiter shared by all agents
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    Get the limiter shared by every TrackingAgent in this process
+
+    Returns:
+        RateLimiter configured from config.api_config
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Decide whether a failed model call is worth retrying
+
+    Args:
+        error: Exception raised by the model client
+
+    Returns:
+        True for quota, overload and transient network errors
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    code = getattr(error, "code", None)
+    if isinstance(code, int) and code in RETRYABLE_STATUS_CODES:
+        return True
+    return "429" in str(error) or "quota" in str(error).lower()
+
+def backoff_delay(attempt: int, base: float = LLM_RETRY_BASE_DELAY,
+                  cap: float = LLM_RETRY_MAX_DELAY) -> float:
+    """
+    Exponential backoff with full jitter
+
+    Args:
+        attempt: Zero-based retry number
+        base: Delay scale for the first retry
+        cap: Maximum delay
+
+    Returns:
+        Seconds to sleep before the next attempt
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,234 @@
+# Content-addressed cache for LLM responses
+# Author: [Your Name] - [Student ID]
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config.api_config import (
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_MAX_MEMORY_ENTRIES,
+    RESPONSE_CACHE_MAX_DISK_BYTES,
+    RESPONSE_CACHE_MAX_AGE_SECONDS,
+)
+from utils.helpers import ensure_directory
+
+class ResponseCache:
+    """
+    Two-tier cache for model responses
+    An in-memory LRU sits in front of an on-disk store of JSON entries.
+    The disk tier is evicted by age and by total size (oldest first).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = RESPONSE_CACHE_DIR,
+        max_memory_entries: int = RESPONSE_CACHE_MAX_MEMORY_ENTRIES,
+        max_disk_bytes: int = RESPONSE_CACHE_MAX_DISK_BYTES,
+        max_age_seconds: float = RESPONSE_CACHE_MAX_AGE_SECONDS,
+    ):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for the on-disk tier (None disables it)
+            max_memory_entries: Capacity of the in-memory LRU tier
+            max_disk_bytes: Size budget for the on-disk tier
+            max_age_seconds: Entries older than this are treated as misses
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Running size of the disk tier, computed lazily on first write
+        self._disk_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, generation_kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a content-addressed key for a model call
+
+        Args:
+            model_name: Name of the model
+            prompt: Prompt text
+            generation_kwargs: Extra generation arguments
+
+        Returns:
+            Hex SHA-256 digest identifying the call
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "prompt": prompt,
+                "kwargs": generation_kwargs or {},
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Entry dict or None on a miss
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(entry):
+                    self._memory.move_to_end(key)
+                    return entry
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is None:
+            return None
+
+        with self._lock:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, text: str, tokens: int, latency: float) -> None:
+        """
+        Store a model response
+
+        Args:
+            key: Cache key from make_key
+            text: Response text
+            tokens: Tokens the original call consumed
+            latency: Wall-clock seconds the original call took
+        """
+        entry = {
+            "text": text,
+            "tokens": tokens,
+            "latency": latency,
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir and os.path.isdir(self.cache_dir):
+                for path, _, _ in self._disk_entries():
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._disk_bytes = 0
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check an entry against the age limit"""
+        if not self.max_age_seconds:
+            return True
+        return time.time() - entry.get("created_at", 0) <= self.max_age_seconds
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the LRU tier (caller holds the lock)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path_for(self, key: str) -> str:
+        """Disk location of an entry, sharded by key prefix"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load an entry from disk, dropping it if stale or corrupt"""
+        if not self.cache_dir:
+            return None
+
+        path = self._path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self._is_fresh(entry):
+            self._remove_disk(path)
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        """Atomically write an entry and enforce the size budget"""
+        if not self.cache_dir:
+            return
+
+        path = self._path_for(key)
+        directory = os.path.dirname(path)
+        ensure_directory(directory)
+        data = json.dumps(entry).encode("utf-8")
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+        except OSError:
+            self._remove_disk(tmp_path)
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self._disk_bytes += len(data) - previous
+
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _disk_entries(self):
+        """Yield (path, size, mtime) for every entry on disk"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _evict_disk(self) -> None:
+        """Drop expired entries, then oldest entries until under budget (caller holds the lock)"""
+        now = time.time()
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, mtime in entries:
+            expired = self.max_age_seconds and now - mtime > self.max_age_seconds
+            if not expired and total <= self.max_disk_bytes:
+                break
+            self._remove_disk(path)
+            total -= size
+
+        self._disk_bytes = total
+
+    @staticmethod
+    def _remove_disk(path: str) -> None:
+        """Delete a file, ignoring races with other processes"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass